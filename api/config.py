@@ -1,6 +1,7 @@
 """Config for initializing the namex-api."""
 
 import os
+import tempfile
 import textwrap
 
 from dotenv import find_dotenv, load_dotenv
@@ -31,14 +32,28 @@ class Config(object):
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
     SOLR_BASE_URL = os.getenv('SOLR_BASE_URL', None)
+    SOLR_QUERY_TIMEOUT = int(os.getenv('SOLR_QUERY_TIMEOUT', '10'))
+    SOLR_QUERY_POOL_SIZE = int(os.getenv('SOLR_QUERY_POOL_SIZE', '16'))
+
+    # Flask-Caching, shared by the workers of a node through the filesystem
+    CACHE_TYPE = os.getenv('CACHE_TYPE', 'namex.services.cache.FileSystemCache')
+    CACHE_DIR = os.getenv('CACHE_DIR', os.path.join(tempfile.gettempdir(), 'namex-api-cache'))
+    CACHE_KEY_PREFIX = os.getenv('CACHE_KEY_PREFIX', 'namex-api:')
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', '300'))
 
     SOLR_SYNONYMS_API_URL = f'{os.getenv("SOLR_SYNONYMS_API_URL", None)}{os.getenv("SOLR_SYNONYMS_API_VERSION", None)}'
+    SYNONYMS_CACHE_TTL = int(os.getenv('SYNONYMS_CACHE_TTL', '300'))
+    WORD_LISTS_TTL = int(os.getenv('WORD_LISTS_TTL', '300'))
+    WORD_CLASSIFICATION_CACHE_TTL = int(os.getenv('WORD_CLASSIFICATION_CACHE_TTL', '60'))
 
     AUTO_ANALYZE_URL = os.getenv('AUTO_ANALYZE_URL', None)
     AUTO_ANALYZE_CONFIG = os.getenv('AUTO_ANALYZE_CONFIG', None)
 
     REPORT_SVC_URL = f'{os.getenv("REPORT_API_URL", None)}{os.getenv("REPORT_API_VERSION", None)}/reports'
     REPORT_TEMPLATE_PATH = os.getenv('REPORT_PATH', 'report-templates')
+    # Reload the templates when a file changes, only meant for working on templates locally
+    TEMPLATE_AUTO_RELOAD = os.getenv('TEMPLATE_AUTO_RELOAD', 'False').lower() == 'true'
+    TEMPLATE_RELOAD_INTERVAL = int(os.getenv('TEMPLATE_RELOAD_INTERVAL', '2'))
 
     PAYMENT_SVC_URL = os.getenv('PAY_API_URL', None)
     PAYMENT_SVC_VERSION = os.getenv('PAY_API_VERSION', None)
@@ -95,6 +110,12 @@ permits-licences/businesses-incorporated-companies/approval-business-name',
     PAYMENT_SVC_CLIENT_SECRET = os.getenv('NAME_REQUEST_SERVICE_ACCOUNT_CLIENT_SECRET', '')
 
     DISABLE_NAMEREQUEST_SOLR_UPDATES = int(os.getenv('DISABLE_NAMEREQUEST_SOLR_UPDATES', 0))
+    # Queue the name request solr updates and write them from a background thread (see SolrIndexer)
+    SOLR_INDEX_ASYNC = os.getenv('SOLR_INDEX_ASYNC', 'True').lower() == 'true'
+    SOLR_INDEX_QUEUE_SIZE = int(os.getenv('SOLR_INDEX_QUEUE_SIZE', '1000'))
+    SOLR_INDEX_FLUSH_INTERVAL = float(os.getenv('SOLR_INDEX_FLUSH_INTERVAL', '1'))
+    SOLR_INDEX_COMMIT_WITHIN = int(os.getenv('SOLR_INDEX_COMMIT_WITHIN', '1000'))
+    SOLR_INDEX_MAX_RETRIES = int(os.getenv('SOLR_INDEX_MAX_RETRIES', '5'))
 
     GCP_AUTH_KEY = os.getenv('BUSINESS_GCP_AUTH_KEY', None)
     NAMEX_NR_STATE_TOPIC = os.getenv('NAMEX_NR_STATE_TOPIC', '')
@@ -142,6 +163,9 @@ class TestConfig(Config):
 
     DISABLE_NAMEREQUEST_SOLR_UPDATES = int(os.getenv('DISABLE_NAMEREQUEST_SOLR_UPDATES', 0))
 
+    # keep each test run's cache to itself
+    CACHE_TYPE = 'SimpleCache'
+
     # JWT OIDC settings
     # JWT_OIDC_TEST_MODE will set jwt_manager to use
     JWT_OIDC_TEST_MODE = True
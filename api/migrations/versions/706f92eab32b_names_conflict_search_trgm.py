@@ -0,0 +1,31 @@
+"""names conflict search trigram index
+
+Revision ID: 706f92eab32b
+Revises: 179a7b0089ce
+Create Date: 2026-10-18 09:12:40.118203
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '706f92eab32b'
+down_revision = '179a7b0089ce'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Must stay in step with Name.conflict_search_column, the planner only uses the index for the same expression.
+    # Built concurrently so names stays writable while the index is created on a populated table.
+    with op.get_context().autocommit_block():
+        op.execute('CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_names_conflict_search_trgm ON public.names'
+                   " USING gin (regexp_replace(regexp_replace(lower(name), '[^a-z0-9]+', '', 'g'),"
+                   " '(.)\\1+', '\\1', 'g') gin_trgm_ops)")
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_names_conflict_search_trgm')
@@ -0,0 +1,43 @@
+"""virtual word condition version
+
+Revision ID: d4880ce88c59
+Revises: e7047b5f6ef7
+Create Date: 2026-10-18 18:05:12.640371
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4880ce88c59'
+down_revision = 'e7047b5f6ef7'
+branch_labels = None
+depends_on = None
+
+# The auto analyse keeps the word conditions in memory and rebuilds them when this version moves. The admin app
+# changes the table too, so the version is bumped by the database itself, in the same transaction as the change.
+
+
+def upgrade():
+    op.execute('CREATE TABLE public.virtual_word_condition_version (version bigint NOT NULL)')
+    op.execute('INSERT INTO public.virtual_word_condition_version (version) VALUES (0)')
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION public.bump_virtual_word_condition_version() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          UPDATE public.virtual_word_condition_version SET version = version + 1;
+          RETURN NULL;
+        END; $$;
+        """
+    )
+    op.execute('CREATE TRIGGER virtual_word_condition_version'
+               ' AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.virtual_word_condition'
+               ' FOR EACH STATEMENT EXECUTE PROCEDURE public.bump_virtual_word_condition_version()')
+
+
+def downgrade():
+    op.execute('DROP TRIGGER IF EXISTS virtual_word_condition_version ON public.virtual_word_condition')
+    op.execute('DROP FUNCTION IF EXISTS public.bump_virtual_word_condition_version()')
+    op.execute('DROP TABLE IF EXISTS public.virtual_word_condition_version')
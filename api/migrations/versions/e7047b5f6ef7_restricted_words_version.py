@@ -0,0 +1,47 @@
+"""restricted words version
+
+Revision ID: e7047b5f6ef7
+Revises: ef6d9a152788
+Create Date: 2026-10-18 17:20:44.902318
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7047b5f6ef7'
+down_revision = 'ef6d9a152788'
+branch_labels = None
+depends_on = None
+
+# The api keeps the restricted words in memory and reloads them when this version moves. The tables are changed by
+# the admin app and utils/refresh-restricted-words too, so the version is bumped by the database itself, in a one row
+# table rather than a sequence so that a bump is only seen once the change is committed.
+RESTRICTED_WORD_TABLES = ['restricted_word', 'restricted_condition', 'restricted_word_condition']
+
+
+def upgrade():
+    op.execute('CREATE TABLE public.restricted_words_version (version bigint NOT NULL)')
+    op.execute('INSERT INTO public.restricted_words_version (version) VALUES (0)')
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION public.bump_restricted_words_version() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+          UPDATE public.restricted_words_version SET version = version + 1;
+          RETURN NULL;
+        END; $$;
+        """
+    )
+    for table_name in RESTRICTED_WORD_TABLES:
+        op.execute(f'CREATE TRIGGER {table_name}_version'
+                   f' AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.{table_name}'
+                   f' FOR EACH STATEMENT EXECUTE PROCEDURE public.bump_restricted_words_version()')
+
+
+def downgrade():
+    for table_name in RESTRICTED_WORD_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS {table_name}_version ON public.{table_name}')
+    op.execute('DROP FUNCTION IF EXISTS public.bump_restricted_words_version()')
+    op.execute('DROP TABLE IF EXISTS public.restricted_words_version')
@@ -0,0 +1,46 @@
+"""wait time statistics
+
+Revision ID: ef6d9a152788
+Revises: f1cbb9b410d5
+Create Date: 2026-10-18 16:42:10.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ef6d9a152788'
+down_revision = 'f1cbb9b410d5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('decision_latencies',
+    sa.Column('nr_id', sa.Integer(), nullable=False),
+    sa.Column('decision_date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('latency_seconds', sa.Float(), nullable=False),
+    sa.Column('priority', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['nr_id'], ['requests.id'], ),
+    sa.PrimaryKeyConstraint('nr_id')
+    )
+    op.create_index(op.f('ix_decision_latencies_decision_date'), 'decision_latencies', ['decision_date'], unique=False)
+
+    op.create_table('wait_time_statistics',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('priority_wait_time', sa.Integer(), nullable=True),
+    sa.Column('regular_wait_time', sa.Integer(), nullable=True),
+    sa.Column('priority_samples', sa.Integer(), nullable=True),
+    sa.Column('regular_samples', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_wait_time_statistics_computed_at'), 'wait_time_statistics', ['computed_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_wait_time_statistics_computed_at'), table_name='wait_time_statistics')
+    op.drop_table('wait_time_statistics')
+    op.drop_index(op.f('ix_decision_latencies_decision_date'), table_name='decision_latencies')
+    op.drop_table('decision_latencies')
@@ -0,0 +1,39 @@
+"""requests and applicants search trigram indexes
+
+Revision ID: f1cbb9b410d5
+Revises: 706f92eab32b
+Create Date: 2026-10-18 14:05:21.540117
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1cbb9b410d5'
+down_revision = '706f92eab32b'
+branch_labels = None
+depends_on = None
+
+# The examiner and NR searches filter these with LIKE / ILIKE '%...%', which a btree index can't serve.
+TRIGRAM_INDEXES = [
+    ('ix_requests_name_search_trgm', 'requests', 'name_search'),
+    ('ix_requests_nr_num_trgm', 'requests', 'nr_num'),
+    ('ix_applicants_first_name_trgm', 'applicants', 'first_name'),
+    ('ix_applicants_last_name_trgm', 'applicants', 'last_name'),
+]
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Built concurrently so requests and applicants stay writable while the indexes are created.
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column_name in TRIGRAM_INDEXES:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON public.{table_name}'
+                       f' USING gin ({column_name} gin_trgm_ops)')
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for index_name, _, _ in TRIGRAM_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index_name}')
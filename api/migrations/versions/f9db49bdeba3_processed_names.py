@@ -0,0 +1,36 @@
+"""processed names
+
+Revision ID: f9db49bdeba3
+Revises: d4880ce88c59
+Create Date: 2026-10-18 19:02:37.115902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f9db49bdeba3'
+down_revision = 'd4880ce88c59'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('processed_names',
+    sa.Column('name', sa.String(length=1024), nullable=False),
+    sa.Column('rules_version', sa.String(length=40), nullable=False),
+    sa.Column('processed_name', sa.String(length=1024), nullable=True),
+    sa.Column('name_tokens', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.Column('name_original_tokens', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.Column('name_first_part', sa.String(length=1024), nullable=True),
+    sa.Column('last_update', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_index(op.f('ix_processed_names_rules_version'), 'processed_names', ['rules_version'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_processed_names_rules_version'), table_name='processed_names')
+    op.drop_table('processed_names')
@@ -28,7 +28,7 @@ from namex import models
 from namex.models import db, ma
 from namex.resources import api
 from namex.utils.run_version import get_run_version
-from namex.services import flags
+from namex.services import flags, report_templates, solr_indexer
 
 
 run_version = get_run_version()
@@ -58,6 +58,8 @@ def create_app(run_mode=os.getenv('FLASK_ENV', 'production')):  # noqa: B008
 
     cache.init_app(app)
     nr_filing_actions.init_app(app)
+    report_templates.init_app(app)
+    solr_indexer.init_app(app)
 
     @app.after_request
     def add_version(response):
@@ -2,6 +2,101 @@ from flask import current_app
 from sqlalchemy import exc, text
 
 from namex.models import db
+from namex.utils.versioned_cache import VersionedCache
+
+# Bumped by triggers on the restricted word tables, whoever changes them (the admin app, refresh-restricted-words).
+VERSION_SQL = text('SELECT version FROM restricted_words_version')
+WORDS_AND_CONDITIONS_SQL = text(
+    'SELECT w.word_id, w.word_phrase, c.cnd_id, c.cnd_text, c.allow_use, c.consent_required, c.consenting_body,'
+    ' c.instructions'
+    ' FROM restricted_word w'
+    ' LEFT JOIN restricted_word_condition wc ON wc.word_id = w.word_id'
+    ' LEFT JOIN restricted_condition c ON c.cnd_id = wc.cnd_id'
+    ' ORDER BY w.word_id, c.cnd_id'
+)
+
+
+class RestrictedWordMatcher:
+    """Aho-Corasick automaton over the restricted words and phrases.
+
+    Every phrase is matched with a space on both sides, like ' PHRASE ' in ' STRIPPED CONTENT ', so the whole name is
+    checked in one pass over its characters whatever the number of phrases.
+    """
+
+    def __init__(self, words: list, conditions: dict):
+        """words is a list of {'id', 'phrase'} dicts and conditions the list of condition dicts of each word id."""
+        self.words = words
+        self.conditions = conditions
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for index, word in enumerate(words):
+            state = 0
+            for char in ' ' + word['phrase'].strip() + ' ':
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._output[state].append(index)
+
+        # breadth first, so the fail state of every state is built before the states below it
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+                queue.append(next_state)
+
+    def find(self, content: str) -> list:
+        """Return the words found in the stripped content, in word id order."""
+        found = set()
+        state = 0
+        for char in content:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found.update(self._output[state])
+        return [self.words[index] for index in sorted(found)]
+
+
+class RestrictedWordEngine(VersionedCache):
+    """The restricted words of this process, loaded in one query and reloaded whenever the tables change."""
+
+    version_sql = VERSION_SQL
+
+    def get_matcher(self) -> RestrictedWordMatcher:
+        return self.get()
+
+    @staticmethod
+    def load() -> RestrictedWordMatcher:
+        words = []
+        conditions = {}
+        for row in db.session.execute(WORDS_AND_CONDITIONS_SQL):
+            if row[0] not in conditions:
+                conditions[row[0]] = []
+                if row[1] is not None:
+                    words.append({'id': row[0], 'phrase': row[1].upper()})
+            if row[2] is not None:
+                conditions[row[0]].append(
+                    {
+                        'id': row[2],
+                        'text': row[3],
+                        'allow_use': row[4],
+                        'consent_required': row[5],
+                        'consenting_body': row[6],
+                        'instructions': row[7],
+                    }
+                )
+        return RestrictedWordMatcher(words, conditions)
+
+
+restricted_word_engine = RestrictedWordEngine()
 
 
 class RestrictedWords(object):
@@ -21,7 +116,8 @@ class RestrictedWords(object):
         stripped_content = RestrictedWords.strip_content(content)
 
         try:
-            restricted_words_dict = RestrictedWords.find_restricted_words(stripped_content)
+            matcher = restricted_word_engine.get_matcher()
+            restricted_words_dict = [dict(word) for word in matcher.find(stripped_content)]
 
         except exc.SQLAlchemyError as err:
             current_app.logger.debug(err.with_traceback(None))
@@ -29,23 +125,11 @@ class RestrictedWords(object):
         except AttributeError:
             return None, 'Could not find any restricted words.', 404
 
-        # Get condition info based on each word_id and pair each word with its cnd_info in a dict
+        # Pair each word with its cnd_info in a dict, the conditions were loaded with the words
         restricted_words_conditions = []
         for word in restricted_words_dict:
-            try:
-                restricted_words_conditions.append(
-                    {'word_info': word, 'cnd_info': RestrictedWords.find_cnd_info(word['id'])}
-                )
-
-            except exc.SQLAlchemyError as sql_err:
-                current_app.logger.debug(sql_err.with_traceback(None))
-                return None, 'An error occurred accessing the condition for {}.'.format(word['phrase']), 500
-            except AttributeError:
-                return None, 'Could not find any condition info for {}.'.format(word['id']), 404
-            except Exception as err:
-                current_app.logger.debug(err.with_traceback(None))
-                cnd_info = 'Not Available'
-                restricted_words_conditions.append({'word_info': word, 'cnd_info': cnd_info})
+            cnd_info = [dict(cnd) for cnd in matcher.conditions.get(word['id'], [])]
+            restricted_words_conditions.append({'word_info': word, 'cnd_info': cnd_info})
 
         return {'restricted_words_conditions': restricted_words_conditions}, None, None
 
@@ -70,48 +154,11 @@ class RestrictedWords(object):
     @staticmethod
     def find_restricted_words(content):
         """Get words/phrases in 'content' that are restricted
-        - query for list of all restricted words
-            - strip each word/phrase of spaces and check if they are a substring of 'stripped_content'
+        - matches the stripped content against all restricted words/phrases at once
         """
-        restricted_words_obj = db.engine.execute('select * from restricted_word;')
-        restricted_words_dict = []
-        for row in restricted_words_obj:
-            if ' ' + row[1].upper().strip() + ' ' in content:
-                restricted_words_dict.append({'id': row[0], 'phrase': row[1].upper()})
-
-        return restricted_words_dict
+        return [dict(word) for word in restricted_word_engine.get_matcher().find(content)]
 
     @staticmethod
     def find_cnd_info(word_id):
         """Get the condition info corresponding to the given word id"""
-        get_cnd_id_sql = text('SELECT cnd_id FROM restricted_word_condition WHERE word_id = :word_id')
-        cnd_id_obj = db.engine.execute(get_cnd_id_sql, {'word_id': word_id})
-        cnd_ids = cnd_id_obj.fetchall()
-
-        cnd_obj_list = []
-        for id in cnd_ids:
-            cnd_id = id[0]
-            get_cnd_sql = text('select * from restricted_condition where cnd_id = :cnd_id')
-            cnd_obj_list.append(db.engine.execute(get_cnd_sql, {'cnd_id': cnd_id}))
-
-        cnd_info = []
-        for obj in cnd_obj_list:
-            obj_tuple = obj.fetchall()[0]
-            cnd_text = obj_tuple[1]
-            cnd_allow_use = obj_tuple[2]
-            cnd_consent_req = obj_tuple[3]
-            cnd_consent_body = obj_tuple[4]
-            cnd_instr = obj_tuple[5]
-
-            cnd_info.append(
-                {
-                    'id': cnd_id,
-                    'text': cnd_text,
-                    'allow_use': cnd_allow_use,
-                    'consent_required': cnd_consent_req,
-                    'consenting_body': cnd_consent_body,
-                    'instructions': cnd_instr,
-                }
-            )
-
-        return cnd_info
+        return [dict(cnd) for cnd in restricted_word_engine.get_matcher().conditions.get(word_id, [])]
@@ -1,13 +1,14 @@
 import json
 import re
 import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from urllib import parse, request
-from urllib.error import HTTPError
 
+import requests
 from flask import current_app
-from google.auth.transport.requests import Request
-from google.oauth2 import id_token
+from requests.adapters import HTTPAdapter
 
 from namex.analytics.phonetic import (
     designations,
@@ -16,6 +17,7 @@ from namex.analytics.phonetic import (
     has_leading_vowel,
     replace_special_leading_sounds,
 )
+from namex.analytics.synonym_lookup import SynonymLookup
 
 # Use this character in the search strings to indicate that the word should not by synonymized.
 NO_SYNONYMS_INDICATOR = '@'
@@ -33,6 +35,10 @@ NO_SYNONYMS_PREFIX = '&fq=name_copy:'
 # Prefix used to indicate that we have synonyms.
 SYNONYMS_PREFIX = '&fq=name_with_synonyms:'
 
+# Defaults for the concurrent conflict bucket fan-out (overridable via SOLR_QUERY_TIMEOUT / SOLR_QUERY_POOL_SIZE).
+DEFAULT_QUERY_TIMEOUT = 10
+DEFAULT_QUERY_POOL_SIZE = 16
+
 
 class SolrQueries:
     PROX_SYN_CONFLICTS = 'proxsynconflicts'
@@ -46,6 +52,11 @@ class SolrQueries:
     NAME_NR_SEARCH = 'name_nr_search'
     VALID_QUERIES = [CONFLICTS, HISTORY, TRADEMARKS]
 
+    # Pooled keep-alive session and worker threads shared by the conflict bucket fan-out (see fetch_all).
+    _session = None
+    _executor = None
+    _pool_lock = threading.Lock()
+
     #
     # Prototype:
     #     /solr/<core name>/select? ... &q={name} ... &wt=json&start={start}&rows={rows}&fl=source,id,name,score
@@ -369,8 +380,9 @@ class SolrQueries:
     def get_synonym_results(
         cls, solr_base_url, name, prox_search_strs, old_alg_search_strs, name_tokens, exact_phrase, start=0, rows=100
     ):
+        query = None
         try:
-            connections = []
+            searches = []
             if name == '':
                 name = '*'
                 prox_search_strs.append((['*'], '', '', 1))
@@ -402,9 +414,9 @@ class SolrQueries:
                             exact_phrase_clause=exact_phrase_clause,
                         )
                         current_app.logger.debug('Query: ' + query)
-                        connections.append(
+                        searches.append(
                             (
-                                json.load(request.urlopen(query)),
+                                query,
                                 '----'
                                 + prox_search_str.replace('\\', '').replace('*', '').replace('@', '')
                                 + synonyms_clause.replace('&fq=name_with_', ' ').replace('%20', ', ')
@@ -421,16 +433,18 @@ class SolrQueries:
                     name_copy_clause=cls._get_name_copy_clause(name),
                 )
                 current_app.logger.debug('Query: ' + query)
-                connections.append(
+                searches.append(
                     (
-                        json.load(request.urlopen(query)),
+                        query,
                         '----'
                         + old_alg_search_str.replace('\\', '').replace('%20', ' ').replace('**', '*')
                         + synonyms_clause.replace('&fq=name_with_', ' ').replace('%20', ', ')
                         + ' - EXACT WORD ORDER',
                     )
                 )
-            return connections
+
+            results = cls.fetch_all([query for query, _ in searches])
+            return [(result, title) for result, (_, title) in zip(results, searches)]
 
         except Exception as err:
             current_app.logger.error(err, query)
@@ -438,13 +452,14 @@ class SolrQueries:
 
     @classmethod
     def get_cobrs_phonetic_results(cls, solr_base_url, search_strs, name_tokens, start=0, rows=100):
+        query = None
         try:
             if search_strs == []:
                 connections = [
                     ({'response': {'numFound': 0, 'docs': []}, 'responseHeader': {'params': {'q': '*'}}}, '----*')
                 ]
             else:
-                connections = []
+                searches = []
                 for str_tuple in search_strs:
                     synonyms_clause = cls._get_synonyms_clause(str_tuple[1], str_tuple[2], name_tokens)
                     for name in str_tuple[0]:
@@ -459,15 +474,17 @@ class SolrQueries:
                             + '"~{}'.format(str_tuple[3]),
                         )
                         current_app.logger.debug('Query: ' + query)
-                        result = json.load(request.urlopen(query))
-                        connections.append(
+                        searches.append(
                             (
-                                result,
+                                query,
                                 '----'
                                 + start_str.replace('*', '').replace('@', '')
                                 + synonyms_clause.replace('&fq=name_with_', ' ').replace('%20', ', '),
                             )
                         )
+
+                results = cls.fetch_all([query for query, _ in searches])
+                connections = [(result, title) for result, (_, title) in zip(results, searches)]
             return connections
 
         except Exception as err:
@@ -476,13 +493,14 @@ class SolrQueries:
 
     @classmethod
     def get_phonetic_results(cls, solr_base_url, name, search_strs, name_tokens, start=0, rows=100):
+        query = None
         try:
             if search_strs == []:
                 connections = [
                     ({'response': {'numFound': 0, 'docs': []}, 'responseHeader': {'params': {'q': '*'}}}, '----*')
                 ]
             else:
-                connections = []
+                searches = []
                 for str_tuple in search_strs:
                     synonyms_clause = cls._get_synonyms_clause(str_tuple[1], str_tuple[2], name_tokens)
                     start_str = str_tuple[0]
@@ -494,7 +512,11 @@ class SolrQueries:
                         exact_name='name_no_synonyms:"' + start_str.replace(' ', '%20') + '"~{}'.format(str_tuple[3]),
                     )
                     current_app.logger.debug('Query: ' + query)
-                    result = json.load(request.urlopen(query))
+                    searches.append((query, start_str, synonyms_clause))
+
+                results = cls.fetch_all([query for query, _, _ in searches])
+                connections = []
+                for result, (_, start_str, synonyms_clause) in zip(results, searches):
                     docs = result['response']['docs']
                     result['response']['docs'] = cls.post_treatment(docs, start_str)
                     connections.append(
@@ -511,6 +533,52 @@ class SolrQueries:
             current_app.logger.error(err, query)
             return None, 'SOLR query error', 500
 
+    @classmethod
+    def fetch_all(cls, queries):
+        """Run the given solr queries concurrently and return their json results in the same order as the queries.
+
+        All queries share one pooled keep-alive session and each one is bound by SOLR_QUERY_TIMEOUT, so a bucket costs
+        roughly the slowest single query instead of the sum of all of them. The first failure is raised to the caller.
+        """
+        if not queries:
+            return []
+
+        timeout = current_app.config.get('SOLR_QUERY_TIMEOUT', DEFAULT_QUERY_TIMEOUT)
+        pool_size = current_app.config.get('SOLR_QUERY_POOL_SIZE', DEFAULT_QUERY_POOL_SIZE)
+        session = cls._get_session(pool_size)
+
+        def fetch(query):
+            response = session.get(query, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+
+        if len(queries) == 1:
+            return [fetch(queries[0])]
+
+        return list(cls._get_executor(pool_size).map(fetch, queries))
+
+    @classmethod
+    def _get_session(cls, pool_size):
+        """Get the keep-alive session shared by every worker thread, sized so each worker can hold a connection."""
+        if cls._session is None:
+            with cls._pool_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    cls._session = session
+        return cls._session
+
+    @classmethod
+    def _get_executor(cls, pool_size):
+        """Get the thread pool used to fan the conflict bucket queries out."""
+        if cls._executor is None:
+            with cls._pool_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='solr-query')
+        return cls._executor
+
     @classmethod
     def get_name_nr_search_results(cls, solr_query, start=0, rows=10):
         """Search for the query param in `names` core."""
@@ -804,87 +872,18 @@ class SolrQueries:
 
         return multiples
 
-    # Call the synonyms API for the given token.
-
-    @classmethod
-    def _get_identity_token(cls, audience):
-        """Get an identity token for authenticating with solr-synonyms-api."""
-        try:
-            token = id_token.fetch_id_token(Request(), audience)
-
-            if not token or not isinstance(token, str):
-                current_app.logger.warning('Failed to get identity token')
-                return None
-
-            return token
-        except Exception as e:
-            current_app.logger.warning(f'Error in getting identity token: {e.message}')
-            return None
-
-
+    # Check the synonym lists for the given token.
     @classmethod
     def _synonyms_exist(cls, token, col):
-        solr_synonyms_api_url = current_app.config.get('SOLR_SYNONYMS_API_URL', None)
-        if not solr_synonyms_api_url:
-            raise Exception('SOLR: SOLR_SYNONYMS_API_URL is not set')
-
-        # Get identity token and make header
-        id_token = cls._get_identity_token(solr_synonyms_api_url)
+        # If the synonym lists can't be loaded, the caller will catch and then return a 500 for us.
+        return SynonymLookup.exists(token, col)
 
-        # If the web service call fails, the caller will catch and then return a 500 for us.
-        query = solr_synonyms_api_url + '/synonyms/' + col + '/' + parse.quote(token)
-        current_app.logger.debug('Query: ' + query)
-
-        try:
-            if id_token is None:
-                connection = request.urlopen(query)
-            else:
-                connection = request.urlopen(request.Request(
-                    query, headers={'Authorization': f'Bearer {id_token}'}
-                ))
-        except HTTPError as http_error:
-            # Expected when the token does not have synonyms.
-            if http_error.code == 404:
-                return False
-
-            # Not sure what it is, pass it up.
-            raise http_error
-
-        return connection.status == 200
-
-    # Call the synonyms API for list of synonyms matching the given token.
+    # Get the list of synonyms matching the given token.
     @classmethod
     def _get_synonym_list(cls, token):
-        solr_synonyms_api_url = current_app.config.get('SOLR_SYNONYMS_API_URL', None)
-        if not solr_synonyms_api_url:
-            raise Exception('SOLR: SOLR_SYNONYMS_API_URL is not set')
-
-        # Get identity token and make header
-        id_token = cls._get_identity_token(solr_synonyms_api_url)
-
-        # If the web service call fails, the caller will catch and then return a 500 for us.
-        query = solr_synonyms_api_url + '/synonyms/' + 'stems_text' + '/' + parse.quote(token)
-        current_app.logger.debug('Query: ' + query)
-
-        try:
-            if id_token is None:
-                connection = request.urlopen(query)
-            else:
-                connection = request.urlopen(request.Request(
-                    query, headers={'Authorization': f'Bearer {id_token}'}
-                ))
-        except HTTPError as http_error:
-            # Expected when the token does not have synonyms.
-            if http_error.code == 404:
-                return []
-
-            # Not sure what it is, pass it up.
-            raise http_error
-
-        results = json.load(connection)
         synonym_list = []
         # in case a token is part of multiple synonym lists
-        for synonyms in results[1]:
+        for synonyms in SynonymLookup.get_lists(token, 'stems_text'):
             synonym_list += synonyms.split(',')
 
         return synonym_list
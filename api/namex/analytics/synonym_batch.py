@@ -0,0 +1,69 @@
+"""Batched word lookups against solr-synonyms-api.
+
+Classifying a name used to call /synonyms/synonyms once for every token and every compound of tokens. A
+SynonymBatch is prefetched with all of those words and asks /synonyms/batch about them in one POST; the per-word
+checks are then answered from what it got back. If the batch endpoint is not available the lookups fall back to
+the swagger client one word at a time.
+"""
+
+import json
+from typing import Dict, Iterable, List
+from urllib import request
+from urllib.error import HTTPError
+
+from flask import current_app
+
+from .synonym_lookup import get_identity_token
+
+
+class SynonymBatch:
+    """The /synonyms/synonyms results for the words of one name analysis."""
+
+    def __init__(self, syn_svc):
+        self.syn_svc = syn_svc
+        self._synonyms: Dict[str, List[str]] = {}
+        self._batch_available = True
+
+    def prefetch(self, words: Iterable[str]):
+        """Look up every word not looked up yet, in a single request."""
+        words = [word for word in dict.fromkeys(words) if word and word not in self._synonyms]
+        if not words:
+            return
+
+        if self._batch_available:
+            try:
+                self._synonyms.update(self._fetch_batch(words))
+                return
+            except HTTPError as err:
+                # solr-synonyms-api versions without /synonyms/batch, use the per word endpoint from now on
+                current_app.logger.warning(f'Batch synonym lookup failed, looking up words one by one: {err}')
+                self._batch_available = False
+
+        for word in words:
+            self._synonyms[word] = self.syn_svc.get_word_synonyms(word=word).data
+
+    def get_synonyms(self, word: str) -> List[str]:
+        """Return what /synonyms/synonyms returns for the word."""
+        if word not in self._synonyms:
+            self.prefetch([word])
+        return self._synonyms.get(word, [])
+
+    @staticmethod
+    def _fetch_batch(words: List[str]) -> Dict[str, List[str]]:
+        solr_synonyms_api_url = current_app.config.get('SOLR_SYNONYMS_API_URL', None)
+        if not solr_synonyms_api_url:
+            raise Exception('SOLR: SOLR_SYNONYMS_API_URL is not set')
+
+        headers = {'Content-Type': 'application/json'}
+        token = get_identity_token(solr_synonyms_api_url)
+        if token is not None:
+            headers['Authorization'] = f'Bearer {token}'
+
+        query = solr_synonyms_api_url + '/synonyms/batch'
+        current_app.logger.debug(f'Query: {query} ({len(words)} words)')
+
+        data = json.dumps({'words': words}).encode('utf-8')
+        connection = request.urlopen(request.Request(query, data=data, headers=headers, method='POST'))
+
+        results = json.load(connection)
+        return {result['key']: result.get('synonyms') or [] for result in results.get('data', [])}
@@ -0,0 +1,141 @@
+"""In-process copy of the solr-synonyms-api synonym and stem lists.
+
+The conflict searches check dozens of tokens per name against the synonym lists. Rather than asking
+solr-synonyms-api about each token, the lists are pulled in bulk and answered from local dicts until the
+TTL runs out. On reload the version returned by the service is compared so the tables are only rebuilt
+when the synonym list actually changed.
+"""
+
+import json
+import threading
+import time
+from typing import Dict, List
+from urllib import request
+
+from flask import current_app
+from google.auth import jwt
+from google.auth.transport.requests import Request
+from google.oauth2 import id_token
+
+SYNONYM_COLUMNS = ('synonyms_text', 'stems_text')
+
+DEFAULT_CACHE_TTL = 300
+
+# Refresh identity tokens this many seconds before they actually expire.
+TOKEN_EXPIRY_MARGIN = 60
+
+_id_tokens: Dict[str, tuple] = {}
+_id_token_lock = threading.Lock()
+
+
+def get_identity_token(audience):
+    """Get an identity token for authenticating with solr-synonyms-api, reusing it until it is about to expire."""
+    cached = _id_tokens.get(audience)
+    if cached and cached[1] - TOKEN_EXPIRY_MARGIN > time.time():
+        return cached[0]
+
+    with _id_token_lock:
+        cached = _id_tokens.get(audience)
+        if cached and cached[1] - TOKEN_EXPIRY_MARGIN > time.time():
+            return cached[0]
+
+        try:
+            token = id_token.fetch_id_token(Request(), audience)
+
+            if not token or not isinstance(token, str):
+                current_app.logger.warning('Failed to get identity token')
+                return None
+
+            expires_at = jwt.decode(token, verify=False).get('exp', 0)
+            _id_tokens[audience] = (token, expires_at)
+            return token
+        except Exception as e:
+            current_app.logger.warning(f'Error in getting identity token: {e}')
+            return None
+
+
+class SynonymLookup:
+    """Process-wide, TTL-bounded lookup tables for the synonyms_text and stems_text columns.
+
+    Each table maps a lower-cased term to the full comma-separated lists it is part of, matching what
+    solr-synonyms-api returns from /synonyms/<col>/<term>.
+    """
+
+    _lock = threading.Lock()
+    _tables: Dict[str, Dict[str, List[str]]] = None
+    _version = None
+    _expires_at = 0
+
+    @classmethod
+    def exists(cls, token, col) -> bool:
+        """Return True if the token is part of any synonym list for the given column."""
+        return bool(cls.get_lists(token, col))
+
+    @classmethod
+    def get_lists(cls, token, col) -> List[str]:
+        """Return the comma-separated synonym lists (for the given column) that contain the token."""
+        tables = cls._get_tables()
+        return tables[col].get(token.strip().lower(), [])
+
+    @classmethod
+    def invalidate(cls):
+        """Force the next lookup to reload the lists from solr-synonyms-api."""
+        with cls._lock:
+            cls._expires_at = 0
+
+    @classmethod
+    def _get_tables(cls):
+        if cls._tables is not None and cls._expires_at > time.time():
+            return cls._tables
+
+        with cls._lock:
+            if cls._tables is not None and cls._expires_at > time.time():
+                return cls._tables
+
+            ttl = current_app.config.get('SYNONYMS_CACHE_TTL', DEFAULT_CACHE_TTL)
+            try:
+                rows, version = cls._fetch_synonym_lists()
+            except Exception as err:
+                if cls._tables is None:
+                    raise
+                # Keep answering from the previous lists, solr-synonyms-api may only be briefly unavailable.
+                current_app.logger.warning(f'Failed to refresh synonym lists, using cached version: {err}')
+                cls._expires_at = time.time() + ttl
+                return cls._tables
+
+            if version is None or version != cls._version:
+                cls._tables = cls.build_tables(rows)
+                cls._version = version
+            cls._expires_at = time.time() + ttl
+
+            return cls._tables
+
+    @classmethod
+    def build_tables(cls, rows) -> Dict[str, Dict[str, List[str]]]:
+        """Build the term -> lists tables for each column from the rows returned by solr-synonyms-api."""
+        tables = {col: {} for col in SYNONYM_COLUMNS}
+        for row in rows:
+            for col in SYNONYM_COLUMNS:
+                text = row.get(col) or ''
+                for term in {term.strip().lower() for term in text.split(',')}:
+                    tables[col].setdefault(term, []).append(text)
+        return tables
+
+    @classmethod
+    def _fetch_synonym_lists(cls):
+        solr_synonyms_api_url = current_app.config.get('SOLR_SYNONYMS_API_URL', None)
+        if not solr_synonyms_api_url:
+            raise Exception('SOLR: SOLR_SYNONYMS_API_URL is not set')
+
+        token = get_identity_token(solr_synonyms_api_url)
+
+        query = solr_synonyms_api_url + '/synonyms/synonym-lists'
+        current_app.logger.debug('Query: ' + query)
+
+        if token is None:
+            connection = request.urlopen(query)
+        else:
+            connection = request.urlopen(request.Request(query, headers={'Authorization': f'Bearer {token}'}))
+
+        results = json.load(connection)
+        return results.get('data', []), results.get('version')
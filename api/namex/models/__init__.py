@@ -30,3 +30,5 @@ from .nr_number_lifespan import NRNumberLifespan
 from .payment import Payment
 from .hotjar_tracking import HotjarTracking
 from .payment_society import PaymentSociety
+from .wait_time_statistics import DecisionLatency, WaitTimeStatistics
+from .processed_name import ProcessedName
@@ -1,8 +1,10 @@
 """Name hold a name choice for a Request"""
 
 # from . import db, ma
+import re
+
 from marshmallow import fields
-from sqlalchemy import event
+from sqlalchemy import event, func, literal_column
 from sqlalchemy.orm import backref
 
 from namex.models import db, ma
@@ -80,6 +82,30 @@ class Name(db.Model):
     def find_by_name(cls, name):
         return cls.query.filter_by(name=name).first()
 
+    @classmethod
+    def conflict_search_column(cls):
+        """SQL expression indexed by ix_names_conflict_search_trgm, see conflict_search_text.
+
+        The arguments are rendered as literals, the planner only matches the index when the expression is identical.
+        """
+        letters_and_digits = func.regexp_replace(
+            func.lower(cls.name), literal_column("'[^a-z0-9]+'"), literal_column("''"), literal_column("'g'")
+        )
+        return func.regexp_replace(
+            letters_and_digits, literal_column(r"'(.)\1+'"), literal_column(r"'\1'"), literal_column("'g'")
+        )
+
+    @staticmethod
+    def conflict_search_text(value):
+        """Normalize a word the way conflict_search_column normalizes names.
+
+        Names are lower-cased, stripped of everything but letters and digits and runs of the same character are
+        collapsed. The conflict regexes allow punctuation between letters and doubled letters, so any name they
+        match contains the normalized form of the words they were built from.
+        """
+        value = re.sub(r'[^a-z0-9]+', '', value.lower())
+        return re.sub(r'(.)\1+', r'\1', value)
+
     def save_to_db(self):
         # force uppercase names
         self.name = self.name.upper()
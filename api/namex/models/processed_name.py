@@ -0,0 +1,101 @@
+"""The processing of a name (cleaned tokens) stored once, so the auto analyse doesn't redo it for every candidate.
+
+A row is only valid for the rules_version it was computed with, the digest of the word lists and processing rules of
+NameProcessingService (see word_lists.get_rules_version). Rows of another version are recomputed on their next use
+or by the backfill-processed-names command of the auto-analyze service.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+
+from . import db
+
+
+class ProcessedName(db.Model):
+    __tablename__ = 'processed_names'
+
+    name = db.Column(db.String(1024), primary_key=True)
+    rulesVersion = db.Column('rules_version', db.String(40), nullable=False, index=True)
+    processedName = db.Column('processed_name', db.String(1024))
+    nameTokens = db.Column('name_tokens', ARRAY(db.String), nullable=False)
+    nameOriginalTokens = db.Column('name_original_tokens', ARRAY(db.String), nullable=False)
+    nameFirstPart = db.Column('name_first_part', db.String(1024))
+    lastUpdate = db.Column(
+        'last_update', db.DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    @classmethod
+    def from_name_processing(cls, np_svc, rules_version: str):
+        """Return the processing of the name last set on the NameProcessingService, with the word lists of the
+        rules_version.
+        """
+        return cls(
+            name=np_svc.name_as_submitted,
+            rulesVersion=rules_version,
+            processedName=np_svc.processed_name,
+            nameTokens=list(np_svc.name_tokens),
+            nameOriginalTokens=list(np_svc.name_original_tokens),
+            nameFirstPart=np_svc.name_first_part,
+        )
+
+    @classmethod
+    def find_current(cls, names: list, rules_version: str) -> dict:
+        """Return the processed names of the rules_version among the names, by name."""
+        if not names:
+            return {}
+        processed_names = (
+            db.session.query(cls).filter(cls.name.in_(set(names)), cls.rulesVersion == rules_version).all()
+        )
+        # detached, so they stay loaded when the session commits
+        for processed in processed_names:
+            db.session.expunge(processed)
+        return {processed.name: processed for processed in processed_names}
+
+    @classmethod
+    def find_outdated_names(cls, rules_version: str, after: str = '', limit: int = 500) -> list:
+        """Return the next names (in order, after the given one) without a processed name of the rules_version."""
+        sql = text(
+            'SELECT DISTINCT n.name FROM names n'
+            ' LEFT JOIN processed_names p ON p.name = n.name AND p.rules_version = :rules_version'
+            ' WHERE n.name > :after AND p.name IS NULL'
+            ' ORDER BY n.name LIMIT :limit'
+        )
+        rows = db.session.execute(sql, {'rules_version': rules_version, 'after': after, 'limit': limit})
+        return [row[0] for row in rows]
+
+    @classmethod
+    def save_all(cls, processed_names: list):
+        """Insert the processed names, replacing the stored ones of the same names."""
+        if not processed_names:
+            return
+        rows = {
+            processed.name: {
+                'name': processed.name,
+                'rules_version': processed.rulesVersion,
+                'processed_name': processed.processedName,
+                'name_tokens': processed.nameTokens,
+                'name_original_tokens': processed.nameOriginalTokens,
+                'name_first_part': processed.nameFirstPart,
+                'last_update': datetime.utcnow(),
+            }
+            for processed in processed_names
+        }
+        statement = insert(cls.__table__).values(list(rows.values()))
+        statement = statement.on_conflict_do_update(
+            index_elements=[cls.__table__.c.name],
+            set_={
+                column: statement.excluded[column]
+                for column in (
+                    'rules_version',
+                    'processed_name',
+                    'name_tokens',
+                    'name_original_tokens',
+                    'name_first_part',
+                    'last_update',
+                )
+            },
+        )
+        db.session.execute(statement)
+        db.session.commit()
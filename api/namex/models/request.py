@@ -9,7 +9,8 @@ from typing import List, Optional, Self
 import sqlalchemy
 from flask import current_app
 from marshmallow import fields, post_dump
-from sqlalchemy import Date, and_, cast, event, func, select, text
+from sqlalchemy import Date, and_, cast, event, func, or_, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import backref
 from sqlalchemy.orm.attributes import get_history
 
@@ -39,6 +40,9 @@ from .payment import Payment
 from .state import State
 from .user import UserSchema
 
+# Shortest normalized word the trigram index can look up.
+MIN_TRIGRAM_LENGTH = 3
+
 
 class Request(db.Model):
     __tablename__ = 'requests'
@@ -463,9 +467,9 @@ class Request(db.Model):
             )
         ]
 
-        not_consumed_filter = [cls.stateCd.isnot(State.CONSUMED)]
+        not_consumed_filter = [cls.stateCd != State.CONSUMED]
 
-        consumed_filter = [cls.stateCd.is_(State.CONSUMED)]
+        consumed_filter = [cls.stateCd == State.CONSUMED]
 
         if queue:
             criteria.append(
@@ -509,27 +513,19 @@ class Request(db.Model):
         return criteria
 
     @classmethod
-    def get_waiting_time(cls, priority_queue=False):
+    def get_first_decisions_query(cls, since):
         """
-        Calculate the median examination time (in days, hours, or minutes)
-        between request submission and the first decision event, excluding special cases.
+        Return a query for the decision latency of every NR whose first decision was made since the given date.
 
-        The calculation logic:
+        The selection logic:
         1. For each NR, select only the first decision event (action='patch' and state_cd in
            ['APPROVED', 'CONDITIONAL', 'REJECTED', 'CANCELLED']) per NR.
-        2. Only include decision events that occurred yesterday or later.
+        2. Only include decision events that occurred on the given date or later.
         3. Exclude NRs that contain any REAPPLY action or have multiple decision making actions.
         4. Skip NRs that complete payment more than 5 days after submission (rare).
-        5. Calculate and return the median waiting time using PostgreSQL percentile_cont(0.5).
-        Parameters:
-            priority_queue: boolean.
         Returns:
-            float: Median waiting time in the specified unit, or None if no data is available.
+            Select: nr_id, decision_date, latency_seconds (from submission to decision) and priority per NR.
         """
-        unit_time = 60 * 60 * 24  # Default to days
-        if priority_queue:
-            unit_time = 60 * 60  # Default to hours for priority queue
-
         # Step 1: decision_candidates CTE
         decision_candidates = select(
             Event.nrId.label('nr_id'),
@@ -541,7 +537,7 @@ class Request(db.Model):
             Event.action == 'patch',
             Event.stateCd.in_(['APPROVED', 'CONDITIONAL', 'REJECTED', 'CANCELLED']),
             Event.userId != 1,
-            cast(Event.eventDate, Date) >= cast(func.now() - timedelta(days=1), Date)
+            cast(Event.eventDate, Date) >= cast(since, Date)
         ).cte('decision_candidates')
 
         # Step 2: decision_counts CTE
@@ -569,26 +565,54 @@ class Request(db.Model):
             decision_counts.c.cnt == 1
         ).cte('first_decision_events')
 
-        # Step 4: Final median calculation
-        median_waiting_time_query = (
+        # Step 4: latency of each decision
+        return (
             select(
-                (func.percentile_cont(0.5).within_group(
-                    func.extract('epoch', first_decision_events.c.event_dt) -
-                    func.extract('epoch', Request.__table__.c.submitted_date)
-                ) / unit_time).label('examinationTime')
+                first_decision_events.c.nr_id,
+                first_decision_events.c.event_dt.label('decision_date'),
+                (func.extract('epoch', first_decision_events.c.event_dt) -
+                 func.extract('epoch', Request.__table__.c.submitted_date)).label('latency_seconds'),
+                (func.coalesce(Request.priorityCd, 'N') == 'Y').label('priority')
             )
             .select_from(
                 first_decision_events
                 .join(Request, Request.__table__.c.id == first_decision_events.c.nr_id)
-                .join(Payment, Payment.__table__.c.nr_id == Request.id)
             )
             .where(
-                (Payment.__table__.c.payment_completion_date - Request.__table__.c.submitted_date) <= text("interval '5 days'")
+                # exists rather than a join, so an NR with several payments is still one row
+                sqlalchemy.exists().where(
+                    Payment.__table__.c.nr_id == Request.id,
+                    (Payment.__table__.c.payment_completion_date - Request.__table__.c.submitted_date)
+                    <= text("interval '5 days'")
+                )
             )
         )
 
+    @classmethod
+    def get_waiting_time(cls, priority_queue=False):
+        """
+        Calculate the median examination time (in days, or hours for the priority queue)
+        between request submission and the first decision event, excluding special cases.
+
+        The decisions are the ones of get_first_decisions_query made yesterday or later, and the median is
+        calculated with PostgreSQL percentile_cont(0.5). This runs the whole query, the statistics endpoint reads
+        the median precomputed once a day by WaitTimeStatistics.refresh instead.
+        Parameters:
+            priority_queue: boolean.
+        Returns:
+            float: Median waiting time in the specified unit, or None if no data is available.
+        """
+        unit_time = 60 * 60 * 24  # Default to days
         if priority_queue:
-            median_waiting_time_query = median_waiting_time_query.where(Request.priorityCd == 'Y')
+            unit_time = 60 * 60  # Default to hours for priority queue
+
+        first_decisions = cls.get_first_decisions_query(func.now() - timedelta(days=1)).subquery()
+        median_waiting_time_query = select(
+            (func.percentile_cont(0.5).within_group(first_decisions.c.latency_seconds) / unit_time)
+            .label('examinationTime')
+        )
+        if priority_queue:
+            median_waiting_time_query = median_waiting_time_query.where(first_decisions.c.priority)
 
         try:
             result = db.session.execute(median_waiting_time_query).scalar()
@@ -612,10 +636,52 @@ class Request(db.Model):
                     'Invalid classification for the word {0}. Cannot be included in exact match query.'.format(word)
                 )
 
+        criteria = cls.get_name_prefilter(criteria, [[word] for word in list_name])
         criteria = cls.get_designations_in_name(criteria, name, any_designation_list, end_designation_list, stop_words)
 
         return criteria
 
+    @classmethod
+    def get_name_prefilter(cls, criteria, word_groups):
+        """Require the name to contain one word of every group, in a form the trigram index can serve.
+
+        The conflict regexes can't use an index, so without this every search scans the names table. The words are
+        compared against Name.conflict_search_column, which ix_names_conflict_search_trgm indexes, and the regexes
+        only re-check the names that pass. Groups with a word too short for a trigram are left out.
+        """
+        search_column = Name.conflict_search_column()
+        prefilters = []
+        for words in word_groups:
+            keys = sorted({Name.conflict_search_text(word) for word in words})
+            if not keys or any(len(key) < MIN_TRIGRAM_LENGTH for key in keys):
+                continue
+            prefilters.append(or_(*[search_column.like('%{}%'.format(key)) for key in keys]))
+
+        if prefilters:
+            for e in criteria:
+                e.filters.insert(len(e.filters), prefilters)
+
+        return criteria
+
+    @classmethod
+    def get_name_search_filter(cls, name):
+        """Filter for the requests with a name choice matching name, where spaces in name match anything.
+
+        nameSearch is populated like '(|1<name 1>1||2<name 2>2||3<name 3>3|)' so a match can't span two choices. The
+        three choice patterns are OR-ed, which the planner would serve with three scans of ix_requests_name_search_trgm
+        (or none), so the pattern they all imply is added as a single condition for the index to answer.
+        """
+        name = name.strip().replace(' ', '%')
+        return and_(
+            cls.nameSearch.ilike('%' + name + '%'),
+            or_(*[cls.nameSearch.ilike('%|{0}%{1}%{0}|%'.format(choice, name)) for choice in (1, 2, 3)]),
+        )
+
+    @classmethod
+    def get_name_words_search_filter(cls, words):
+        """Filter for the requests with every one of the words somewhere in nameSearch."""
+        return and_(*[cls.nameSearch.ilike('%' + word + '%') for word in words])
+
     @classmethod
     def get_designations_in_name(
         cls, criteria, special_characters_name, any_designation_list, end_designation_list, stop_words_list
@@ -678,6 +744,68 @@ class Request(db.Model):
         current_app.logger.debug(query_all.statement)
         return query_all.all()
 
+    @classmethod
+    def get_combination_patterns(
+        cls, dist_substitution_dict, desc_synonym_criteria_dict, stop_words, check_name_is_well_formed, criteria_count=1
+    ):
+        """Return the name regexes of each criteria for every (distinctive, descriptive) combination, in search order.
+
+        A combination matches a name of a criteria when the name matches all of that criteria's regexes. The
+        descriptive regexes of one distinctive word accumulate, and the descriptive part is repeated once more for each
+        following criteria, as get_descriptive_query does when it adds each descriptive filter to the same criteria.
+        """
+        combinations = []
+        for key_dist, value_dist in dist_substitution_dict.items():
+            name_criteria = cls.get_distinctive_query(value_dist, stop_words, check_name_is_well_formed)
+            patterns = [[] for _ in range(criteria_count)]
+            for key_desc, value_desc in desc_synonym_criteria_dict.items():
+                special_characters_descriptive = cls.set_special_characters_descriptive(value_desc)
+                substitutions = ' ?| '.join(map(str, special_characters_descriptive)) + ' ?'
+                desc_criteria = r'.*({})\y'.format(substitutions)
+                patterns = [
+                    criteria_patterns + [name_criteria + desc_criteria * (idx + 1)]
+                    for idx, criteria_patterns in enumerate(patterns)
+                ]
+                combinations.append(((key_dist, key_desc), patterns))
+
+        return combinations
+
+    @classmethod
+    def find_by_criteria_combinations(cls, criteria_arr, combination_patterns, queue=False):
+        """Search every regex combination in a single query.
+
+        combination_patterns has the regex list of each criteria for every combination, as returned by
+        get_combination_patterns. The combinations are sent as a VALUES list and each row comes back tagged with the
+        index of the combination it matched as `combination`; a name matching several combinations is returned once
+        per combination.
+        """
+        combinations = sqlalchemy.values(
+            sqlalchemy.column('combination', sqlalchemy.Integer),
+            *[sqlalchemy.column(f'patterns_{idx}', ARRAY(sqlalchemy.String)) for idx in range(len(criteria_arr))],
+            name='combinations',
+        ).data([(idx, *patterns) for idx, patterns in enumerate(combination_patterns)])
+
+        queries = []
+        for idx, criteria in enumerate(criteria_arr):
+            RequestConditionCriteria.is_valid_criteria(criteria)
+            filters_all = []
+            for filter_group in criteria.filters:
+                for element in filter_group:
+                    filters_all.append(element)
+            patterns = combinations.c[f'patterns_{idx}']
+            filters_all.append(func.lower(Name.name).op('~')(sqlalchemy.all_(patterns)))
+            queries.append(
+                cls.query.with_entities(*criteria.fields, combinations.c.combination).filter(and_(*filters_all))
+            )
+
+        if queue:
+            query_all = queries[0]
+        else:
+            query_all = queries[0].union(queries[1])
+
+        current_app.logger.debug(query_all.statement)
+        return query_all.all()
+
     @classmethod
     def find_by_criteria(cls, criteria=None, limit=10):
         RequestConditionCriteria.is_valid_criteria(criteria)
@@ -0,0 +1,100 @@
+"""Wait time statistics, precomputed once a day instead of on every request to the endpoint."""
+
+import math
+from datetime import datetime, timedelta
+
+from sqlalchemy import Date, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from . import db
+from .request import Request
+
+SECONDS_PER_DAY = 60 * 60 * 24
+SECONDS_PER_HOUR = 60 * 60
+
+
+class DecisionLatency(db.Model):
+    """Time from submission to the first decision of an NR, kept per decision day."""
+
+    __tablename__ = 'decision_latencies'
+
+    nrId = db.Column('nr_id', db.Integer, db.ForeignKey('requests.id'), primary_key=True)
+    decisionDate = db.Column('decision_date', db.DateTime(timezone=True), nullable=False, index=True)
+    latencySeconds = db.Column('latency_seconds', db.Float, nullable=False)
+    priority = db.Column('priority', db.Boolean, nullable=False, default=False)
+
+
+class WaitTimeStatistics(db.Model):
+    """Median wait times of the regular (in days) and priority (in hours) queues, one row per refresh."""
+
+    __tablename__ = 'wait_time_statistics'
+
+    id = db.Column(db.Integer, primary_key=True)
+    computedAt = db.Column('computed_at', db.DateTime(timezone=True), default=datetime.utcnow, index=True)
+    priorityWaitTime = db.Column('priority_wait_time', db.Integer)
+    regularWaitTime = db.Column('regular_wait_time', db.Integer)
+    prioritySamples = db.Column('priority_samples', db.Integer, default=0)
+    regularSamples = db.Column('regular_samples', db.Integer, default=0)
+
+    @classmethod
+    def get_latest(cls, max_age: timedelta = None):
+        """Return the latest statistics, or None if there are none computed within max_age."""
+        query = db.session.query(cls)
+        if max_age is not None:
+            query = query.filter(cls.computedAt >= func.now() - max_age)
+        return query.order_by(cls.computedAt.desc()).first()
+
+    @classmethod
+    def refresh(cls):
+        """Record the decision latencies since yesterday and save their medians as the latest statistics.
+
+        The latencies since yesterday are recorded again on every refresh, as an NR decided again since the last
+        one no longer counts (see Request.get_first_decisions_query). An NR recorded on an older day and decided
+        again since then has its latency replaced by the one of its latest decision.
+        """
+        since = cast(func.now() - timedelta(days=1), Date)
+        db.session.query(DecisionLatency).filter(DecisionLatency.decisionDate >= since).delete(
+            synchronize_session=False
+        )
+        first_decisions = Request.get_first_decisions_query(since)
+        statement = insert(DecisionLatency.__table__).from_select(
+            ['nr_id', 'decision_date', 'latency_seconds', 'priority'], first_decisions
+        )
+        db.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[DecisionLatency.__table__.c.nr_id],
+                set_={
+                    column: statement.excluded[column] for column in ('decision_date', 'latency_seconds', 'priority')
+                },
+            )
+        )
+
+        def median(*criteria):
+            return (
+                select(func.percentile_cont(0.5).within_group(DecisionLatency.latencySeconds))
+                .where(DecisionLatency.decisionDate >= since, *criteria)
+                .scalar_subquery()
+            )
+
+        def samples(*criteria):
+            return (
+                select(func.count())
+                .select_from(DecisionLatency)
+                .where(DecisionLatency.decisionDate >= since, *criteria)
+                .scalar_subquery()
+            )
+
+        # the regular wait time is over every NR, as in Request.get_waiting_time
+        priority = DecisionLatency.priority.is_(True)
+        row = db.session.execute(select(median(priority), median(), samples(priority), samples())).one()
+        priority_median, regular_median, priority_samples, regular_samples = row
+
+        statistics = cls(
+            priorityWaitTime=math.ceil(priority_median / SECONDS_PER_HOUR) if priority_median is not None else None,
+            regularWaitTime=math.ceil(regular_median / SECONDS_PER_DAY) if regular_median is not None else None,
+            prioritySamples=priority_samples,
+            regularSamples=regular_samples,
+        )
+        db.session.add(statistics)
+        db.session.commit()
+        return statistics
@@ -4,7 +4,7 @@ Virtual word classification classifies all words in a name approved by an examin
 
 from datetime import date, datetime
 
-from sqlalchemy import func
+from sqlalchemy import column, func, values
 from sqlalchemy.orm import backref
 
 from . import db, ma
@@ -68,6 +68,27 @@ class WordClassification(db.Model):
         cls.close_session()
         return results
 
+    @classmethod
+    def find_words_classification(cls, words):
+        """Classify several words in one query, matching each the same way find_word_classification does.
+
+        Returns distinct (token, word, classification) rows, token being the lower-cased word it was found for.
+        """
+        tokens = values(column('token', db.String), name='tokens').data([(word.lower(),) for word in words])
+        word_regex = func.concat('(^', tokens.c.token, r"(''[a-zA-Z])?\y)")
+        results = (
+            db.session.query(tokens.c.token, cls.word, cls.classification)
+            .distinct()
+            .filter(func.lower(cls.word).op('~')(word_regex))
+            .filter(cls.end_dt.is_(None))
+            .filter(cls.start_dt <= date.today())
+            .filter(cls.approved_dt <= date.today())
+            .order_by(tokens.c.token, cls.word, cls.classification)
+            .all()
+        )
+        cls.close_session()
+        return results
+
     @classmethod
     def find_word_by_classification(cls, word, classification):
         results = (
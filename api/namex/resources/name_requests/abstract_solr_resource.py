@@ -1,8 +1,8 @@
-import pysolr
 from flask import current_app
 from flask_restx import Resource
 
 from namex.models import State
+from namex.services import solr_indexer
 from namex.services.name_request.exceptions import SolrUpdateError
 
 
@@ -33,27 +33,20 @@ class AbstractSolrResource(Resource):
 
     @classmethod
     def add_solr_doc(cls, solr_core, solr_docs):
+        """Queue the docs to be added to the core, see SolrIndexer."""
         try:
-            SOLR_API_URL = f'{current_app.config.get("SOLR_BASE_URL")}/solr/'
-            solr = pysolr.Solr(SOLR_API_URL + solr_core + '/', timeout=10)
-            result = solr.add(solr_docs, commit=True)
+            solr_indexer.add(solr_core, solr_docs)
         except Exception as err:
             raise SolrUpdateError(err)
 
-        return result
-
     @classmethod
     def delete_solr_doc(cls, solr_core, doc_id):
+        """Queue the doc to be deleted from the core, see SolrIndexer."""
         try:
-            SOLR_API_URL = f'{current_app.config.get("SOLR_BASE_URL")}/solr/'
-            solr = pysolr.Solr(SOLR_API_URL + solr_core + '/', timeout=10)
-            result = solr.delete(id=doc_id, commit=True)
-
+            solr_indexer.delete(solr_core, doc_id)
         except Exception as err:
             raise SolrUpdateError(err)
 
-        return result
-
     @classmethod
     def update_solr_service(cls, nr_model, temp_nr_num=None):
         SOLR_CORE = 'possible.conflicts'
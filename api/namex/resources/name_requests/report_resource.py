@@ -1,8 +1,6 @@
-import base64
 import json
 from datetime import datetime
 from http import HTTPStatus
-from pathlib import Path
 
 import pycountry
 import requests
@@ -12,6 +10,7 @@ from pytz import timezone
 
 from namex.constants import RequestAction
 from namex.models import Request, State
+from namex.services import report_templates
 from namex.services.name_request import NameRequestService
 from namex.services.name_request.utils import get_mapped_entity_and_action_code
 from namex.utils.api_resource import handle_exception
@@ -31,6 +30,14 @@ class ReportResource(Resource):
     GENERIC_STEPS = 'Submit appropriate form to BC Registries. Call if assistance required'
     BCA = 'Business Corporations Act'
     PA = 'Partnership Act'
+    TEMPLATE_PARTS = (
+        'name-request/style',
+        'name-request/logo',
+        'name-request/nrDetails',
+        'name-request/nameChoices',
+        'name-request/applicantContactInfo',
+        'name-request/resultDetails',
+    )
 
     def get(self, nr_id):
         try:
@@ -70,7 +77,7 @@ class ReportResource(Resource):
         headers = {'Authorization': 'Bearer {}'.format(token), 'Content-Type': 'application/json'}
         data = {
             'reportName': ReportResource._get_report_filename(nr_model),
-            'template': "'" + base64.b64encode(bytes(ReportResource._get_template(), 'utf-8')).decode() + "'",
+            'template': "'" + ReportResource._get_template_base64() + "'",
             'templateVars': ReportResource._get_template_data(nr_model),
         }
         response = requests.post(url=current_app.config.get('REPORT_SVC_URL'), headers=headers, data=json.dumps(data))
@@ -86,14 +93,24 @@ class ReportResource(Resource):
     @staticmethod
     def _get_template():
         try:
-            template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-            template_code = Path(f'{template_path}/{ReportResource._get_template_filename()}').read_text()
-            template_code = ReportResource._substitute_template_parts(template_code)
+            template_code = report_templates.render(
+                ReportResource._get_template_filename(), 'template-parts', ReportResource.TEMPLATE_PARTS
+            )
         except Exception as err:
             current_app.logger.error(err)
             raise err
         return template_code
 
+    @staticmethod
+    def _get_template_base64():
+        try:
+            return report_templates.render_base64(
+                ReportResource._get_template_filename(), 'template-parts', ReportResource.TEMPLATE_PARTS
+            )
+        except Exception as err:
+            current_app.logger.error(err)
+            raise err
+
     @staticmethod
     def _get_template_filename():
         return 'nameRequest.html'
@@ -110,21 +127,8 @@ class ReportResource(Resource):
 
     @staticmethod
     def _substitute_template_parts(template_code):
-        template_path = current_app.config.get('REPORT_TEMPLATE_PATH')
-        template_parts = [
-            'name-request/style',
-            'name-request/logo',
-            'name-request/nrDetails',
-            'name-request/nameChoices',
-            'name-request/applicantContactInfo',
-            'name-request/resultDetails',
-        ]
         # substitute template parts - marked up by [[filename]]
-        for template_part in template_parts:
-            template_part_code = Path(f'{template_path}/template-parts/{template_part}.html').read_text()
-            template_code = template_code.replace('[[{}.html]]'.format(template_part), template_part_code)
-
-        return template_code
+        return report_templates.substitute_parts(template_code, 'template-parts', ReportResource.TEMPLATE_PARTS)
 
     @staticmethod
     def _update_entity_and_action_code(nr_model):
@@ -46,6 +46,7 @@ from namex.services.name_request.utils import check_ownership, get_or_create_use
 from namex.utils import queue_util
 from namex.utils.auth import cors_preflight
 from namex.utils.common import convert_to_ascii, convert_to_utc_max_date_time, convert_to_utc_min_date_time
+from namex.utils.pagination import CursorError, decode_cursor, encode_cursor, estimate_count, get_keyset_filter
 
 from .utils import DateUtils
 
@@ -178,6 +179,13 @@ class Requests(Resource):
                 if q not in State.VALID_STATES:
                     return make_response(jsonify({'message': "'{}' is not a valid queue".format(queue)}), 406)
 
+        # keyset paging: pass an empty cursor for the first page, then the nextCursor of the previous response
+        cursor = request.args.get('cursor', None)
+        # numFound is an exact count(*) unless count=estimated, which uses the planner's row estimate
+        count_mode = request.args.get('count', 'exact')
+        if count_mode not in ('exact', 'estimated'):
+            return make_response(jsonify({'message': "count must be 'exact' or 'estimated'"}), 406)
+
         # order must be a string of 'column:asc,column:desc'
         order = request.args.get('order', 'submittedDate:desc,stateCd:desc')
         # order=dict((x.split(":")) for x in order.split(',')) // con't pass as a dict as the order is lost
@@ -188,6 +196,7 @@ class Requests(Resource):
         col_keys = cols.keys()
         sort_by = ''
         order_list = ''
+        order_columns = []
         for k, v in ((x.split(':')) for x in order.split(',')):
             vl = v.lower()
             if (k in col_keys) and (vl == 'asc' or vl == 'desc'):
@@ -196,6 +205,14 @@ class Requests(Resource):
                     order_list = order_list + ', '
                 sort_by = sort_by + '{columns} {direction} NULLS LAST'.format(columns=cols[k], direction=vl)
                 order_list = order_list + '{attribute} {direction} NULLS LAST'.format(attribute=k, direction=vl)
+                order_columns.append((k, cols[k], vl))
+
+        if cursor is not None and 'id' not in (k for k, _, _ in order_columns):
+            # the id breaks ties so every row has a distinct position to continue from
+            if len(sort_by) > 0:
+                sort_by = sort_by + ', '
+            sort_by = sort_by + '{columns} asc NULLS LAST'.format(columns=cols['id'])
+            order_columns.append(('id', cols['id'], 'asc'))
 
         # Assemble the query
         nrNum = request.args.get('nrNum', None)
@@ -230,19 +247,7 @@ class Requests(Resource):
             q = q.join(RequestDAO.activeUser).filter(User.username.ilike('%' + activeUser + '%'))
 
         if compName:
-            compName = compName.strip().replace(' ', '%')
-            # nameSearch column is populated like: '|1<name 1>|2<name 2>|3<name 3>
-            # to ensure we don't get a match that spans over a single name
-            compName1 = '%|1%' + compName + '%1|%'
-            compName2 = '%|2%' + compName + '%2|%'
-            compName3 = '%|3%' + compName + '%3|%'
-            q = q.filter(
-                or_(
-                    RequestDAO.nameSearch.ilike(compName1),
-                    RequestDAO.nameSearch.ilike(compName2),
-                    RequestDAO.nameSearch.ilike(compName3),
-                )
-            )
+            q = q.filter(RequestDAO.get_name_search_filter(compName))
 
         if firstName:
             firstName = firstName.strip().replace(' ', '%')
@@ -404,15 +409,34 @@ class Requests(Resource):
         ) and submittedEndDateTimeUtcObj < submittedStartDateTimeUtcObj:
             return make_response(jsonify({'message': 'submittedEndDate must be after submittedStartDate'}), 400)
 
-        q = q.order_by(text(sort_by))
-
         # get a count of the full set size, this ignore the offset & limit settings
-        count_q = q.statement.with_only_columns([func.count()]).order_by(None)
-        count = db.session.execute(count_q).scalar()
+        if count_mode == 'estimated':
+            count = estimate_count(db.session, q.statement.order_by(None))
+        else:
+            count_q = q.statement.with_only_columns([func.count()]).order_by(None)
+            count = db.session.execute(count_q).scalar()
+
+        q = q.order_by(text(sort_by))
 
         # Add the paging
-        q = q.offset(start)
-        q = q.limit(rows)
+        next_cursor = None
+        if cursor is not None:
+            if cursor:
+                try:
+                    values = decode_cursor(cursor, order_list, [c for _, c, _ in order_columns])
+                except CursorError as err:
+                    return make_response(jsonify({'message': str(err)}), 400)
+                q = q.filter(get_keyset_filter([(c, d) for _, c, d in order_columns], values))
+
+            # fetch one row more than asked for to know if there is a next page
+            results = q.limit(rows + 1).all()
+            if len(results) > rows:
+                results = results[:rows]
+                next_cursor = encode_cursor(order_list, [getattr(results[-1], k) for k, _, _ in order_columns])
+        else:
+            q = q.offset(start)
+            q = q.limit(rows)
+            results = q.all()
 
         # create the response
         rep = {
@@ -425,8 +449,13 @@ class Requests(Resource):
                 'queue': queue,
                 'order': order_list,
             },
-            'nameRequests': [request_search_schemas.dump(q.all()), {}],
+            'nameRequests': [request_search_schemas.dump(results), {}],
         }
+        if cursor is not None:
+            rep['response']['cursor'] = cursor
+            rep['response']['nextCursor'] = next_cursor
+        if count_mode == 'estimated':
+            rep['response']['numFoundEstimated'] = True
 
         return make_response(jsonify(rep), 200)
 
@@ -470,23 +499,18 @@ class RequestSearch(Resource):
 
         try:
             solr_query, nr_number, nr_name = SolrQueries.get_parsed_query_name_nr_search(query)
-            condition = ''
+            conditions = []
             if nr_number:
-                condition = f"requests.nr_num ILIKE '%{nr_number}%'"
+                conditions.append(RequestDAO.nrNum.ilike(f'%{nr_number}%'))
             if nr_name:
-                nr_name = nr_name.replace("'", "''")
-                if condition:
-                    condition += ' OR '
-                name_condition = "requests.name_search ILIKE '%"
-                name_condition += "%' AND requests.name_search ILIKE '%".join(nr_name.split())
-                name_condition += "%'"
-
-                condition += f'({name_condition})'
+                conditions.append(RequestDAO.get_name_words_search_filter(nr_name.split()))
+            if not conditions:
+                return make_response(jsonify(data), 200)
 
             results = (
                 RequestDAO.query.filter(
                     RequestDAO.stateCd.in_([State.DRAFT, State.INPROGRESS, State.REFUND_REQUESTED]),
-                    text(f'({condition})'),
+                    or_(*conditions),
                 )
                 .options(
                     lazyload('*'),
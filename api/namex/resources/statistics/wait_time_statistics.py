@@ -10,6 +10,8 @@ from namex.services.statistics.wait_time_statistics import WaitTimeStatsService
 from namex.utils.api_resource import handle_exception
 from namex.utils.auth import cors_preflight
 
+WAIT_TIME_STATS_CACHE_NAMESPACE = 'wait-time-stats'
+
 # Register a local namespace for the requests
 api = Namespace('waitTimeStats', description='API for Wait Time Statistics')
 
@@ -25,11 +27,13 @@ def handle_auth_error(ex):
 @api.route('/', strict_slashes=False, methods=['GET', 'OPTIONS'])
 class WaitTimeStats(Resource):
     @staticmethod
-    @cache.cached(timeout=14400)  # cached for 4 hours
     def get():
         try:
             service = WaitTimeStatsService()
-            response = service.get_statistics()
+            # cached for 4 hours, computed by one worker of the node while the others wait for it
+            response = cache.get_or_compute(
+                WAIT_TIME_STATS_CACHE_NAMESPACE, 'statistics', service.get_statistics, timeout=14400
+            )
 
             if not response:
                 raise ApiServiceException(message='WaitTimeStatsService did not return a result')
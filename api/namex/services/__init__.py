@@ -7,5 +7,9 @@ from .exceptions import ServicesError
 from .messages import MessageServices
 from .name_request.name_request_state import is_reapplication_eligible
 from .flags import Flags
+from .solr_indexer import SolrIndexer
+from .template_registry import TemplateRegistry
 
 flags = Flags()
+report_templates = TemplateRegistry('REPORT_TEMPLATE_PATH')
+solr_indexer = SolrIndexer()
@@ -1,3 +1,85 @@
+"""The api cache, shared by the gunicorn workers of a node.
+
+The backend comes from the Flask-Caching settings in the config: a FileSystemCache under CACHE_DIR by default, which
+every worker of the node reads and writes.
+
+On top of the Flask-Caching api, keys can be grouped in namespaces that are invalidated together, and get_or_compute
+makes sure only one worker recomputes an expired value while the others wait for it.
+"""
+
+import time
+import uuid
+
+from cachelib import FileSystemCache as CachelibFileSystemCache
 from flask_caching import Cache
+from flask_caching.backends.filesystemcache import FileSystemCache as FlaskCachingFileSystemCache
+
+# How long a recompute may hold the lock before the waiting callers give up on it and compute the value themselves.
+DEFAULT_LOCK_TIMEOUT = 60
+LOCK_POLL_INTERVAL = 0.1
+
+
+class FileSystemCache(FlaskCachingFileSystemCache):
+    """Flask-Caching's FileSystemCache, reading its files the way cachelib writes them.
+
+    Flask-Caching 1.x reads the files back with its own (older) format, so nothing written by cachelib >= 0.10 is
+    ever found.
+    """
+
+    _list_dir = CachelibFileSystemCache._list_dir
+    _prune = CachelibFileSystemCache._prune
+    get = CachelibFileSystemCache.get
+    has = CachelibFileSystemCache.has
+
+
+class NamexCache(Cache):
+    """Flask-Caching cache with namespaces and single-flight recomputes."""
+
+    def namespaced_key(self, namespace: str, key: str) -> str:
+        """Return the key in the current version of the namespace."""
+        version = self.get(f'{namespace}:version')
+        if version is None:
+            version = uuid.uuid4().hex
+            # another worker may have set it first, in which case that version is the one to use
+            if not self.add(f'{namespace}:version', version, timeout=0):
+                version = self.get(f'{namespace}:version') or version
+        return f'{namespace}:{version}:{key}'
+
+    def invalidate(self, namespace: str):
+        """Drop every key of the namespace, by moving it to a new version."""
+        self.set(f'{namespace}:version', uuid.uuid4().hex, timeout=0)
+
+    def get_or_compute(self, namespace: str, key: str, compute, timeout: int = None, lock_timeout: int = None):
+        """Return the cached value for the key, computing and caching it if there is none.
+
+        Only one caller computes a missing value, the others wait for it to be cached (for up to lock_timeout
+        seconds, after which they compute it themselves). Empty values (None, {}, []...) are returned but not cached,
+        so a failed or too early computation is not served until the timeout.
+        """
+        cache_key = self.namespaced_key(namespace, key)
+        lock_key = f'{cache_key}:lock'
+        lock_timeout = lock_timeout or DEFAULT_LOCK_TIMEOUT
+        give_up_at = time.monotonic() + lock_timeout
+
+        while True:
+            if (cached := self.get(cache_key)) is not None:
+                return cached
+            if self.add(lock_key, True, timeout=lock_timeout):
+                break
+            if time.monotonic() >= give_up_at:
+                return compute()
+            time.sleep(LOCK_POLL_INTERVAL)
+
+        try:
+            # the previous holder of the lock may have cached it just before this caller took the lock
+            if (cached := self.get(cache_key)) is not None:
+                return cached
+            value = compute()
+            if value:
+                self.set(cache_key, value, timeout=timeout)
+            return value
+        finally:
+            self.delete(lock_key)
+
 
-cache = Cache(config={'CACHE_TYPE': 'simple', 'CACHE_DEFAULT_TIMEOUT': 300})
+cache = NamexCache()
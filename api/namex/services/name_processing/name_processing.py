@@ -9,8 +9,9 @@ from namex.services.word_classification.word_classification import WordClassific
 from ..name_request.auto_analyse.mixins.get_designations_lists import GetDesignationsListsMixin
 from ..name_request.auto_analyse.name_analysis_utils import remove_french, remove_stop_words
 from ..virtual_word_condition.virtual_word_condition import VirtualWordConditionService
-from . import LanguageCodes
 from .mixins.get_synonym_lists import GetSynonymListsMixin
+from .transform import get_transform_pipeline
+from .word_lists import get_exception_stop_words_designation, get_word_lists
 
 """
 Service for pre-processing of a user submitted name request name string.
@@ -132,6 +133,7 @@ class NameProcessingService(GetSynonymListsMixin, GetDesignationsListsMixin):
         self.distinctive_word_tokens = None
         self.descriptive_word_tokens = None
         self.unclassified_word_tokens = None
+        self._word_lists = None
 
     """
     Set and process a submitted name string using the process_name class method.
@@ -141,11 +143,21 @@ class NameProcessingService(GetSynonymListsMixin, GetDesignationsListsMixin):
         self.name_as_submitted = name  # Store the user's submitted name string
         self._process_name(np_svc_prep_data)
 
+    def set_processed_name(self, processed):
+        """Set a name from its stored processing (a ProcessedName of the current rules_version), like set_name."""
+        self.name_as_submitted = processed.name
+        self.name_original_tokens = list(processed.nameOriginalTokens)
+        self.name_first_part = processed.nameFirstPart
+        self.name_tokens = list(processed.nameTokens)
+        self.processed_name = processed.processedName
+
     def set_name_tokenized(self, name):
-        all_designations = self._designated_all_words
-        all_designations.sort(key=len, reverse=True)
-        designation_alternators = '|'.join(map(re.escape, all_designations))
-        regex = re.compile(r'(?<!\w)({}|[a-z-A-Z0-9]+)(?!\w)'.format(designation_alternators))
+        if self._word_lists is not None:
+            regex = self._word_lists.designation_tokenize_regex
+        else:
+            all_designations = sorted(self._designated_all_words, key=len, reverse=True)
+            designation_alternators = '|'.join(map(re.escape, all_designations))
+            regex = re.compile(r'(?<!\w)({}|[a-z-A-Z0-9]+)(?!\w)'.format(designation_alternators))
         self.name_as_submitted_tokenized = regex.findall(name.lower())
 
     def _clean_name_words(self, name, stop_words=None, designation_all=None, prefix_list=None, number_list=None):
@@ -157,24 +169,38 @@ class NameProcessingService(GetSynonymListsMixin, GetDesignationsListsMixin):
         if not name or not stop_words or not designation_all or not prefix_list or not number_list:
             warnings.warn('Parameters in clean_name_words function are not set.', Warning, stacklevel=2)
 
-        syn_svc = self.synonym_service
         # vwc_svc = self.virtual_word_condition_service
-        designation_all.sort(key=len, reverse=True)
-        designation_alternators = '|'.join(map(re.escape, designation_all))
+        word_lists = self._word_lists
+        if (
+            word_lists is not None
+            and designation_all is word_lists.designated_all_words
+            and stop_words is word_lists.stop_words
+        ):
+            # The snapshot lists are already sorted and their patterns compiled.
+            designation_alternators = word_lists.designation_alternators
+            exception_stop_words_designation = word_lists.exception_stop_words_designation
+        else:
+            designation_all = sorted(designation_all, key=len, reverse=True)
+            designation_alternators = '|'.join(map(re.escape, designation_all))
+            exception_stop_words_designation = get_exception_stop_words_designation(stop_words, designation_all)
+
+        if (
+            word_lists is not None
+            and designation_all is word_lists.designated_all_words
+            and prefix_list is word_lists.prefixes
+        ):
+            transform_pipeline = word_lists.transform_pipeline
+        else:
+            transform_pipeline = get_transform_pipeline(tuple(designation_all), tuple(prefix_list))
 
         exception_designation = self.exception_designation(name)
-        exception_stop_words_designation = list(set(self.exception_designation_stop_word(stop_words, designation_all)))
-        exception_stop_words_designation.sort(key=len, reverse=True)
 
         name_original_tokens = [x for x in [x.strip() for x in re.split('([ &/-])', name.lower())] if x]
         self.name_original_tokens = name_original_tokens
 
         name = remove_stop_words(name, stop_words, exception_stop_words_designation)
 
-        prefixes = '|'.join(prefix_list)
-        words = syn_svc.get_regex_prefixes(
-            text=name, prefixes_str=prefixes, exception_designation=exception_designation
-        ).data
+        words = transform_pipeline.regex_prefixes(name, exception_designation)
 
         name = remove_french(words, designation_alternators)
         self.name_first_part = name
@@ -182,15 +208,7 @@ class NameProcessingService(GetSynonymListsMixin, GetDesignationsListsMixin):
         # exceptions_ws = syn_svc.get_exception_regex(text=name).data
         # exceptions_ws.extend(self.exception_virtual_word_condition(name, vwc_svc))
 
-        tokens = syn_svc.get_transform_text(
-            text=name,
-            designation_all=designation_all,
-            prefix_list=prefix_list,
-            number_list=number_list,
-            exceptions_ws=[],
-        ).data
-
-        tokens = tokens.split()
+        tokens = transform_pipeline.transform(name).split()
 
         return [x.lower() for x in tokens if x]
 
@@ -207,8 +225,11 @@ class NameProcessingService(GetSynonymListsMixin, GetDesignationsListsMixin):
 
     def exception_designation(self, text):
         exceptions_designation = []
-        all_designations = self._designated_all_words
-        designations_with_hyphen = [designation for designation in all_designations if '-' in designation]
+        if self._word_lists is not None:
+            designations_with_hyphen = self._word_lists.designations_with_hyphen
+        else:
+            all_designations = self._designated_all_words
+            designations_with_hyphen = [designation for designation in all_designations if '-' in designation]
 
         exceptions_designation = [designation for designation in designations_with_hyphen if designation in text]
 
@@ -229,29 +250,45 @@ class NameProcessingService(GetSynonymListsMixin, GetDesignationsListsMixin):
 
         return exception_stopword_designation
 
-    def prepare_data(self):
-        """Prep the analysis."""
-        syn_svc = self.synonym_service
+    def prepare_data(self, word_lists=None):
+        """Prep the analysis.
+
+        The word lists come from the process-wide snapshot (see word_lists.py), so this doesn't call the
+        synonyms API unless the snapshot has never been loaded. Pass word_lists to prepare with a given snapshot
+        instead of the current one.
+        """
+        word_lists = word_lists or get_word_lists()
+        self._word_lists = word_lists
 
-        # Query database for word designations
         # These properties are mixed in via GetSynonymListsMixin
         # See the class constructor
-        self._stop_words = syn_svc.get_stop_words().data
-        self._prefixes = syn_svc.get_prefixes().data
-        self._number_words = syn_svc.get_number_words().data
-        self._stand_alone_words = syn_svc.get_stand_alone().data
+        self._stop_words = word_lists.stop_words
+        self._prefixes = word_lists.prefixes
+        self._number_words = word_lists.number_words
+        self._stand_alone_words = word_lists.stand_alone_words
+
+        self._eng_designated_end_words = word_lists.eng_designated_end_words
+        self._eng_designated_any_words = word_lists.eng_designated_any_words
 
-        self._eng_designated_end_words = syn_svc.get_designated_end_all_words(lang=LanguageCodes.ENG.value).data
-        self._eng_designated_any_words = syn_svc.get_designated_any_all_words(lang=LanguageCodes.ENG.value).data
+        self._fr_designated_end_words = word_lists.fr_designated_end_words
+        self._fr_designated_any_words = word_lists.fr_designated_any_words
 
-        self._fr_designated_end_words = syn_svc.get_designated_end_all_words(lang=LanguageCodes.FR.value).data
-        self._fr_designated_any_words = syn_svc.get_designated_any_all_words(lang=LanguageCodes.FR.value).data
+        self._designated_end_words = word_lists.designated_end_words
+        self._designated_any_words = word_lists.designated_any_words
 
-        self._designated_end_words = self._eng_designated_end_words + self._fr_designated_end_words
-        self._designated_any_words = self._eng_designated_any_words + self._fr_designated_any_words
+        self._designated_all_words = word_lists.designated_all_words
 
-        self._designated_all_words = list(set(self._designated_any_words + self._designated_end_words))
-        self._designated_all_words.sort(key=len, reverse=True)
+    @property
+    def word_lists(self):
+        return self._word_lists
+
+    @property
+    def word_lists_version(self):
+        return self._word_lists.version if self._word_lists is not None else None
+
+    @property
+    def rules_version(self):
+        return self._word_lists.rules_version if self._word_lists is not None else None
 
     def _process_name(self, np_svc_prep_data):
         """Split a name string into classifiable tokens.
@@ -0,0 +1,71 @@
+import re
+import string
+from functools import lru_cache
+
+"""
+In-process version of the solr-synonyms-api /regex-prefixes and /transform-text steps.
+NameProcessingService._clean_name_words used to send every name to both endpoints. The same regexes now run here,
+compiled once per designation/prefix list (see WordListsSnapshot.transform_pipeline), and must stay in step with
+solr-synonyms-api/synonyms/services/synonyms/transform.py.
+"""
+
+ORDINAL_SUFFIXES = 'ST|[RN]D|TH'
+INTERNET_DOMAINS = '.COM|.ORG|.NET|.EDU'
+
+NUMBERS_LOT_RX = re.compile(
+    r'(?<=[a-zA-Z\.])\'[Ss]|\(.*\d+.*\)|\(?No.?\s*\d+\)?|\(?lot.?\s*\d+[-]?\d*\)?', re.IGNORECASE
+)
+REPEATED_STRINGS_RX = re.compile(r'\b(\w{2,})(\b\W+\b\1\b)*', re.IGNORECASE)
+SEPARATED_ORDINALS_RX = re.compile(r'\b(\d+({}))(\w+)\b'.format(ORDINAL_SUFFIXES), re.IGNORECASE)
+PUNCTUATION_RX = re.compile(rf'[{string.punctuation}]')
+TOGETHER_ONE_LETTER_RX = re.compile(r'(\b[A-Za-z]{1,2}\b)\s+(?=[a-zA-Z]{1,2}\b)|\s+$', re.IGNORECASE)
+EXTRA_SPACES_RX = re.compile(r'\s+', re.IGNORECASE)
+
+
+def normalize_spaces(text):
+    return ' '.join(text.split())
+
+
+@lru_cache(maxsize=256)
+def get_prefixes_regex(prefixes, exception_designation):
+    exception_designation_rx = '|'.join(map(re.escape, exception_designation))
+    ws_generic_rx = r'(?<![a-zA-Z0-9_.])({0})\s*([ &/.-])\s*([A-Za-z]+)'.format(prefixes)
+    return re.compile(r'({0})|{1}'.format(exception_designation_rx, ws_generic_rx), re.I)
+
+
+@lru_cache(maxsize=16)
+def get_transform_pipeline(designation_all, prefix_list):
+    """Return the pipeline for a designation and prefix list, given as tuples so they can key the cache."""
+    return TransformPipeline(designation_all, prefix_list)
+
+
+class TransformPipeline:
+    """The prefix and transform-text steps, with their word list patterns compiled once."""
+
+    def __init__(self, designation_all, prefix_list):
+        self.prefixes = '|'.join(prefix_list)
+        self.remove_designations_rx = re.compile(
+            r'\b({0})\b|(?<=\d),(?=\d)|(?<!\w)({1})(?![A-Za-z0-9_.])(?=.*$)'.format(
+                INTERNET_DOMAINS, '|'.join(designation_all)
+            ),
+            re.IGNORECASE,
+        )
+
+    def regex_prefixes(self, text, exception_designation):
+        """Join prefixes to the word they are separated from (PRE-SCHOOL -> PRESCHOOL), same as /regex-prefixes."""
+        designation_rx = get_prefixes_regex(self.prefixes, tuple(exception_designation))
+        text = designation_rx.sub(lambda x: x.group(1) or (x.group(2) + x.group(4)), text)
+
+        return normalize_spaces(text)
+
+    def transform(self, text):
+        """Remove designations, numbers, repeated words and punctuation, same as /transform-text."""
+        text = normalize_spaces(self.remove_designations_rx.sub('', text))
+        text = normalize_spaces(NUMBERS_LOT_RX.sub('', text))
+        text = normalize_spaces(REPEATED_STRINGS_RX.sub(r'\1', text))
+        text = normalize_spaces(SEPARATED_ORDINALS_RX.sub(r'\1 \3', text))
+        text = normalize_spaces(PUNCTUATION_RX.sub(' ', text))
+        text = normalize_spaces(TOGETHER_ONE_LETTER_RX.sub(r'\1', text))
+        text = normalize_spaces(EXTRA_SPACES_RX.sub(' ', text))
+
+        return text
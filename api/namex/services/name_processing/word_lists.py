@@ -0,0 +1,170 @@
+import hashlib
+import json
+import re
+import threading
+import time
+
+from flask.globals import current_app
+from swagger_client import SynonymsApi as SynonymService
+
+from . import LanguageCodes
+from .transform import get_transform_pipeline
+
+"""
+Process-wide snapshot of the word lists used to pre-process names.
+NameProcessingService.prepare_data used to fetch these from the synonyms API on every call. The snapshot is loaded
+once, shared by every NameProcessingService in the process and refreshed in the background once it is older than
+WORD_LISTS_TTL. The lists and patterns in a snapshot must be treated as read-only.
+"""
+
+DEFAULT_WORD_LISTS_TTL = 300
+
+# Bump whenever NameProcessingService cleans names differently, so the processed names stored with the previous
+# rules_version are recomputed (see ProcessedName).
+NAME_PROCESSING_RULES = 1
+
+_snapshot = None
+_version = 0
+_refreshing = False
+_lock = threading.Lock()
+
+
+class WordListsSnapshot:
+    """The stop words, prefixes, number words, stand-alone words and designations at a given version.
+
+    The designation alternation regexes, the stop word/designation exceptions and the transform pipeline are
+    compiled once per snapshot.
+    """
+
+    def __init__(self, version, lists):
+        self.version = version
+        self.loaded_at = time.monotonic()
+
+        self.stop_words = lists['stop_words']
+        self.prefixes = lists['prefixes']
+        self.number_words = lists['number_words']
+        self.stand_alone_words = lists['stand_alone_words']
+
+        self.eng_designated_end_words = lists['eng_designated_end_words']
+        self.eng_designated_any_words = lists['eng_designated_any_words']
+        self.fr_designated_end_words = lists['fr_designated_end_words']
+        self.fr_designated_any_words = lists['fr_designated_any_words']
+
+        self.designated_end_words = self.eng_designated_end_words + self.fr_designated_end_words
+        self.designated_any_words = self.eng_designated_any_words + self.fr_designated_any_words
+
+        self.designated_all_words = list(set(self.designated_any_words + self.designated_end_words))
+        self.designated_all_words.sort(key=len, reverse=True)
+
+        self.designation_alternators = '|'.join(map(re.escape, self.designated_all_words))
+        self.designation_tokenize_regex = re.compile(
+            r'(?<!\w)({}|[a-z-A-Z0-9]+)(?!\w)'.format(self.designation_alternators)
+        )
+        self.designations_with_hyphen = [designation for designation in self.designated_all_words if '-' in designation]
+        self.exception_stop_words_designation = get_exception_stop_words_designation(
+            self.stop_words, self.designated_all_words
+        )
+        self.transform_pipeline = get_transform_pipeline(tuple(self.designated_all_words), tuple(self.prefixes))
+        self.rules_version = get_rules_version(lists)
+
+
+def get_rules_version(lists):
+    """Return a digest of the word lists and processing rules, the same in every process that has the same lists."""
+    content = json.dumps({key: sorted(value) for key, value in lists.items()}, sort_keys=True)
+    content = '{}:{}'.format(NAME_PROCESSING_RULES, content).encode('utf-8')
+    return hashlib.sha1(content, usedforsecurity=False).hexdigest()
+
+
+def get_exception_stop_words_designation(stop_words, all_designations):
+    """Return the designations that contain a stop word, longest first."""
+    exception_stopword_designation = []
+    for word in stop_words:
+        word_regex = re.compile(r'\b{0}\b'.format(word))
+        for designation in all_designations:
+            if word_regex.search(designation):
+                exception_stopword_designation.append(designation)
+
+    if not exception_stopword_designation:
+        exception_stopword_designation.append('null')
+
+    exception_stopword_designation = list(set(exception_stopword_designation))
+    exception_stopword_designation.sort(key=len, reverse=True)
+    return exception_stopword_designation
+
+
+def fetch_word_lists(syn_svc=None):
+    """Fetch every word list used by name processing from the synonyms API."""
+    syn_svc = syn_svc or SynonymService()
+    return {
+        'stop_words': syn_svc.get_stop_words().data,
+        'prefixes': syn_svc.get_prefixes().data,
+        'number_words': syn_svc.get_number_words().data,
+        'stand_alone_words': syn_svc.get_stand_alone().data,
+        'eng_designated_end_words': syn_svc.get_designated_end_all_words(lang=LanguageCodes.ENG.value).data,
+        'eng_designated_any_words': syn_svc.get_designated_any_all_words(lang=LanguageCodes.ENG.value).data,
+        'fr_designated_end_words': syn_svc.get_designated_end_all_words(lang=LanguageCodes.FR.value).data,
+        'fr_designated_any_words': syn_svc.get_designated_any_all_words(lang=LanguageCodes.FR.value).data,
+    }
+
+
+def get_word_lists():
+    """Return the current snapshot, loading it on first use.
+
+    A stale snapshot is still returned while a background thread loads the next one, so only the very first call
+    in a process waits on the synonyms API.
+    """
+    global _snapshot, _refreshing
+
+    snapshot = _snapshot
+    if snapshot is None:
+        with _lock:
+            if _snapshot is None:
+                _snapshot = _new_snapshot(fetch_word_lists())
+            return _snapshot
+
+    ttl = current_app.config.get('WORD_LISTS_TTL', DEFAULT_WORD_LISTS_TTL)
+    if time.monotonic() - snapshot.loaded_at > ttl and not _refreshing:
+        with _lock:
+            if not _refreshing:
+                _refreshing = True
+                threading.Thread(target=_refresh, args=(current_app.logger,), daemon=True).start()
+
+    return snapshot
+
+
+def invalidate_word_lists():
+    """Drop the snapshot so the next call to get_word_lists loads the lists again."""
+    global _snapshot
+    with _lock:
+        _snapshot = None
+
+
+def _new_snapshot(lists):
+    # Versions keep increasing across invalidations so caches keyed on them never see a version reused.
+    global _version
+    _version += 1
+    return WordListsSnapshot(_version, lists)
+
+
+def _refresh(logger):
+    global _snapshot, _refreshing
+    try:
+        lists = fetch_word_lists()
+        current = _snapshot
+        if current is not None and all(getattr(current, key) == value for key, value in lists.items()):
+            # Nothing changed, keep the compiled patterns and just restart the clock.
+            current.loaded_at = time.monotonic()
+        else:
+            _snapshot = _new_snapshot(lists)
+            logger.debug('Word lists refreshed to version {}'.format(_snapshot.version))
+    except Exception as err:
+        # Keep serving the current lists and try again once the TTL has passed.
+        if _snapshot is not None:
+            _snapshot.loaded_at = time.monotonic()
+        logger.warning(
+            'Refreshing word lists failed, keeping version {}: {}'.format(
+                _snapshot.version if _snapshot else None, repr(err)
+            )
+        )
+    finally:
+        _refreshing = False
@@ -6,6 +6,7 @@ import re
 
 from flask.globals import current_app
 
+from namex.analytics.synonym_batch import SynonymBatch
 from namex.services.name_request.auto_analyse import DataFrameFields
 from namex.utils.common import parse_dict_of_lists
 
@@ -139,17 +140,17 @@ def lookahead(iterable):
     yield idx + 1, last, False
 
 
-def check_numbers_beginning(syn_svc, tokens):
+def check_numbers_beginning(synonym_batch, tokens):
     if tokens[0].isdigit():
         for idx, token in enumerate(tokens[1:]):
             if not token.isdigit():
-                if not syn_svc.get_word_synonyms(word=token).data:
+                if not synonym_batch.get_synonyms(token):
                     tokens = tokens[idx + 1 :]
                 break
     return tokens
 
 
-def check_synonyms(syn_svc, stand_alone_words, list_dist_words, list_desc_words, list_name):
+def check_synonyms(synonym_batch, stand_alone_words, list_dist_words, list_desc_words, list_name):
     list_desc_words_set = frozenset(list_desc_words)
     list_desc = []
     intersection = [x for x in list_dist_words if x in list_desc_words_set]
@@ -157,7 +158,7 @@ def check_synonyms(syn_svc, stand_alone_words, list_dist_words, list_desc_words,
 
     for word in list_name:
         if word in list_desc_words:
-            substitution = syn_svc.get_word_synonyms(word=word).data
+            substitution = synonym_batch.get_synonyms(word)
             if substitution or word.lower() in stand_alone_words:
                 dict_desc[word] = substitution
                 list_desc.append(word)
@@ -212,7 +213,11 @@ def get_conflicts_same_classification(builder, name_tokens, processed_name, stan
 
 def get_classification(service, stand_alone_words, syn_svc, match, wc_svc, token_svc, conflict=False):
     """Classify each word in the name."""
-    desc_compound_dict = get_compound_descriptives(service, syn_svc)
+    # Every word and compound the checks below may look up, fetched from solr-synonyms-api in one request
+    synonym_batch = SynonymBatch(syn_svc)
+    synonym_batch.prefetch(get_synonym_lookup_words(service.name_tokens))
+
+    desc_compound_dict = get_compound_descriptives(service, synonym_batch)
     service.set_compound_descriptive_name_tokens(update_compound_tokens(list(desc_compound_dict.keys()), match))
     service.token_classifier = wc_svc.classify_tokens(service.compound_descriptive_name_tokens)
     service._list_dist_words, service._list_desc_words, service._list_none_words = service.word_classification_tokens
@@ -225,7 +230,7 @@ def get_classification(service, stand_alone_words, syn_svc, match, wc_svc, token
             service.compound_descriptive_name_tokens,
         )
     service._list_dist_words, service._list_desc_words, dict_desc = check_synonyms(
-        syn_svc,
+        synonym_batch,
         stand_alone_words,
         service.get_list_dist(),
         service.get_list_desc(),
@@ -289,10 +294,10 @@ def subsequences(iterable, length):
     return [' '.join(iterable[i : i + length]) for i in range(len(iterable) - length + 1)]
 
 
-def get_valid_compound_descriptive(syn_svc, list_compound):
+def get_valid_compound_descriptive(synonym_batch, list_compound):
     desc_dist = {}
     for compound in list_compound:
-        substitution = syn_svc.get_word_synonyms(word=compound.replace(' ', '')).data
+        substitution = synonym_batch.get_synonyms(compound.replace(' ', ''))
         if substitution:
             desc_dist[compound] = substitution
 
@@ -328,16 +333,25 @@ def update_token_list(list_dist_desc, list_name):
     return list_name_updated
 
 
-def get_compound_descriptives(service, syn_svc):
+def get_compound_descriptives(service, synonym_batch):
     list_compound = []
     for i in range(2, len(service.name_tokens) + 1):
         list_compound.extend(subsequences(service.name_tokens, i))
 
-    desc_compound_dict_validated = get_valid_compound_descriptive(syn_svc, list_compound)
+    desc_compound_dict_validated = get_valid_compound_descriptive(synonym_batch, list_compound)
 
     return desc_compound_dict_validated
 
 
+def get_synonym_lookup_words(name_tokens):
+    """Return the tokens and every compound of tokens, with and without spaces, as get_classification looks them up."""
+    words = list(name_tokens)
+    for i in range(2, len(name_tokens) + 1):
+        for compound in subsequences(name_tokens, i):
+            words.extend([compound.replace(' ', ''), compound])
+    return words
+
+
 def remove_spaces_list(lst):
     return [x.replace(' ', '') for x in lst]
 
@@ -8,7 +8,12 @@ from flask import current_app
 
 from namex.models.request import Request
 from namex.services.name_request.auto_analyse import DataFrameFields
-from namex.utils.common import get_plural_singular_name, parse_dict_of_lists
+from namex.services.virtual_word_condition.condition_matcher import (
+    WORD_SPECIAL_USE,
+    WORDS_REQUIRING_CONSENT,
+    WORDS_TO_AVOID,
+)
+from namex.utils.common import parse_dict_of_lists
 
 from ..auto_analyse import MAX_LIMIT, MAX_MATCHES_LIMIT, AnalysisIssueCodes, porter
 from ..auto_analyse.abstract_name_analysis_builder import AbstractNameAnalysisBuilder, ProcedureResult
@@ -130,12 +135,8 @@ class NameAnalysisBuilder(AbstractNameAnalysisBuilder):
         result = ProcedureResult()
         result.is_valid = True
 
-        all_words_to_avoid_list = [word.lower() for word in self.word_condition_service.get_words_to_avoid()]
-        all_words_to_avoid_list.sort(key=len, reverse=True)
-
-        word_avoid_alternators = '|'.join(map(re.escape, all_words_to_avoid_list))
-        regex = re.compile(r'(?<!\w)({0})(?!\w)'.format(word_avoid_alternators))
-        word_avoid_compound_list = regex.findall(name.lower())
+        matcher = self.word_condition_service.get_condition_matcher()
+        word_avoid_compound_list = matcher.find_compound(name, WORDS_TO_AVOID)
 
         word_avoid_tokenized_list = [element.split(' ') for element in word_avoid_compound_list]
         word_avoid_tokenized_list = [item for sublist in word_avoid_tokenized_list for item in sublist]
@@ -310,21 +311,33 @@ class NameAnalysisBuilder(AbstractNameAnalysisBuilder):
         else:
             current_app.logger.debug('Search conflicts for APPROVED, CONDITIONAL, COND_RESERVED, RESERVED')
 
-        for key_dist, value_dist in dist_substitution_dict.items():
-            criteria = Request.get_general_query(change_filter, queue)
-            name_criteria = Request.get_distinctive_query(value_dist, stop_words, check_name_is_well_formed)
-            for key_desc, value_desc in desc_synonym_criteria_dict.items():
-                current_app.logger.debug(key_dist, ':DIST ', key_desc, ':DESC')
-                criteria = Request.get_descriptive_query(value_desc, criteria, name_criteria)
-                matches = Request.find_by_criteria_array(criteria, queue)
-                matches = self.skip_name_matches_processed(matches)
-                list_conflicts_details, forced = self.get_most_similar_names(
-                    dict_highest_counter, set(matches), dist_substitution_dict, desc_synonym_dict, list_name
-                )
-                list_details.extend(list_conflicts_details)
+        criteria = Request.get_general_query(change_filter, queue)
+        combinations = Request.get_combination_patterns(
+            dist_substitution_dict, desc_synonym_criteria_dict, stop_words, check_name_is_well_formed, len(criteria)
+        )
+        if not combinations:
+            return list_details, forced
 
-                if forced:
-                    return list_details, forced
+        # Every combination needs one of the distinctive words and, as the descriptive patterns accumulate, one of
+        # the first descriptive words, so only names with both are handed to the regexes.
+        criteria = Request.get_name_prefilter(
+            criteria,
+            [
+                [word for value_dist in dist_substitution_dict.values() for word in value_dist],
+                next(iter(desc_synonym_criteria_dict.values())),
+            ],
+        )
+        matches = Request.find_by_criteria_combinations(criteria, [patterns for _, patterns in combinations], queue)
+        # A name found by several combinations is kept for the first one, in the order they used to be searched.
+        matches = self.skip_name_matches_processed(sorted(matches, key=lambda match: match.combination))
+        current_app.logger.debug(
+            '{} new possible conflicts across {} DIST/DESC combinations'.format(len(matches), len(combinations))
+        )
+
+        # Scores don't depend on the combination a name was found by, so every candidate is analyzed in one batch.
+        list_details, forced = self.get_most_similar_names(
+            dict_highest_counter, set(matches), dist_substitution_dict, desc_synonym_dict, list_name
+        )
 
         return list_details, forced
 
@@ -377,26 +390,15 @@ class NameAnalysisBuilder(AbstractNameAnalysisBuilder):
         result = ProcedureResult()
         result.is_valid = True
 
-        all_words_consent_list = self.word_condition_service.get_words_requiring_consent()
-        words_consent_dict = {}
+        matcher = self.word_condition_service.get_condition_matcher()
+        words_consent_positions = set()
         word_consent_original_list = []
-        name_singular_plural_list = list(set(get_plural_singular_name(name)))
-
-        for name_sin_plural in name_singular_plural_list:
-            for words_consent in all_words_consent_list:
-                if re.search(r'\b{0}\b'.format(re.escape(words_consent.lower())), name_sin_plural.lower()):
-                    words_consent_dict.update(self.get_position_word_consent(words_consent, name_sin_plural))
-                    word_consent_original_list.append(words_consent)
-                elif re.search(
-                    r'\b{0}\b'.format(re.escape(words_consent.lower().replace(' ', ''))), name_sin_plural.lower()
-                ):
-                    words_consent_dict.update(
-                        self.get_position_word_consent(words_consent.lower().replace(' ', ''), name_sin_plural)
-                    )
-                    word_consent_original_list.append(words_consent)
+        for match in matcher.find_all(name, WORDS_REQUIRING_CONSENT):
+            words_consent_positions.update(range(match.start, match.end))
+            word_consent_original_list.append(match.words)
         word_consent_original_list = list(set(word_consent_original_list))
         words_consent_list_response = []
-        for key in sorted(words_consent_dict):
+        for key in sorted(words_consent_positions):
             words_consent_list_response.append(list_name[key])
 
         if words_consent_list_response:
@@ -411,17 +413,6 @@ class NameAnalysisBuilder(AbstractNameAnalysisBuilder):
 
         return result
 
-    def get_position_word_consent(self, words_consent, name_sin_plural):
-        word_consent_tokenized = words_consent.lower().split()
-        name_sin_plur_tokenized = name_sin_plural.split()
-        words_consent_dict = {}
-        for word in word_consent_tokenized:
-            if word.lower() in name_sin_plural:
-                idx = name_sin_plur_tokenized.index(word.lower())
-                words_consent_dict[idx] = word
-
-        return words_consent_dict
-
     def check_designation_existence(self, list_name, all_designations, all_designations_user):
         result = ProcedureResult()
         result.is_valid = True
@@ -532,13 +523,8 @@ class NameAnalysisBuilder(AbstractNameAnalysisBuilder):
         result = ProcedureResult()
         result.is_valid = True
 
-        all_word_special_use_list = self.word_condition_service.get_word_special_use()
-        all_word_special_use_list = [word.lower() for word in all_word_special_use_list]
-        all_word_special_use_list.sort(key=len, reverse=True)
-
-        word_special_alternators = '|'.join(map(re.escape, all_word_special_use_list))
-        regex = re.compile(r'(?<!\w)({0})(?!\w)'.format(word_special_alternators))
-        word_special_compound_list = regex.findall(name_processed.lower())
+        matcher = self.word_condition_service.get_condition_matcher()
+        word_special_compound_list = matcher.find_compound(name_processed, WORD_SPECIAL_USE)
 
         word_special_tokenized_list = [element.split(' ') for element in word_special_compound_list]
         word_special_tokenized_list = [item for sublist in word_special_tokenized_list for item in sublist if item]
@@ -3,10 +3,13 @@ import os
 import tempfile
 from enum import Enum
 from functools import wraps
+from http import HTTPStatus
 
 import requests
 from flask import current_app
 
+from namex.utils.token_cache import token_cache
+
 
 MSG_CLIENT_CREDENTIALS_REQ_FAILED = 'Client credentials request failed'
 MSG_INVALID_HTTP_VERB = 'Invalid HTTP verb'
@@ -149,21 +152,7 @@ class BaseClient:
 
     @staticmethod
     def get_client_credentials(auth_url, client_id, secret):
-        auth = requests.post(
-            auth_url,
-            auth=(client_id, secret),
-            headers={'Content-Type': 'application/x-www-form-urlencoded'},
-            data={'grant_type': 'client_credentials', 'client_id': client_id, 'client_secret': secret},
-        )
-
-        # Return the auth response if an error occurs
-        if auth.status_code != 200:
-            # TODO: This is mocked out
-            # return True, 'asdf-asdf-asdf-adsf'
-            return False, auth.json()
-
-        token = dict(auth.json())['access_token']
-        return True, token
+        return token_cache.get_token(auth_url, client_id, secret)
 
     def set_api_client_auth_header(self, token):
         self.set_api_client_request_header('Authorization', 'Bearer ' + token)
@@ -195,7 +184,8 @@ class BaseClient:
         try:
             if method not in HttpVerbs:
                 raise ApiClientError(message=MSG_INVALID_HTTP_VERB)
-            if not headers or 'Authorization' not in headers:
+            cached_token = not headers or 'Authorization' not in headers
+            if cached_token:
                 PAYMENT_SVC_AUTH_URL = current_app.config.get('PAYMENT_SVC_AUTH_URL')
                 PAYMENT_SVC_AUTH_CLIENT_ID = current_app.config.get('PAYMENT_SVC_AUTH_CLIENT_ID')
                 PAYMENT_SVC_CLIENT_SECRET = current_app.config.get('PAYMENT_SVC_CLIENT_SECRET')
@@ -222,6 +212,11 @@ class BaseClient:
             else:
                 response = requests.request(method.value, url, params=params, headers=headers)
 
+            if response.status_code == HTTPStatus.UNAUTHORIZED and cached_token:
+                # a revoked token would otherwise be sent again until it expires
+                token_cache.invalidate(
+                    current_app.config.get('PAYMENT_SVC_AUTH_URL'), current_app.config.get('PAYMENT_SVC_AUTH_CLIENT_ID')
+                )
             if not response or not response.ok:
                 raise ApiRequestError(response)
 
@@ -0,0 +1,239 @@
+"""Write-behind queue for the solr updates made by the name request endpoints.
+
+Adding or deleting a possible.conflicts document used to make a new solr client and wait for a hard commit inside the
+request. The indexer keeps the updates in a bounded in-process queue instead, and a background thread sends them every
+SOLR_INDEX_FLUSH_INTERVAL seconds on a pooled session, one update request per core, which solr commits within
+SOLR_INDEX_COMMIT_WITHIN milliseconds. A later update of the same document replaces the queued one, so the delete of a
+temporary NR number and the add of its real one go out together.
+
+When an update request fails its documents are sent one request each, so one bad document doesn't hold the others
+back. Documents solr rejects (4xx) are logged and dropped, the others are queued again, for up to
+SOLR_INDEX_MAX_RETRIES more flushes.
+
+When the queue is full the caller writes its own update, so a solr outage slows the requests down rather than growing
+the queue. With SOLR_INDEX_ASYNC off every update is written (and committed) before returning, as before.
+"""
+
+import atexit
+import json
+import threading
+import time
+
+import requests
+from flask import Flask
+from requests.adapters import HTTPAdapter
+
+from namex.services.name_request.exceptions import SolrUpdateError
+
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_FLUSH_INTERVAL = 1
+DEFAULT_COMMIT_WITHIN = 1000
+DEFAULT_TIMEOUT = 10
+DEFAULT_MAX_RETRIES = 5
+
+
+class SolrIndexer:
+    """Queues solr document adds and deletes, and writes them from a background thread."""
+
+    def __init__(self, app: Flask = None):
+        """Initializer, supports setting the app context on instantiation."""
+        self.app = None
+        self._pending = {}
+        self._retries = {}
+        self._queued_at = None
+        self._condition = threading.Condition()
+        self._worker = None
+        self._session = requests.Session()
+        self._session.mount('http://', HTTPAdapter(pool_maxsize=4))
+        self._session.mount('https://', HTTPAdapter(pool_maxsize=4))
+        self._metrics_hooks = []
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask):
+        """Keep the app for the background thread, and write what is still queued when the process exits."""
+        self.app = app
+        atexit.register(self.flush)
+
+    def add_metrics_hook(self, hook):
+        """Call hook(metrics) after every flush, with the metrics returned by get_metrics and the flush counts."""
+        self._metrics_hooks.append(hook)
+
+    def get_metrics(self) -> dict:
+        """Return the queue depth, and the age in seconds of the oldest queued update."""
+        with self._condition:
+            depth = len(self._pending)
+            lag = time.monotonic() - self._queued_at if self._queued_at is not None else 0
+        return {'depth': depth, 'lag': lag}
+
+    def add(self, solr_core: str, solr_docs: list):
+        """Add or replace the documents in the core."""
+        self._submit({(solr_core, doc['id']): ('add', doc) for doc in solr_docs})
+
+    def delete(self, solr_core: str, doc_id: str):
+        """Delete the document from the core."""
+        self._submit({(solr_core, doc_id): ('delete', None)})
+
+    def flush(self):
+        """Write everything that is queued now."""
+        with self._condition:
+            updates = self._take()
+        if updates:
+            with self.app.app_context():
+                self._write(updates)
+
+    def _submit(self, updates: dict):
+        config = self.app.config
+        if not config.get('SOLR_INDEX_ASYNC', True):
+            self._write_now(updates, commit=True)
+            return
+
+        with self._condition:
+            new_keys = sum(1 for key in updates if key not in self._pending)
+            if len(self._pending) + new_keys > config.get('SOLR_INDEX_QUEUE_SIZE', DEFAULT_QUEUE_SIZE):
+                full = True
+            else:
+                full = False
+                for key, update in updates.items():
+                    # re-inserted so the queue stays in the order the documents were last changed
+                    self._pending.pop(key, None)
+                    self._pending[key] = update
+                    self._retries.pop(key, None)
+                if self._queued_at is None:
+                    self._queued_at = time.monotonic()
+                self._start_worker()
+                self._condition.notify()
+
+        if full:
+            self.app.logger.warning('SOLR index queue is full, writing the update in the request')
+            self._write_now(updates, commit=False)
+
+    def _start_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='solr-indexer', daemon=True)
+            self._worker.start()
+
+    def _take(self) -> dict:
+        updates, self._pending, self._queued_at = self._pending, {}, None
+        return updates
+
+    def _run(self):
+        interval = self.app.config.get('SOLR_INDEX_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL)
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+            # give the rest of the request (and concurrent ones) the time to queue their updates
+            time.sleep(interval)
+            with self._condition:
+                updates = self._take()
+            with self.app.app_context():
+                failed, _ = self._write(updates)
+                self._requeue(updates, failed)
+
+    def _requeue(self, updates: dict, failed: dict):
+        """Put back what failed, unless it was changed again meanwhile or has used up its retries."""
+        max_retries = self.app.config.get('SOLR_INDEX_MAX_RETRIES', DEFAULT_MAX_RETRIES)
+        with self._condition:
+            for key in updates:
+                if key not in failed:
+                    self._retries.pop(key, None)
+            for key, update in failed.items():
+                if key in self._pending:
+                    continue
+                retries = self._retries.get(key, 0) + 1
+                if retries > max_retries:
+                    self.app.logger.error(
+                        f'SOLR index update of {key[1]} in {key[0]} dropped after {max_retries} retries'
+                    )
+                    self._retries.pop(key, None)
+                    continue
+                self._retries[key] = retries
+                self._pending[key] = update
+            if self._pending and self._queued_at is None:
+                self._queued_at = time.monotonic()
+
+    def _write_now(self, updates: dict, commit: bool):
+        failed, rejected = self._write(updates, commit=commit)
+        if failed or rejected:
+            doc_ids = [doc_id for _, doc_id in [*failed, *rejected]]
+            raise SolrUpdateError(f'Failed to update solr documents: {", ".join(doc_ids)}')
+
+    def _write(self, updates: dict, commit: bool = False) -> tuple:
+        """Send one update request per core, returning the updates that failed and those solr rejected.
+
+        When the request of a core fails its updates are sent one by one, until one fails for another reason than
+        solr rejecting the document (the core is then most likely down, and the rest are not tried).
+        """
+        by_core = {}
+        for (solr_core, doc_id), update in updates.items():
+            by_core.setdefault(solr_core, {})[(solr_core, doc_id)] = update
+
+        failed = {}
+        rejected = {}
+        for solr_core, core_updates in by_core.items():
+            try:
+                self._post_update(solr_core, core_updates, commit)
+            except Exception as err:
+                self.app.logger.error(f'SOLR index update of {solr_core} failed: {err}')
+                if len(core_updates) > 1:
+                    self._write_one_by_one(solr_core, core_updates, commit, failed, rejected)
+                else:
+                    (rejected if is_rejection(err) else failed).update(core_updates)
+
+        metrics = {
+            **self.get_metrics(),
+            'flushed': len(updates) - len(failed) - len(rejected),
+            'failed': len(failed),
+            'rejected': len(rejected),
+        }
+        for hook in self._metrics_hooks:
+            try:
+                hook(metrics)
+            except Exception as err:
+                self.app.logger.error(f'SOLR index metrics hook failed: {err}')
+        return failed, rejected
+
+    def _write_one_by_one(self, solr_core: str, updates: dict, commit: bool, failed: dict, rejected: dict):
+        remaining = list(updates.items())
+        while remaining:
+            key, update = remaining.pop(0)
+            try:
+                self._post_update(solr_core, {key: update}, commit)
+            except Exception as err:
+                self.app.logger.error(f'SOLR index update of {key[1]} in {solr_core} failed: {err}')
+                if is_rejection(err):
+                    rejected[key] = update
+                else:
+                    failed[key] = update
+                    failed.update(remaining)
+                    return
+
+    def _post_update(self, solr_core: str, updates: dict, commit: bool):
+        # a json update command can repeat its keys, which a dict can't, so it is joined by hand
+        commands = [
+            '"delete":' + json.dumps({'id': doc_id})
+            for (_, doc_id), (action, _) in updates.items()
+            if action == 'delete'
+        ]
+        commands += ['"add":' + json.dumps({'doc': doc}) for action, doc in updates.values() if action == 'add']
+        params = (
+            {'commit': 'true'}
+            if commit
+            else {'commitWithin': self.app.config.get('SOLR_INDEX_COMMIT_WITHIN', DEFAULT_COMMIT_WITHIN)}
+        )
+
+        response = self._session.post(
+            f'{self.app.config.get("SOLR_BASE_URL")}/solr/{solr_core}/update',
+            params=params,
+            data='{' + ','.join(commands) + '}',
+            headers={'Content-Type': 'application/json'},
+            timeout=self.app.config.get('SOLR_QUERY_TIMEOUT', DEFAULT_TIMEOUT),
+        )
+        response.raise_for_status()
+
+
+def is_rejection(err: Exception) -> bool:
+    """Return whether solr refused the update itself (a 4xx), which sending it again won't change."""
+    response = getattr(err, 'response', None)
+    return isinstance(err, requests.HTTPError) and response is not None and 400 <= response.status_code < 500
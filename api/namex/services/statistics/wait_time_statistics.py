@@ -1,10 +1,15 @@
 from datetime import datetime, timedelta
 
-from namex.models import Event, Request
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+
+from namex.models import Event, Request, WaitTimeStatistics, db
 from namex.services.statistics import response_keys
 from namex.utils.api_resource import handle_exception
 from namex.utils.sql_alchemy import query_result_to_dict
 
+STATISTICS_MAX_AGE = timedelta(days=1)
+
 
 class WaitTimeStatsService:
     def __init__(self):
@@ -34,8 +39,23 @@ class WaitTimeStatsService:
 
     @classmethod
     def get_statistics(cls):
-        priority_wait_time = Request.get_waiting_time(priority_queue=True) or 0
-        regular_wait_time = Request.get_waiting_time(priority_queue=False) or 0
+        # precomputed by the first call of the day, the endpoint caches the response on top of this
+        statistics = WaitTimeStatistics.get_latest(max_age=STATISTICS_MAX_AGE)
+        if statistics is None:
+            try:
+                statistics = WaitTimeStatistics.refresh()
+            except SQLAlchemyError as err:
+                current_app.logger.error(f'Refreshing the wait time statistics failed: {err}')
+                db.session.rollback()
+                # older statistics are better than none, or than computing them on every request
+                statistics = WaitTimeStatistics.get_latest()
+
+        if statistics is not None:
+            priority_wait_time = statistics.priorityWaitTime or 0
+            regular_wait_time = statistics.regularWaitTime or 0
+        else:
+            priority_wait_time = Request.get_waiting_time(priority_queue=True) or 0
+            regular_wait_time = Request.get_waiting_time(priority_queue=False) or 0
 
         response_values = [0, priority_wait_time, regular_wait_time]
         response = query_result_to_dict(response_keys, response_values)
@@ -0,0 +1,165 @@
+"""Matcher of the words to avoid, words requiring consent and words of special use in a name.
+
+The words of every virtual_word_condition row are kept in a trie of their tokens, built once per process and rebuilt
+when the table changes (see VERSION_SQL), so a name is checked against all of them in one pass over its tokens.
+"""
+
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+
+import inflect
+from sqlalchemy import text
+
+from namex.criteria.virtual_word_condition.query_criteria import VirtualWordConditionCriteria
+from namex.models import VirtualWordCondition
+from namex.utils.common import flatten_tuple_results, get_plural_singular_words
+from namex.utils.versioned_cache import VersionedCache
+
+# Bumped by triggers on virtual_word_condition, whoever changes it (the admin app edits it too).
+VERSION_SQL = text('SELECT version FROM virtual_word_condition_version')
+
+WORDS_TO_AVOID = 'words_to_avoid'
+WORDS_REQUIRING_CONSENT = 'words_requiring_consent'
+WORD_SPECIAL_USE = 'word_special_use'
+
+# Names scanned by each matcher, so the checks of one analysis share the pass over the name.
+SCAN_CACHE_SIZE = 256
+
+
+def get_condition_category(allow_use, consent_required):
+    """Return the category of the condition, None for a condition in none of them (unset flags)."""
+    if allow_use is False:
+        return WORDS_TO_AVOID
+    if allow_use and consent_required:
+        return WORDS_REQUIRING_CONSENT
+    if allow_use and consent_required is False:
+        return WORD_SPECIAL_USE
+    return None
+
+
+@dataclass(frozen=True)
+class ConditionMatch:
+    """Words of a condition found in the tokens start to end (excluded) of a name."""
+
+    start: int
+    end: int
+    category: str
+    words: str
+    # False when the name has a singular / plural form of the words rather than the words themselves
+    exact: bool
+
+
+class _Node:
+    __slots__ = ('children', 'words')
+
+    def __init__(self):
+        self.children = {}
+        self.words = []
+
+
+class ConditionMatcher:
+    """Trie of the lower case tokens of the condition words, with the category and original words at their ends.
+
+    Words requiring consent are also added without their spaces, as the name may have them as one word.
+    """
+
+    def __init__(self, conditions):
+        """conditions is a list of (words, category) pairs."""
+        self._root = _Node()
+        self._inflect = inflect.engine()
+        self._lock = threading.Lock()
+        for words, category in conditions:
+            self._add(words.lower().split(), category, words)
+            if category == WORDS_REQUIRING_CONSENT and ' ' in words.strip():
+                self._add([words.lower().replace(' ', '')], category, words)
+        self.scan = lru_cache(maxsize=SCAN_CACHE_SIZE)(self._scan)
+
+    def _add(self, tokens, category, words):
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.children.setdefault(token, _Node())
+        node.words.append((category, words))
+
+    def _get_forms(self, token):
+        # inflect is not thread safe
+        with self._lock:
+            return get_plural_singular_words(token, self._inflect)
+
+    def _scan(self, name: str) -> tuple:
+        """Return every ConditionMatch in the name, whose tokens are its words split on spaces."""
+        tokens = name.split()
+        forms = [None] * len(tokens)
+        matches = []
+        for start in range(len(tokens)):
+            states = [(self._root, True)]
+            for end in range(start, len(tokens)):
+                if forms[end] is None:
+                    forms[end] = self._get_forms(tokens[end])
+                token = tokens[end].lower()
+                next_states = {}
+                for node, exact in states:
+                    for form in forms[end]:
+                        if child := node.children.get(form):
+                            next_states[child] = next_states.get(child, False) or (exact and form == token)
+                if not next_states:
+                    break
+                for node, exact in next_states.items():
+                    matches.extend(
+                        ConditionMatch(start, end + 1, category, words, exact) for category, words in node.words
+                    )
+                states = next_states.items()
+        return tuple(matches)
+
+    def find_compound(self, name: str, category: str) -> list:
+        """Return the words of the category found as written in the name, like a regex alternation of the words
+        (longest first) would: leftmost, longest and not overlapping.
+        """
+        tokens = name.lower().split()
+        longest = {}
+        for match in self.scan(name):
+            if match.category == category and match.exact and match.end > longest.get(match.start, match.start):
+                longest[match.start] = match.end
+
+        compound = []
+        position = 0
+        while position < len(tokens):
+            if end := longest.get(position):
+                compound.append(' '.join(tokens[position:end]))
+                position = end
+            else:
+                position += 1
+        return compound
+
+    def find_all(self, name: str, category: str) -> list:
+        """Return every match of the category in the name, singular / plural forms included."""
+        return [match for match in self.scan(name) if match.category == category]
+
+
+class ConditionMatcherCache(VersionedCache):
+    """The condition matcher of this process, rebuilt when virtual_word_condition changes."""
+
+    version_sql = VERSION_SQL
+
+    def get_matcher(self) -> ConditionMatcher:
+        return self.get()
+
+    @staticmethod
+    def load() -> ConditionMatcher:
+        model = VirtualWordCondition
+        criteria = VirtualWordConditionCriteria(
+            fields=[model.rc_words, model.rc_allow_use, model.rc_consent_required],
+            filters=[model.rc_words.isnot(None)],
+        )
+        conditions = []
+        for rc_words, allow_use, consent_required in model.find_by_criteria(criteria):
+            if not (category := get_condition_category(allow_use, consent_required)):
+                continue
+            for words in filter(None, map(str.strip, flatten_tuple_results([(rc_words,)]))):
+                conditions.append((words, category))
+        return ConditionMatcher(conditions)
+
+
+condition_matcher_cache = ConditionMatcherCache()
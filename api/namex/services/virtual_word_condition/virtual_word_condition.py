@@ -5,6 +5,8 @@ from namex.criteria.virtual_word_condition.query_criteria import VirtualWordCond
 from namex.models import VirtualWordCondition
 from namex.utils.common import flatten_tuple_results
 
+from .condition_matcher import condition_matcher_cache
+
 
 class VirtualWordConditionService:
     _model = None
@@ -15,6 +17,10 @@ class VirtualWordConditionService:
     def get_model(self):
         return self._model
 
+    def get_condition_matcher(self):
+        """Return the matcher of the words to avoid, requiring consent and of special use, cached per process."""
+        return condition_matcher_cache.get_matcher()
+
     def get_words_to_avoid(self):
         model = self.get_model()
 
@@ -1,10 +1,7 @@
 from enum import Enum
 
-import pandas as pd
 from flask import current_app
 
-from ..name_request.auto_analyse.name_analysis_utils import data_frame_to_list
-
 
 class DataFrameFields(Enum):
     FIELD_SYNONYMS = 'synonyms_text'
@@ -107,30 +104,30 @@ class TokenClassifier:
 
     def _classify_tokens(self, word_tokens):
         try:
-            cf = pd.DataFrame(columns=['word', 'word_classification'])
-
             wc_svc = self.word_classification_service
 
-            # Get the word classification for each word in the supplied name name
+            # Get the word classification for all the words in the supplied name at once
+            classifications = wc_svc.find_classifications(word_tokens)
+            word_lists = {
+                DataFrameFields.DISTINCTIVE.value: [],
+                DataFrameFields.DESCRIPTIVE.value: [],
+                DataFrameFields.UNCLASSIFIED.value: [],
+            }
+
             for word in word_tokens:
-                word_classification = wc_svc.find_one(word)
-                new_row = []
+                word_classification = classifications.get(word.lower())
                 if not word_classification:
                     current_app.logger.debug('No word classification found for: ' + word)
-                    new_row.append(
-                        {'word': word.lower().strip(), 'word_classification': DataFrameFields.UNCLASSIFIED.value}
-                    )
+                    word_lists[DataFrameFields.UNCLASSIFIED.value].append(word.lower().strip())
                 else:
                     for row in word_classification:
-                        new_row.append(
-                            {'word': word.lower().strip(), 'word_classification': row.classification.strip()}
-                        )
-
-                cf = cf.append(new_row, ignore_index=True)
+                        word_list = word_lists.get(row.classification.strip())
+                        if word_list is not None:
+                            word_list.append(word.lower().strip())
 
-            self.distinctive_word_tokens, self.descriptive_word_tokens, self.unclassified_word_tokens = (
-                data_frame_to_list(cf)
-            )
+            self.distinctive_word_tokens = word_lists[DataFrameFields.DISTINCTIVE.value]
+            self.descriptive_word_tokens = word_lists[DataFrameFields.DESCRIPTIVE.value]
+            self.unclassified_word_tokens = word_lists[DataFrameFields.UNCLASSIFIED.value]
 
         except Exception as error:
             current_app.logger.error('Token classification failed! ' + repr(error))
@@ -1,10 +1,19 @@
+import time
 from datetime import datetime
 
+from flask import current_app
+
 from namex.models import User, WordClassification
 
 # from namex.services.name_request.utils import get_or_create_user_by_jwt
 from .token_classifier import TokenClassifier
 
+DEFAULT_CACHE_TTL = 60
+MAX_CACHED_WORDS = 50000
+
+# lower-cased word -> (expires_at, word classification rows), shared by every service in the process
+_classifications = {}
+
 
 class WordClassificationService:
     def __init__(self):
@@ -13,6 +22,40 @@ class WordClassificationService:
     def find_one(self, word=None):
         return WordClassification.find_word_classification(word)
 
+    def find_classifications(self, words):
+        """Return the word classification rows of every word, keyed by the lower-cased word.
+
+        Words classified within WORD_CLASSIFICATION_CACHE_TTL come from the cache, the rest are looked up together
+        in a single query. A word with no classification maps to an empty list.
+        """
+        now = time.monotonic()
+        classifications, missing = {}, []
+        for word in {word.lower() for word in words}:
+            cached = _classifications.get(word)
+            if cached and cached[0] > now:
+                classifications[word] = cached[1]
+            else:
+                missing.append(word)
+
+        if missing:
+            found = {word: [] for word in missing}
+            for row in WordClassification.find_words_classification(missing):
+                found[row.token].append(row)
+
+            if len(_classifications) > MAX_CACHED_WORDS:
+                _classifications.clear()
+            expires_at = now + current_app.config.get('WORD_CLASSIFICATION_CACHE_TTL', DEFAULT_CACHE_TTL)
+            for word, rows in found.items():
+                _classifications[word] = (expires_at, rows)
+            classifications.update(found)
+
+        return classifications
+
+    @staticmethod
+    def invalidate_classifications():
+        """Forget the cached classifications, for when an examiner classifies a word."""
+        _classifications.clear()
+
     def find_one_by_class(word=None, classification=None):
         return WordClassification.find_word_by_classification(word, classification)
 
@@ -30,6 +73,7 @@ class WordClassificationService:
         entity.last_updated_by = user_id
 
         entity.save_to_db()
+        cls.invalidate_classifications()
 
         return entity
 
@@ -42,6 +86,7 @@ class WordClassificationService:
             word.last_updated_by = user_id
 
         word.save_to_db()
+        cls.invalidate_classifications()
 
         return word
 
@@ -1,11 +1,11 @@
 import string
 
-import requests
 from flask import Request, current_app
 from flask_jwt_oidc.jwt_manager import JwtManager
 from jose import jwt
 
 from namex.models import Request as RequestDAO
+from namex.utils.token_cache import token_cache
 
 
 def cors_preflight(methods):
@@ -104,21 +104,8 @@ MSG_CLIENT_CREDENTIALS_REQ_FAILED = 'Client credentials request failed'
 
 
 def get_client_credentials(auth_url, client_id, secret):
-    auth = requests.post(
-        auth_url,
-        auth=(client_id, secret),
-        headers={'Content-Type': 'application/x-www-form-urlencoded'},
-        data={'grant_type': 'client_credentials', 'client_id': client_id, 'client_secret': secret},
-    )
-
-    # Return the auth response if an error occurs
-    if auth.status_code != 200:
-        # TODO: This is mocked out
-        # return True, 'asdf-asdf-asdf-adsf'
-        return False, auth.json()
-
-    token = dict(auth.json())['access_token']
-    return True, token
+    """Return (True, token) for the service account, reusing the process' token until it is about to expire."""
+    return token_cache.get_token(auth_url, client_id, secret)
 
 
 def validate_roles(_jwt: JwtManager, authorization: str, required_roles):
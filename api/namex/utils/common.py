@@ -73,19 +73,24 @@ def remove_periods_designation(results):
     return designation_list
 
 
+def get_plural_singular_words(word, engine=None):
+    p = engine or inflect.engine()
+    val = []
+    singular = p.singular_noun(word)
+    plural = p.plural_noun(word)
+    if singular:
+        val.append(singular.lower())
+    if plural:
+        val.append(plural.lower())
+    val.append(word.lower())
+    return list(set(val))
+
+
 def get_plural_singular_name(name):
     d = {}
     p = inflect.engine()
     for word in name.split():
-        val = []
-        singular = p.singular_noun(word)
-        plural = p.plural_noun(word)
-        if singular:
-            val.append(singular.lower())
-        if plural:
-            val.append(plural.lower())
-        val.append(word.lower())
-        d[word] = list(set(val))
+        d[word] = get_plural_singular_words(word, p)
 
     name_list = []
     for combination in product(*d.values()):
@@ -0,0 +1,84 @@
+"""
+Keyset (cursor) paging and estimated counts for the large searches.
+
+OFFSET paging reads and throws away every row before the page, and the exact count(*) walks the whole filtered set
+on every call. With keyset paging the cursor carries the sort values of the last row returned, and the next page
+starts right after it. The estimated count is the planner's row estimate for the filtered query.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+
+from sqlalchemy import and_, false, or_
+from sqlalchemy.types import Date, DateTime
+
+
+class CursorError(ValueError):
+    """The cursor could not be decoded, or was made for a different sort order."""
+
+
+def encode_cursor(order, values):
+    """Return the opaque cursor for the row with the given sort values, for the normalized order string."""
+    payload = {
+        'order': order,
+        'values': [value.isoformat() if isinstance(value, (date, datetime)) else value for value in values],
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode('utf-8')).decode('utf-8')
+
+
+def decode_cursor(cursor, order, columns):
+    """Return the sort values held by the cursor, converted back to the types of the columns they sort."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode('utf-8')))
+        values = payload['values']
+    except (ValueError, TypeError, KeyError) as err:
+        raise CursorError('cursor is not valid') from err
+
+    if payload.get('order') != order or len(values) != len(columns):
+        raise CursorError('cursor does not match the requested order')
+
+    try:
+        return [_parse_value(column, value) for column, value in zip(columns, values)]
+    except (ValueError, TypeError) as err:
+        raise CursorError('cursor is not valid') from err
+
+
+def _parse_value(column, value):
+    if value is None:
+        return None
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column.type, Date):
+        return date.fromisoformat(value)
+    return value
+
+
+def get_keyset_filter(order_by, values):
+    """Filter for the rows that sort after the given values.
+
+    order_by is a list of (column, 'asc' | 'desc'), sorted with NULLS LAST, that must end in a unique column.
+    """
+    conditions = []
+    ties = []
+    for (column, direction), value in zip(order_by, values):
+        if value is None:
+            # nothing sorts after a NULL, only the rows tied on it can come next
+            ties.append(column.is_(None))
+            continue
+        after = column > value if direction == 'asc' else column < value
+        conditions.append(and_(*ties, or_(after, column.is_(None))))
+        ties.append(column == value)
+
+    return or_(*conditions) if conditions else false()
+
+
+def estimate_count(session, statement):
+    """Return the planner's estimate of the number of rows the statement returns, without running it."""
+    connection = session.connection()
+    compiled = statement.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql('EXPLAIN (FORMAT JSON) {}'.format(compiled), compiled.params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]['Plan']['Plan Rows'])
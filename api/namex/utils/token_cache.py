@@ -0,0 +1,86 @@
+"""Process-wide cache of OAuth client credentials tokens.
+
+Every payment, receipt, report and entity call used to request a new service account token first. Tokens are now
+kept per (auth URL, client id) until shortly before they expire, and when several threads need a new token at
+the same time only one of them asks the identity server.
+"""
+
+import threading
+import time
+
+import requests
+
+# Refresh this many seconds before the token expires (or half way through its lifetime if that is sooner).
+DEFAULT_REFRESH_MARGIN = 30
+
+
+def fetch_client_credentials(auth_url, client_id, secret):
+    """Request a client credentials token, returning (True, token response) or (False, error response)."""
+    auth = requests.post(
+        auth_url,
+        auth=(client_id, secret),
+        headers={'Content-Type': 'application/x-www-form-urlencoded'},
+        data={'grant_type': 'client_credentials', 'client_id': client_id, 'client_secret': secret},
+    )
+
+    # Return the auth response if an error occurs
+    if auth.status_code != 200:
+        return False, auth.json()
+
+    return True, dict(auth.json())
+
+
+class TokenCache:
+    """Client credentials tokens keyed by (auth URL, client id), refreshed shortly before they expire."""
+
+    def __init__(self, fetch=fetch_client_credentials, refresh_margin=DEFAULT_REFRESH_MARGIN):
+        self._fetch = fetch
+        self._refresh_margin = refresh_margin
+        self._tokens = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, auth_url, client_id, secret):
+        """Return (True, access token), or (False, error response) when the identity server refuses."""
+        key = (auth_url, client_id)
+        token = self._get_valid(key)
+        if token:
+            return True, token
+
+        with self._get_lock(key):
+            # Another thread may have refreshed the token while this one waited.
+            token = self._get_valid(key)
+            if token:
+                return True, token
+
+            authenticated, response = self._fetch(auth_url, client_id, secret)
+            if not authenticated:
+                return False, response
+
+            token = response['access_token']
+            expires_in = response.get('expires_in')
+            if expires_in:
+                expires_in = int(expires_in)
+                refresh_at = time.monotonic() + expires_in - min(self._refresh_margin, expires_in / 2)
+                self._tokens[key] = (token, refresh_at)
+            return True, token
+
+    def invalidate(self, auth_url, client_id):
+        """Drop a cached token, e.g. after the API it was sent to rejected it."""
+        self._tokens.pop((auth_url, client_id), None)
+
+    def clear(self):
+        self._tokens.clear()
+
+    def _get_valid(self, key):
+        cached = self._tokens.get(key)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        return None
+
+    def _get_lock(self, key):
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+
+token_cache = TokenCache()
@@ -0,0 +1,36 @@
+"""Values loaded from the database once per process and reloaded when the tables they come from change.
+
+Each value has a one row version table, bumped by triggers on its source tables in the same transaction as the change
+(see the restricted_words_version and virtual_word_condition_version migrations). The version is read on every use,
+which is a single row select, and the value is only loaded again when it has moved.
+"""
+
+import threading
+
+from namex.models import db
+
+
+class VersionedCache:
+    """A value of this process, loaded by load() and reloaded whenever the row of version_sql moves."""
+
+    version_sql = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._value = None
+
+    def get(self):
+        """Return the value, loading it first if this is the first use or the version has moved since."""
+        version = db.session.execute(self.version_sql).scalar()
+        if self._value is None or version != self._version:
+            with self._lock:
+                if self._value is None or version != self._version:
+                    # the version is read before the value, so a change committed while it loads is picked up next time
+                    self._value = self.load()
+                    self._version = version
+        return self._value
+
+    def load(self):
+        """Load the value from the database."""
+        raise NotImplementedError
@@ -0,0 +1,166 @@
+"""Benchmark the conflict search regexes with and without the names trigram prefilter.
+
+Generates a names table in a scratch schema of the test database (DATABASE_TEST_* settings), then times the
+combined DIST/DESC conflict query and the exact match query:
+
+    1. regex filters only, no trigram index (what a conflict search used to cost),
+    2. regex filters only, with ix_names_conflict_search_trgm (the regexes alone can't use it),
+    3. regex filters plus Request.get_name_prefilter, with the index.
+
+Usage:
+    python -m tests.benchmarks.conflict_search_index --rows 1000000
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import and_, create_engine, func, or_, select, text
+
+from config import TestConfig
+from namex.criteria.request.query_criteria import RequestConditionCriteria
+from namex.models import Name, Request
+
+SCHEMA = 'conflict_search_benchmark'
+
+# Real words mixed into the generated vocabulary so the searched words have hits.
+SEED_WORDS = [
+    'mountain', 'mount', 'view', 'vista', 'bakery', 'bake', 'bakehouse', 'cafe', 'coffee', 'pacific', 'north',
+    'construction', 'holdings', 'consulting', 'summit', 'ridge', 'valley', 'services', 'group', 'island',
+]
+
+DIST_SUBSTITUTIONS = {'mountain': ['mountain', 'mount', 'summit'], 'pacific': ['pacific']}
+DESC_SYNONYMS = {'bakery': ['bakery', 'bake', 'bakehouse'], 'cafe': ['cafe', 'coffee']}
+STOP_WORDS = 'the|and|of|a|an'
+EXACT_MATCH_WORDS = ['mountain', 'view', 'bakery']
+
+
+def generate_names(conn, rows):
+    conn.execute(text('DROP SCHEMA IF EXISTS {0} CASCADE'.format(SCHEMA)))
+    conn.execute(text('CREATE SCHEMA {0}'.format(SCHEMA)))
+    conn.execute(text('CREATE TABLE {0}.names (id serial PRIMARY KEY, name varchar(1024))'.format(SCHEMA)))
+    conn.execute(
+        text(
+            'WITH vocab AS ('
+            '  SELECT array_agg(word) AS words, count(*) AS total FROM ('
+            '    SELECT substr(md5(i::text), 1, 4 + i % 6) AS word FROM generate_series(1, 20000) i'
+            '    UNION ALL SELECT unnest(CAST(:seed_words AS text[]))) w)'
+            ' INSERT INTO {0}.names (name)'
+            " SELECT upper(words[1 + floor(random() * total)::int] || (ARRAY[' ', '-', ''])[1 + (n % 3)]"
+            "   || words[1 + floor(random() * total)::int] || ' '"
+            "   || words[1 + floor(random() * total)::int] || ' '"
+            "   || (ARRAY['LTD.', 'INC.', 'CORP.', 'LIMITED', 'SOCIETY'])[1 + (n % 5)])"
+            ' FROM vocab, generate_series(1, :rows) n'.format(SCHEMA)
+        ),
+        {'seed_words': SEED_WORDS, 'rows': rows},
+    )
+    conn.execute(text('ANALYZE {0}.names'.format(SCHEMA)))
+
+
+def create_index(conn):
+    conn.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    search_column = compile_sql(conn, Name.conflict_search_column())
+    conn.execute(
+        text(
+            'CREATE INDEX ix_names_conflict_search_trgm ON {0}.names USING gin ({1} gin_trgm_ops)'.format(
+                SCHEMA, search_column
+            )
+        )
+    )
+    conn.execute(text('ANALYZE {0}.names'.format(SCHEMA)))
+
+
+def compile_sql(conn, clause):
+    # The connected dialect knows whether backslashes in the regex literals need escaping.
+    return str(clause.compile(dialect=conn.dialect, compile_kwargs={'literal_binds': True}))
+
+
+def get_filters(criteria):
+    return [element for filter_group in criteria.filters for element in filter_group]
+
+
+def conflict_query(prefilter):
+    combinations = Request.get_combination_patterns(DIST_SUBSTITUTIONS, DESC_SYNONYMS, STOP_WORDS, False)
+    criteria = [RequestConditionCriteria(fields=[Name.name], filters=[])]
+    if prefilter:
+        criteria = Request.get_name_prefilter(
+            criteria,
+            [[word for words in DIST_SUBSTITUTIONS.values() for word in words], next(iter(DESC_SYNONYMS.values()))],
+        )
+    regexes = [
+        and_(*[func.lower(Name.name).op('~')(pattern) for pattern in patterns]) for _, (patterns,) in combinations
+    ]
+    return select(Name.name).where(and_(*get_filters(criteria[0]))).where(or_(*regexes))
+
+
+def exact_match_query(prefilter):
+    criteria = [RequestConditionCriteria(fields=[Name.name], filters=[])]
+    designations = (['inc'], ['ltd', 'limited'], ['the', 'and'])
+    if prefilter:
+        any_designations, end_designations, stop_words = designations
+        criteria = Request.get_query_exact_match(
+            criteria,
+            EXACT_MATCH_WORDS,
+            ['mountain', 'view'],
+            ['bakery'],
+            end_designations,
+            any_designations,
+            stop_words,
+        )
+    else:
+        name = Request.set_special_characters_distinctive(['mountain', 'view'])
+        name += Request.set_special_characters_descriptive(['bakery'])
+        criteria = Request.get_designations_in_name(criteria, name, *designations)
+    return select(Name.name).where(and_(*get_filters(criteria[0])))
+
+
+def time_query(conn, sql, runs):
+    timings = []
+    rows = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        rows = len(conn.execute(text(sql)).fetchall())
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), rows
+
+
+def report(conn, label, sql, runs):
+    elapsed, rows = time_query(conn, sql, runs)
+    plan = conn.execute(text('EXPLAIN ' + sql)).fetchall()
+    uses_index = any('ix_names_conflict_search_trgm' in line[0] for line in plan)
+    print('{0:<55} {1:>9.1f} ms {2:>7} rows  index={3}'.format(label, elapsed * 1000, rows, uses_index))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000, help='number of generated names')
+    parser.add_argument('--runs', type=int, default=5, help='timed runs per query, the median is reported')
+    parser.add_argument('--keep', action='store_true', help='keep the generated schema')
+    args = parser.parse_args()
+
+    engine = create_engine(TestConfig.SQLALCHEMY_DATABASE_URI)
+    queries = {
+        'conflicts': (conflict_query(False), conflict_query(True)),
+        'exact match': (exact_match_query(False), exact_match_query(True)),
+    }
+
+    with engine.begin() as conn:
+        print('Generating {0} names...'.format(args.rows))
+        generate_names(conn, args.rows)
+        conn.execute(text('SET search_path TO {0}, public'.format(SCHEMA)))
+
+        for name, (regex_only, _) in queries.items():
+            report(conn, '{0}: regexes, no index'.format(name), compile_sql(conn, regex_only), args.runs)
+
+        create_index(conn)
+        for name, (regex_only, prefiltered) in queries.items():
+            report(conn, '{0}: regexes, trigram index'.format(name), compile_sql(conn, regex_only), args.runs)
+            label = '{0}: regexes + prefilter, trigram index'.format(name)
+            report(conn, label, compile_sql(conn, prefiltered), args.runs)
+
+        if not args.keep:
+            conn.execute(text('DROP SCHEMA {0} CASCADE'.format(SCHEMA)))
+
+
+if __name__ == '__main__':
+    main()
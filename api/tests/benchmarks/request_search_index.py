@@ -0,0 +1,188 @@
+"""Benchmark the examiner and NR searches with and without the requests / applicants trigram indexes.
+
+Generates requests and applicants tables in a scratch schema of the test database (DATABASE_TEST_* settings), then
+times the substring searches of Requests.get and RequestSearch.get:
+
+    1. the queries as they were written before, no trigram indexes,
+    2. the same queries with the indexes from migration f1cbb9b410d5,
+    3. the current queries (Request.get_name_search_filter etc.) with the indexes.
+
+Usage:
+    python -m tests.benchmarks.request_search_index --rows 3000000
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import and_, create_engine, func, or_, select, text
+
+from config import TestConfig
+from namex.models import Applicant, Request
+
+from .conflict_search_index import SEED_WORDS, compile_sql
+
+SCHEMA = 'request_search_benchmark'
+
+TRIGRAM_INDEXES = [
+    ('ix_requests_name_search_trgm', 'requests', 'name_search'),
+    ('ix_requests_nr_num_trgm', 'requests', 'nr_num'),
+    ('ix_applicants_first_name_trgm', 'applicants', 'first_name'),
+    ('ix_applicants_last_name_trgm', 'applicants', 'last_name'),
+]
+
+COMP_NAME = 'mountain view'
+NR_NUM = 'NR 12345'
+APPLICANT_NAME = 'summit'
+SEARCH_WORDS = ['pacific', 'bakery']
+
+
+def generate_requests(conn, rows):
+    conn.execute(text('DROP SCHEMA IF EXISTS {0} CASCADE'.format(SCHEMA)))
+    conn.execute(text('CREATE SCHEMA {0}'.format(SCHEMA)))
+    conn.execute(
+        text(
+            'CREATE TABLE {0}.requests (id serial PRIMARY KEY, nr_num varchar(10) UNIQUE, state_cd varchar(40),'
+            ' submitted_date timestamptz, name_search varchar(3078))'.format(SCHEMA)
+        )
+    )
+    conn.execute(
+        text(
+            'CREATE TABLE {0}.applicants (party_id serial PRIMARY KEY, nr_id integer,'
+            ' first_name varchar(50), last_name varchar(50))'.format(SCHEMA)
+        )
+    )
+    # Every request gets three name choices made of random words, formatted like Name.update_nr_name_search does.
+    conn.execute(
+        text(
+            'WITH vocab AS ('
+            '  SELECT array_agg(word) AS words, count(*) AS total FROM ('
+            '    SELECT substr(md5(i::text), 1, 4 + i % 6) AS word FROM generate_series(1, 20000) i'
+            '    UNION ALL SELECT unnest(CAST(:seed_words AS text[]))) w)'
+            ' INSERT INTO {0}.requests (nr_num, state_cd, submitted_date, name_search)'
+            " SELECT 'NR ' || lpad(n::text, 7, '0'),"
+            "   (ARRAY['DRAFT', 'APPROVED', 'REJECTED', 'CANCELLED', 'INPROGRESS'])[1 + (n % 5)],"
+            "   now() - n * interval '1 minute',"
+            "   upper('(' || string_agg('|' || c || words[1 + floor(random() * total)::int] || ' '"
+            "     || words[1 + floor(random() * total)::int] || ' LTD.' || c || '|', '' ORDER BY c) || ')')"
+            ' FROM vocab, generate_series(1, :rows) n, generate_series(1, 3) c'
+            ' GROUP BY n'.format(SCHEMA)
+        ),
+        {'seed_words': SEED_WORDS, 'rows': rows},
+    )
+    conn.execute(
+        text(
+            'WITH vocab AS ('
+            '  SELECT array_agg(word) AS words, count(*) AS total FROM ('
+            '    SELECT substr(md5(i::text), 1, 4 + i % 6) AS word FROM generate_series(1, 20000) i'
+            '    UNION ALL SELECT unnest(CAST(:seed_words AS text[]))) w)'
+            ' INSERT INTO {0}.applicants (nr_id, first_name, last_name)'
+            ' SELECT r.id, upper(words[1 + floor(random() * total)::int]),'
+            '   upper(words[1 + floor(random() * total)::int])'
+            ' FROM vocab, {0}.requests r'.format(SCHEMA)
+        ),
+        {'seed_words': SEED_WORDS},
+    )
+    conn.execute(text('ANALYZE {0}.requests'.format(SCHEMA)))
+    conn.execute(text('ANALYZE {0}.applicants'.format(SCHEMA)))
+
+
+def create_indexes(conn):
+    conn.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    for index_name, table_name, column_name in TRIGRAM_INDEXES:
+        conn.execute(
+            text(
+                'CREATE INDEX {0} ON {1}.{2} USING gin ({3} gin_trgm_ops)'.format(
+                    index_name, SCHEMA, table_name, column_name
+                )
+            )
+        )
+    conn.execute(text('ANALYZE {0}.requests'.format(SCHEMA)))
+    conn.execute(text('ANALYZE {0}.applicants'.format(SCHEMA)))
+
+
+def count_query(*filters, applicants=False):
+    # Requests.get counts the whole filtered set for numFound, which is where the substring filters cost the most.
+    query = select(func.count()).select_from(Request)
+    if applicants:
+        query = query.join(Applicant, Applicant.nrId == Request.id)
+    return query.where(Request.nrNum.notlike('NR L%'), *filters)
+
+
+def search_query(*filters):
+    return (
+        select(Request.id, Request.nrNum)
+        .where(Request.stateCd.in_(['DRAFT', 'INPROGRESS', 'REFUND_REQUESTED']), or_(*filters))
+        .order_by(Request.submittedDate.desc())
+        .limit(10)
+    )
+
+
+def previous_queries():
+    comp_name = COMP_NAME.replace(' ', '%')
+    return {
+        'compName': count_query(
+            or_(*[Request.nameSearch.ilike('%|{0}%{1}%{0}|%'.format(c, comp_name)) for c in (1, 2, 3)])
+        ),
+        'nrNum': count_query(Request.nrNum.like('%' + NR_NUM + '%')),
+        'firstName': count_query(Applicant.firstName.ilike('%' + APPLICANT_NAME + '%'), applicants=True),
+        'lastName': count_query(Applicant.lastName.ilike('%' + APPLICANT_NAME + '%'), applicants=True),
+        'search': search_query(and_(*[Request.nameSearch.ilike('%' + word + '%') for word in SEARCH_WORDS])),
+    }
+
+
+def current_queries():
+    queries = previous_queries()
+    queries['compName'] = count_query(Request.get_name_search_filter(COMP_NAME))
+    queries['search'] = search_query(Request.get_name_words_search_filter(SEARCH_WORDS))
+    return queries
+
+
+def time_query(conn, sql, runs):
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = conn.execute(text(sql)).fetchall()
+        timings.append(time.perf_counter() - start)
+    # the count queries return their count, the searches a page of rows
+    found = result[0][0] if result and len(result[0]) == 1 else len(result)
+    return statistics.median(timings), found
+
+
+def report(conn, label, sql, runs):
+    elapsed, found = time_query(conn, sql, runs)
+    plan = '\n'.join(line[0] for line in conn.execute(text('EXPLAIN ' + sql)).fetchall())
+    uses_index = any(index_name in plan for index_name, _, _ in TRIGRAM_INDEXES)
+    print('{0:<40} {1:>9.1f} ms {2:>8} found  index={3}'.format(label, elapsed * 1000, found, uses_index))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=3_000_000, help='number of generated requests')
+    parser.add_argument('--runs', type=int, default=5, help='timed runs per query, the median is reported')
+    parser.add_argument('--keep', action='store_true', help='keep the generated schema')
+    args = parser.parse_args()
+
+    engine = create_engine(TestConfig.SQLALCHEMY_DATABASE_URI)
+
+    with engine.begin() as conn:
+        print('Generating {0} requests...'.format(args.rows))
+        generate_requests(conn, args.rows)
+        conn.execute(text('SET search_path TO {0}, public'.format(SCHEMA)))
+
+        for name, query in previous_queries().items():
+            report(conn, '{0}: previous, no index'.format(name), compile_sql(conn, query), args.runs)
+
+        create_indexes(conn)
+        for name, query in previous_queries().items():
+            report(conn, '{0}: previous, trigram index'.format(name), compile_sql(conn, query), args.runs)
+        for name, query in current_queries().items():
+            report(conn, '{0}: current, trigram index'.format(name), compile_sql(conn, query), args.runs)
+
+        if not args.keep:
+            conn.execute(text('DROP SCHEMA {0} CASCADE'.format(SCHEMA)))
+
+
+if __name__ == '__main__':
+    main()
@@ -701,3 +701,53 @@ def test_search_get(client, jwt, app, monkeypatch, search_name, expected_len):
     if expected_len > 0:
         assert rv.json[0]['nrNum'] == nr.nrNum
         assert rv.json[0]['names'] == [name1.name]
+
+
+@pytest.mark.parametrize('order', ['submittedDate:desc,stateCd:desc', 'stateCd:asc'])
+def test_namex_search_cursor(client, jwt, app, order):
+    """Test keyset paging returns every nr once, in the same order as offset paging."""
+    generate_nrs(14, [], [], [])
+    headers = create_header(jwt, [User.EDITOR])
+
+    rv = client.get(f'api/v1/requests?order={order}&rows=100', headers=headers)
+    expected = [nr['nrNum'] for nr in json.loads(rv.data.decode('utf-8'))['nameRequests'][0]]
+
+    nr_nums = []
+    cursor = ''
+    while cursor is not None:
+        rv = client.get(f'api/v1/requests?order={order}&rows=4&cursor={cursor}', headers=headers)
+        assert rv.status_code == HTTPStatus.OK
+        resp = json.loads(rv.data.decode('utf-8'))
+        assert len(resp['nameRequests'][0]) <= 4
+        assert resp['response']['numFound'] == len(expected)
+        nr_nums.extend(nr['nrNum'] for nr in resp['nameRequests'][0])
+        cursor = resp['response']['nextCursor']
+
+    assert sorted(nr_nums) == sorted(expected)
+    assert len(set(nr_nums)) == len(expected)
+    if order.startswith('submittedDate'):
+        assert nr_nums == expected
+
+
+def test_namex_search_invalid_cursor(client, jwt, app):
+    """Test a cursor from another order is rejected."""
+    generate_nrs(3, [], [], [])
+    headers = create_header(jwt, [User.EDITOR])
+
+    rv = client.get('api/v1/requests?rows=1&cursor=', headers=headers)
+    cursor = json.loads(rv.data.decode('utf-8'))['response']['nextCursor']
+
+    rv = client.get(f'api/v1/requests?order=stateCd:asc&rows=1&cursor={cursor}', headers=headers)
+    assert rv.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_namex_search_estimated_count(client, jwt, app):
+    """Test the estimated count is flagged as such."""
+    generate_nrs(3, [], [], [])
+
+    rv = client.get('api/v1/requests?count=estimated', headers=create_header(jwt, [User.EDITOR]))
+    resp = json.loads(rv.data.decode('utf-8'))
+
+    assert rv.status_code == HTTPStatus.OK
+    assert resp['response']['numFoundEstimated'] is True
+    assert isinstance(resp['response']['numFound'], int)
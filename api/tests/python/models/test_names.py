@@ -1,3 +1,5 @@
+import pytest
+
 from namex.models import Name, NameSchema
 
 
@@ -190,3 +192,17 @@ def test_name_update_via_save_to_db_method(session):
     assert name.conflict1_num == 'NR 0000001'  # NR number conflicts should be unchanged
     assert name.conflict2_num == 'A123456'  # corp number conflicts should be unchanged
     assert name.conflict3_num in ('', None)
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('Coffee', 'cofe'),
+        ('MOUNT-AIN  VIEW', 'mountainview'),
+        ('A.B.C. 123', 'abc123'),
+        ('Café', 'caf'),
+    ],
+)
+def test_conflict_search_text(value, expected):
+    """Assert words are normalized the way the names trigram index normalizes names."""
+    assert Name.conflict_search_text(value) == expected
@@ -154,3 +154,96 @@ def test_is_expired():
     nr.save_to_db()
 
     assert nr.is_expired is True
+
+
+def test_get_combination_patterns_accumulates_descriptive_patterns():
+    """Assert each DIST/DESC combination carries the descriptive patterns searched before it for that DIST."""
+    from namex.models import Request as RequestDAO
+
+    combinations = RequestDAO.get_combination_patterns(
+        {'mountain': ['mountain', 'mount'], 'view': ['view']},
+        {'bakery': ['bakery', 'bake'], 'cafe': ['cafe']},
+        'the|and',
+        False,
+    )
+
+    assert [key for key, _ in combinations] == [
+        ('mountain', 'bakery'),
+        ('mountain', 'cafe'),
+        ('view', 'bakery'),
+        ('view', 'cafe'),
+    ]
+    assert [len(patterns) for _, (patterns,) in combinations] == [1, 2, 1, 2]
+    assert combinations[1][1][0][0] == combinations[0][1][0][0]
+    dist_criteria = RequestDAO.get_distinctive_query(['view'], 'the|and', False)
+    assert all(pattern.startswith(dist_criteria) for pattern in combinations[3][1][0])
+    assert combinations[3][1][0][1].endswith(r'.*(c\W*a\W*f\W*e ?)\y')
+
+
+def test_get_combination_patterns_repeats_descriptive_pattern_per_criteria():
+    """Assert the second (not consumed) criteria gets the descriptive pattern twice, as get_descriptive_query did."""
+    from namex.models import Request as RequestDAO
+
+    combinations = RequestDAO.get_combination_patterns({'view': ['view']}, {'cafe': ['cafe']}, 'the|and', False, 2)
+
+    criteria = RequestDAO.get_general_query()
+    name_criteria = RequestDAO.get_distinctive_query(['view'], 'the|and', False)
+    RequestDAO.get_descriptive_query(['cafe'], criteria, name_criteria)
+    expected = [[element.right.value for element in criteria_item.filters[-1]] for criteria_item in criteria]
+    assert combinations[0][1] == expected
+    assert expected[1][0] == expected[0][0] + r'.*(c\W*a\W*f\W*e ?)\y'
+
+
+def _save_conflict_nr(nr_num, state, name_state, names):
+    from namex.models import Name
+    from namex.models import Request as RequestDAO
+
+    nr = RequestDAO()
+    nr.nrNum = nr_num
+    nr.stateCd = state
+    nr.requestTypeCd = 'CR'
+    for choice, text in enumerate(names, start=1):
+        name = Name()
+        name.choice = choice
+        name.name = text
+        name.state = name_state
+        nr.names.append(name)
+    nr.save_to_db()
+
+
+@pytest.mark.parametrize('queue', [False, True])
+def test_find_by_criteria_combinations_matches_per_combination_search(client, app, queue):
+    """Assert the combined query returns, for every combination, the rows find_by_criteria_array returned for it."""
+    from namex.models import Request as RequestDAO
+    from namex.models import State
+
+    _save_conflict_nr(
+        'NR 0000001', State.APPROVED, 'APPROVED', ['MOUNTAIN BAKERY BAKERY LTD', 'MOUNTAIN VIEW BAKERY LTD']
+    )
+    _save_conflict_nr('NR 0000002', State.APPROVED, 'APPROVED', ['MOUNT CAFE LTD', 'VIEW BAKERY BAKERY CAFE CAFE LTD'])
+    _save_conflict_nr('NR 0000003', State.DRAFT, 'NE', ['VIEW BAKERY INC', 'MOUNT BAKERY CAFE INC'])
+    _save_conflict_nr('NR 0000004', State.DRAFT, 'NE', ['VIEW CAFE INC'])
+
+    dist_substitution_dict = {'mountain': ['mountain', 'mount'], 'view': ['view']}
+    desc_synonym_criteria_dict = {'bakery': ['bakery', 'bake'], 'cafe': ['cafe']}
+    stop_words = 'the|and'
+
+    expected = []
+    for value_dist in dist_substitution_dict.values():
+        criteria = RequestDAO.get_general_query(False, queue)
+        name_criteria = RequestDAO.get_distinctive_query(value_dist, stop_words, False)
+        for value_desc in desc_synonym_criteria_dict.values():
+            criteria = RequestDAO.get_descriptive_query(value_desc, criteria, name_criteria)
+            expected.append(sorted(tuple(match) for match in RequestDAO.find_by_criteria_array(criteria, queue)))
+
+    criteria = RequestDAO.get_general_query(False, queue)
+    combinations = RequestDAO.get_combination_patterns(
+        dist_substitution_dict, desc_synonym_criteria_dict, stop_words, False, len(criteria)
+    )
+    matches = RequestDAO.find_by_criteria_combinations(criteria, [patterns for _, patterns in combinations], queue)
+    found = [
+        sorted(tuple(match)[:-1] for match in matches if match.combination == idx) for idx in range(len(combinations))
+    ]
+
+    assert any(expected)
+    assert found == expected
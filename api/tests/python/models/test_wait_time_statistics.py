@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from sqlalchemy.exc import OperationalError
+
+
+def save_decided_nr(nr_num, waited, priority=False, payments=1):
+    from namex.models import Event, Payment, Request, State
+
+    now = datetime.now(timezone.utc)
+    submitted = now - waited
+
+    nr = Request()
+    nr.nrNum = nr_num
+    nr.stateCd = State.APPROVED
+    nr.priorityCd = 'Y' if priority else 'N'
+    nr.submittedDate = submitted
+    nr.payments = []
+    for _ in range(payments):
+        payment = Payment()
+        payment.payment_completion_date = submitted
+        nr.payments.append(payment)
+    event = Event()
+    event.action = Event.PATCH
+    event.stateCd = State.APPROVED
+    event.userId = 2
+    event.eventDate = now
+    nr.events = [event]
+    nr.save_to_db()
+
+
+def test_refresh_saves_the_median_wait_times(client, app):
+    from namex.models import DecisionLatency, WaitTimeStatistics
+
+    save_decided_nr('NR 0000001', timedelta(days=2, hours=3))
+    save_decided_nr('NR 0000002', timedelta(days=4, hours=1))
+    save_decided_nr('NR 0000003', timedelta(hours=5, minutes=10), priority=True)
+
+    statistics = WaitTimeStatistics.refresh()
+
+    assert DecisionLatency.query.count() == 3
+    assert statistics.priorityWaitTime == 6
+    assert statistics.prioritySamples == 1
+    assert statistics.regularSamples == 3
+    assert WaitTimeStatistics.get_latest().id == statistics.id
+
+
+def test_refresh_records_the_latencies_again(client, app):
+    from namex.models import DecisionLatency, WaitTimeStatistics
+
+    save_decided_nr('NR 0000001', timedelta(days=2))
+
+    WaitTimeStatistics.refresh()
+    WaitTimeStatistics.refresh()
+
+    assert DecisionLatency.query.count() == 1
+
+
+def test_refresh_replaces_the_latency_of_an_nr_decided_again(client, app):
+    from namex.models import DecisionLatency, Request, WaitTimeStatistics, db
+
+    save_decided_nr('NR 0000001', timedelta(days=2))
+    nr = Request.find_by_nr('NR 0000001')
+    db.session.add(
+        DecisionLatency(
+            nrId=nr.id,
+            decisionDate=datetime.now(timezone.utc) - timedelta(days=10),
+            latencySeconds=60,
+            priority=False,
+        )
+    )
+    db.session.commit()
+
+    statistics = WaitTimeStatistics.refresh()
+
+    latency = DecisionLatency.query.filter_by(nrId=nr.id).one()
+    assert latency.latencySeconds > 60
+    assert statistics.regularSamples == 1
+
+
+def test_refresh_counts_an_nr_with_two_payments_once(client, app):
+    from namex.models import DecisionLatency, WaitTimeStatistics
+
+    # e.g. an upgrade to priority paid for after the submission
+    save_decided_nr('NR 0000001', timedelta(hours=5), priority=True, payments=2)
+
+    statistics = WaitTimeStatistics.refresh()
+
+    assert DecisionLatency.query.count() == 1
+    assert statistics.prioritySamples == 1
+
+
+def test_failed_refresh_falls_back_to_older_statistics(client, app):
+    from namex.models import WaitTimeStatistics, db
+    from namex.services.statistics.wait_time_statistics import WaitTimeStatsService
+
+    db.session.add(
+        WaitTimeStatistics(
+            computedAt=datetime.now(timezone.utc) - timedelta(days=3), priorityWaitTime=5, regularWaitTime=2
+        )
+    )
+    db.session.commit()
+
+    with patch.object(WaitTimeStatistics, 'refresh', side_effect=OperationalError('refresh', {}, Exception())):
+        response = WaitTimeStatsService.get_statistics()
+
+    assert response['priority_wait_time'] == 5
+    assert response['regular_wait_time'] == 2
@@ -0,0 +1,40 @@
+import pytest
+
+from namex.services.name_processing.transform import get_transform_pipeline
+
+DESIGNATIONS = ('limited liability company', 'limited', 'ltd.', 'ltd', 'inc.', 'inc', 'corp.', 'corp')
+PREFIXES = ('pre', 're', 'dis', 'anti')
+
+
+@pytest.mark.parametrize(
+    'name, expected',
+    [
+        ('TOBI.COM CANADA OPERATIONS LTD.', 'TOBI CANADA OPERATIONS'),
+        ('ONE AND 1,000 NIGHTS GROUP', 'ONE AND 1000 NIGHTS GROUP'),
+        ("REYNOLD'S HAIR SALON", 'REYNOLD HAIR SALON'),
+        ('STONEWATER VENTURES (NO. 133) LTD.', 'STONEWATER VENTURES'),
+        ('4THGEN HOLDINGS HOLDINGS INC.', '4TH GEN HOLDINGS'),
+        ('A B C MOUNTAIN-VIEW FOOD CORP.', 'ABC MOUNTAIN VIEW FOOD'),
+    ],
+)
+def test_transform(name, expected):
+    """Assert the transform matches what solr-synonyms-api /transform-text returns."""
+    assert get_transform_pipeline(DESIGNATIONS, PREFIXES).transform(name) == expected
+
+
+@pytest.mark.parametrize(
+    'name, exception_designation, expected',
+    [
+        ('MONTESSORI PRE-SCHOOL LTD.', ['null'], 'MONTESSORI PRESCHOOL LTD.'),
+        ('HOME STAGING & RE-DESIGN INC.', ['null'], 'HOME STAGING & REDESIGN INC.'),
+        ('DIS-DRESS BEAD & GIFT STORE LTD', ['null'], 'DISDRESS BEAD & GIFT STORE LTD'),
+    ],
+)
+def test_regex_prefixes(name, exception_designation, expected):
+    """Assert prefixes are joined to the following word, as solr-synonyms-api /regex-prefixes does."""
+    assert get_transform_pipeline(DESIGNATIONS, PREFIXES).regex_prefixes(name, exception_designation) == expected
+
+
+def test_pipeline_is_compiled_once_per_word_lists():
+    """Assert the same word lists reuse the same compiled pipeline."""
+    assert get_transform_pipeline(DESIGNATIONS, PREFIXES) is get_transform_pipeline(DESIGNATIONS, PREFIXES)
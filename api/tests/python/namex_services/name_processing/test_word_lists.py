@@ -0,0 +1,61 @@
+import pytest
+
+from namex.services.name_processing import word_lists
+from namex.services.name_processing.word_lists import WordListsSnapshot, get_word_lists, invalidate_word_lists
+
+lists = {
+    'stop_words': ['of', 'the', 'and'],
+    'prefixes': ['re', 'pre'],
+    'number_words': ['one', 'two'],
+    'stand_alone_words': ['holdings', 'ventures'],
+    'eng_designated_end_words': ['limited', 'ltd', 'limited liability company'],
+    'eng_designated_any_words': ['co-op', 'co-operative'],
+    'fr_designated_end_words': ['limitee', 'societe a responsabilite limitee'],
+    'fr_designated_any_words': ['cooperative'],
+}
+
+
+def test_snapshot_precomputes_designation_patterns():
+    snapshot = WordListsSnapshot(1, lists)
+
+    assert snapshot.designated_all_words[0] == 'societe a responsabilite limitee'
+    assert [len(word) for word in snapshot.designated_all_words] == sorted(
+        [len(word) for word in snapshot.designated_all_words], reverse=True
+    )
+    assert snapshot.designations_with_hyphen == ['co-operative', 'co-op']
+    assert snapshot.exception_stop_words_designation == ['null']
+    assert snapshot.designation_tokenize_regex.findall('armstrong plumbing limited liability company') == [
+        'armstrong',
+        'plumbing',
+        'limited liability company',
+    ]
+
+
+@pytest.mark.parametrize(
+    'stop_words, designations, expected',
+    [
+        (['of'], ['ltd', 'limited'], ['null']),
+        (['a', 'de'], ['societe a responsabilite limitee', 'ltd'], ['societe a responsabilite limitee']),
+    ],
+)
+def test_get_exception_stop_words_designation(stop_words, designations, expected):
+    assert word_lists.get_exception_stop_words_designation(stop_words, designations) == expected
+
+
+def test_get_word_lists_loads_once(monkeypatch):
+    calls = []
+
+    def mock_fetch(syn_svc=None):
+        calls.append(1)
+        return lists
+
+    monkeypatch.setattr(word_lists, 'fetch_word_lists', mock_fetch)
+    invalidate_word_lists()
+
+    first = get_word_lists()
+    assert get_word_lists() is first
+    assert len(calls) == 1
+
+    invalidate_word_lists()
+    assert get_word_lists().version > first.version
+    assert len(calls) == 2
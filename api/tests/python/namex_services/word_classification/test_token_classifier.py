@@ -0,0 +1,35 @@
+from collections import namedtuple
+
+from namex.services.word_classification.token_classifier import TokenClassifier
+
+Row = namedtuple('Row', ['token', 'word', 'classification'])
+
+
+class FakeWordClassificationService:
+    def __init__(self, classifications):
+        self.classifications = classifications
+        self.calls = []
+
+    def find_classifications(self, words):
+        self.calls.append(list(words))
+        return {word.lower(): self.classifications.get(word.lower(), []) for word in words}
+
+
+def test_classify_tokens_in_one_lookup(app):
+    """Assert every token is classified from a single bulk lookup, in name order."""
+    svc = FakeWordClassificationService(
+        {
+            'mountain': [Row('mountain', 'MOUNTAIN', 'DIST')],
+            'view': [Row('view', 'VIEW', 'DESC'), Row('view', 'VIEW', 'DIST')],
+            'bakery': [Row('bakery', 'BAKERY', 'DESC ')],
+        }
+    )
+    token_classifier = TokenClassifier(svc)
+
+    with app.app_context():
+        token_classifier.name_tokens = ['MOUNTAIN', 'view', 'zorbix', 'bakery']
+
+    assert svc.calls == [['MOUNTAIN', 'view', 'zorbix', 'bakery']]
+    assert token_classifier.distinctive_word_tokens == ['mountain', 'view']
+    assert token_classifier.descriptive_word_tokens == ['view', 'bakery']
+    assert token_classifier.unclassified_word_tokens == ['zorbix']
@@ -56,3 +56,20 @@ def test_get_restricted_long(db):
             assert 'id' in cnd
             assert 'instructions' in cnd
             assert 'text' in cnd
+
+
+def test_matcher_finds_overlapping_phrases():
+    from namex.analytics.restricted_words import RestrictedWordMatcher
+
+    words = [
+        {'id': 1, 'phrase': 'BC'},
+        {'id': 2, 'phrase': 'ROYAL'},
+        {'id': 3, 'phrase': 'ROYAL BC'},
+        {'id': 4, 'phrase': 'ROYALRE'},
+        {'id': 5, 'phrase': 'BANK'},
+    ]
+    matcher = RestrictedWordMatcher(words, {})
+
+    found = matcher.find(RestrictedWords.strip_content('royal bc bcroyal'))
+
+    assert [word['phrase'] for word in found] == ['BC', 'ROYAL', 'ROYAL BC']
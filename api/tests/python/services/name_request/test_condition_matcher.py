@@ -0,0 +1,32 @@
+from namex.services.virtual_word_condition.condition_matcher import (
+    WORD_SPECIAL_USE,
+    WORDS_REQUIRING_CONSENT,
+    WORDS_TO_AVOID,
+    ConditionMatcher,
+)
+
+
+def test_find_compound_is_leftmost_longest():
+    matcher = ConditionMatcher(
+        [
+            ('Royal', WORDS_TO_AVOID),
+            ('Royal Bank', WORDS_TO_AVOID),
+            ('Bank', WORDS_TO_AVOID),
+            ('Bank', WORD_SPECIAL_USE),
+        ]
+    )
+
+    assert matcher.find_compound('ROYAL BANK BANK HOLDINGS', WORDS_TO_AVOID) == ['royal bank', 'bank']
+    assert matcher.find_compound('ROYAL BANKS', WORDS_TO_AVOID) == ['royal']
+    assert matcher.find_compound('ROYAL BANK', WORD_SPECIAL_USE) == ['bank']
+
+
+def test_find_all_matches_plural_and_joined_forms():
+    matcher = ConditionMatcher([('Real Estate', WORDS_REQUIRING_CONSENT), ('Engineer', WORDS_REQUIRING_CONSENT)])
+
+    matches = matcher.find_all('ENGINEERS REALESTATE', WORDS_REQUIRING_CONSENT)
+
+    assert {(match.start, match.end, match.words, match.exact) for match in matches} == {
+        (0, 1, 'Engineer', False),
+        (1, 2, 'Real Estate', True),
+    }
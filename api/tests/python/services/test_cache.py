@@ -0,0 +1,74 @@
+import threading
+import time
+
+import pytest
+from flask import Flask, current_app
+
+from namex.services.cache import NamexCache
+
+FILESYSTEM_CACHE = 'namex.services.cache.FileSystemCache'
+
+
+@pytest.fixture
+def shared_cache(tmp_path):
+    app = Flask(__name__)
+    app.config.update({'CACHE_TYPE': FILESYSTEM_CACHE, 'CACHE_DIR': str(tmp_path), 'CACHE_DEFAULT_TIMEOUT': 300})
+    namex_cache = NamexCache()
+    namex_cache.init_app(app)
+    with app.app_context():
+        yield namex_cache
+
+
+def test_value_is_shared_through_the_backend(shared_cache, tmp_path):
+    other_worker = NamexCache()
+    other_app = Flask(__name__)
+    other_app.config.update({'CACHE_TYPE': FILESYSTEM_CACHE, 'CACHE_DIR': str(tmp_path)})
+    other_worker.init_app(other_app)
+
+    assert shared_cache.get_or_compute('stats', 'wait-time', lambda: {'regular_wait_time': 3}) == {
+        'regular_wait_time': 3
+    }
+    with other_app.app_context():
+        assert other_worker.get_or_compute('stats', 'wait-time', lambda: pytest.fail('recomputed')) == {
+            'regular_wait_time': 3
+        }
+
+
+def test_invalidate_drops_only_the_namespace(shared_cache):
+    shared_cache.get_or_compute('stats', 'wait-time', lambda: 1)
+    shared_cache.get_or_compute('fees', 'NM620', lambda: 30)
+
+    shared_cache.invalidate('stats')
+
+    assert shared_cache.get_or_compute('stats', 'wait-time', lambda: 2) == 2
+    assert shared_cache.get_or_compute('fees', 'NM620', lambda: pytest.fail('recomputed')) == 30
+
+
+def test_empty_values_are_not_cached(shared_cache):
+    assert shared_cache.get_or_compute('stats', 'missing', lambda: None) is None
+    assert shared_cache.get_or_compute('stats', 'missing', lambda: {}) == {}
+    assert shared_cache.get_or_compute('stats', 'missing', lambda: {'regular_wait_time': 3}) == {'regular_wait_time': 3}
+
+
+def test_concurrent_misses_compute_once(shared_cache):
+    app = current_app._get_current_object()
+    calls = []
+    results = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.3)
+        return 'stats'
+
+    def get():
+        with app.app_context():
+            results.append(shared_cache.get_or_compute('stats', 'wait-time', compute))
+
+    threads = [threading.Thread(target=get) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ['stats'] * 5
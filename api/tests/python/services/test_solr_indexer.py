@@ -0,0 +1,151 @@
+import json
+import threading
+import time
+
+import pytest
+import requests
+from flask import Flask
+
+from namex.services.name_request.exceptions import SolrUpdateError
+from namex.services.solr_indexer import SolrIndexer
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise requests.HTTPError(f'status {self.status_code}', response=self)
+
+
+class FakeSession:
+    def __init__(self, status_code=200, rejected_ids=()):
+        self.status_code = status_code
+        self.rejected_ids = rejected_ids
+        self.posted = []
+        self.written = threading.Event()
+
+    def post(self, url, params, data, headers, timeout):
+        self.posted.append((url, params, data))
+        self.written.set()
+        if any(f'"{doc_id}"' in data for doc_id in self.rejected_ids):
+            return FakeResponse(400)
+        return FakeResponse(self.status_code)
+
+
+def wait_for(condition):
+    give_up_at = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < give_up_at
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def indexer():
+    app = Flask(__name__)
+    app.config.update(
+        {
+            'SOLR_BASE_URL': 'http://solr',
+            'SOLR_INDEX_ASYNC': True,
+            'SOLR_INDEX_QUEUE_SIZE': 3,
+            'SOLR_INDEX_FLUSH_INTERVAL': 0.05,
+            'SOLR_INDEX_COMMIT_WITHIN': 1000,
+        }
+    )
+    solr_indexer = SolrIndexer(app)
+    solr_indexer._session = FakeSession()
+    return solr_indexer
+
+
+def test_temp_delete_and_add_are_one_update(indexer):
+    metrics = []
+    indexer.add_metrics_hook(metrics.append)
+
+    indexer.add('possible.conflicts', [{'id': 'NR 1234567', 'name': 'FOO BAR INC.'}])
+    indexer.delete('possible.conflicts', 'NR L000001')
+    assert indexer._session.written.wait(5)
+
+    assert len(indexer._session.posted) == 1
+    url, params, data = indexer._session.posted[0]
+    assert url == 'http://solr/solr/possible.conflicts/update'
+    assert params == {'commitWithin': 1000}
+    assert data == '{"delete":{"id": "NR L000001"},"add":{"doc": {"id": "NR 1234567", "name": "FOO BAR INC."}}}'
+    assert metrics[-1]['flushed'] == 2
+    assert metrics[-1]['failed'] == 0
+
+
+def test_later_update_of_a_doc_replaces_the_queued_one(indexer):
+    # keep the worker from flushing on its own
+    indexer.app.config['SOLR_INDEX_FLUSH_INTERVAL'] = 60
+
+    indexer.add('possible.conflicts', [{'id': 'NR 1234567', 'name': 'FOO BAR INC.'}])
+    indexer.delete('possible.conflicts', 'NR 1234567')
+    assert indexer.get_metrics()['depth'] == 1
+
+    indexer.flush()
+
+    _, _, data = indexer._session.posted[0]
+    assert json.loads(data) == {'delete': {'id': 'NR 1234567'}}
+
+
+def test_full_queue_writes_in_the_caller(indexer):
+    indexer.app.config['SOLR_INDEX_FLUSH_INTERVAL'] = 60
+    indexer._session.status_code = 500
+
+    indexer.add('possible.conflicts', [{'id': f'NR {n}'} for n in range(3)])
+    with pytest.raises(SolrUpdateError):
+        indexer.add('possible.conflicts', [{'id': 'NR 4'}])
+
+    assert indexer.get_metrics()['depth'] == 3
+
+
+def test_sync_mode_commits_before_returning(indexer):
+    indexer.app.config['SOLR_INDEX_ASYNC'] = False
+
+    indexer.delete('possible.conflicts', 'NR 1234567')
+
+    assert indexer._session.posted[0][1] == {'commit': 'true'}
+    assert indexer.get_metrics() == {'depth': 0, 'lag': 0}
+
+
+def test_rejected_doc_is_dropped_and_the_others_written(indexer):
+    indexer.app.config['SOLR_INDEX_FLUSH_INTERVAL'] = 60
+    indexer._session.rejected_ids = ['NR 2']
+    metrics = []
+    indexer.add_metrics_hook(metrics.append)
+
+    indexer.add('possible.conflicts', [{'id': f'NR {n}'} for n in range(3)])
+    indexer.flush()
+
+    # the batch, then one request per document
+    assert len(indexer._session.posted) == 4
+    assert metrics[-1] == {'depth': 0, 'lag': 0, 'flushed': 2, 'failed': 0, 'rejected': 1}
+
+
+def test_failed_updates_are_retried_up_to_the_limit(indexer):
+    indexer.app.config['SOLR_INDEX_MAX_RETRIES'] = 2
+    indexer._session.status_code = 500
+
+    indexer.delete('possible.conflicts', 'NR 1234567')
+
+    # the first write and two retries, after which the update is dropped
+    wait_for(lambda: len(indexer._session.posted) == 3 and indexer.get_metrics()['depth'] == 0)
+    time.sleep(0.2)
+    assert len(indexer._session.posted) == 3
+
+
+def test_failing_metrics_hook_does_not_stop_the_writes(indexer):
+    def broken_hook(metrics):
+        raise ValueError('broken')
+
+    metrics = []
+    indexer.add_metrics_hook(broken_hook)
+    indexer.add_metrics_hook(metrics.append)
+
+    indexer.delete('possible.conflicts', 'NR 1')
+    wait_for(lambda: metrics)
+    indexer.delete('possible.conflicts', 'NR 2')
+    wait_for(lambda: len(metrics) == 2)
+
+    assert len(indexer._session.posted) == 2
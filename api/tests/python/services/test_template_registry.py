@@ -0,0 +1,55 @@
+import base64
+
+import pytest
+
+from namex.services.template_registry import TemplateRegistry
+
+
+@pytest.fixture
+def templates(tmp_path):
+    (tmp_path / 'template-parts').mkdir()
+    (tmp_path / 'template-parts' / 'footer.html').write_text('<footer/>')
+    (tmp_path / 'AML').mkdir()
+    (tmp_path / 'AML' / 'NR-PAID.html').write_text('<p>paid</p>[[footer.html]]')
+    (tmp_path / 'common').mkdir()
+    (tmp_path / 'common' / 'NR-PAID.html').write_text('<p>common</p>')
+
+    registry = TemplateRegistry('TEMPLATE_PATH')
+    registry.load(tmp_path)
+    return registry
+
+
+def test_resolve_returns_first_existing_path(templates):
+    assert templates.resolve('CHG/NR-PAID.html', 'common/NR-PAID.html') == 'common/NR-PAID.html'
+    assert templates.resolve('AML/NR-PAID.html', 'common/NR-PAID.html') == 'AML/NR-PAID.html'
+    assert templates.resolve('CHG/NR-PAID.html') is None
+
+
+def test_render_substitutes_parts(templates):
+    rendered = templates.render('AML/NR-PAID.html', 'template-parts', ('footer',))
+
+    assert rendered == '<p>paid</p><footer/>'
+    assert templates.render_base64('AML/NR-PAID.html', 'template-parts', ('footer',)) == base64.b64encode(
+        rendered.encode('utf-8')
+    ).decode()
+
+
+def test_missing_part_raises(templates):
+    with pytest.raises(FileNotFoundError):
+        templates.substitute_parts('[[header.html]]', 'template-parts', ['header'])
+
+
+def test_load_replaces_templates(templates, tmp_path):
+    templates.render('AML/NR-PAID.html', 'template-parts', ('footer',))
+    (tmp_path / 'template-parts' / 'footer.html').write_text('<footer>new</footer>')
+    templates.load(tmp_path)
+
+    assert templates.render('AML/NR-PAID.html', 'template-parts', ('footer',)) == '<p>paid</p><footer>new</footer>'
+
+
+def test_unset_path_loads_nothing(app):
+    registry = TemplateRegistry('UNSET_TEMPLATE_PATH')
+
+    assert registry.get('AML/NR-PAID.html') is None
+    assert registry.resolve('AML/NR-PAID.html') is None
+    assert registry._templates is None
@@ -104,3 +104,29 @@ def test_solr__get_synonyms_clause(monkeypatch, name, expected):
     print(syn)
 
     assert (SYNONYMS_PREFIX + '(' + expected + ')').upper() == syn.upper()
+
+
+def test_fetch_all_keeps_query_order(monkeypatch):
+    """The concurrent fan-out must hand the results back in the order the queries were built."""
+
+    class MockResponse:
+        def __init__(self, query):
+            self.query = query
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {'query': self.query}
+
+    class MockSession:
+        def get(self, query, timeout=None):
+            return MockResponse(query)
+
+    monkeypatch.setattr(current_app.config, 'get', lambda env_name, default: default)
+    monkeypatch.setattr(SolrQueries, '_get_session', classmethod(lambda cls, pool_size: MockSession()))
+
+    queries = [f'https://not_a_real_server_just_mock/solr/select?q={i}' for i in range(20)]
+
+    assert [result['query'] for result in SolrQueries.fetch_all(queries)] == queries
+    assert SolrQueries.fetch_all([]) == []
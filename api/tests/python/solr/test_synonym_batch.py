@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+from urllib.error import HTTPError
+
+import pytest
+
+from namex.analytics.synonym_batch import SynonymBatch, current_app
+
+synonyms = {
+    'mountain': ['mount', 'mountain', 'mt', 'mtn'],
+    'mountainview': [],
+    'view': ['view', 'vista'],
+}
+
+
+class FakeSynonymService:
+    def __init__(self):
+        self.calls = []
+
+    def get_word_synonyms(self, word):
+        self.calls.append(word)
+        return SimpleNamespace(data=synonyms.get(word, []))
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    calls = []
+
+    def mock_fetch(words):
+        calls.append(list(words))
+        return {word: synonyms.get(word, []) for word in words}
+
+    monkeypatch.setattr(SynonymBatch, '_fetch_batch', staticmethod(mock_fetch))
+    return calls
+
+
+def test_prefetched_words_need_one_request(batches):
+    syn_svc = FakeSynonymService()
+    batch = SynonymBatch(syn_svc)
+    batch.prefetch(['mountain', 'view', 'mountainview', 'mountain'])
+
+    assert batch.get_synonyms('mountain') == synonyms['mountain']
+    assert batch.get_synonyms('view') == synonyms['view']
+    assert batch.get_synonyms('mountainview') == []
+    assert batches == [['mountain', 'view', 'mountainview']]
+    assert syn_svc.calls == []
+
+
+def test_words_not_prefetched_are_fetched_once(batches):
+    batch = SynonymBatch(FakeSynonymService())
+    batch.prefetch(['mountain'])
+
+    assert batch.get_synonyms('view') == synonyms['view']
+    assert batch.get_synonyms('view') == synonyms['view']
+    assert batches == [['mountain'], ['view']]
+
+
+def test_falls_back_to_per_word_lookups(monkeypatch):
+    def mock_fetch(words):
+        raise HTTPError('/synonyms/batch', 404, 'Not Found', None, None)
+
+    monkeypatch.setattr(SynonymBatch, '_fetch_batch', staticmethod(mock_fetch))
+    monkeypatch.setattr(current_app, 'logger', SimpleNamespace(warning=lambda msg: None), raising=False)
+    syn_svc = FakeSynonymService()
+    batch = SynonymBatch(syn_svc)
+    batch.prefetch(['mountain', 'view'])
+
+    assert batch.get_synonyms('mountain') == synonyms['mountain']
+    assert syn_svc.calls == ['mountain', 'view']
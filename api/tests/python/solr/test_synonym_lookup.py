@@ -0,0 +1,53 @@
+import pytest
+
+from namex.analytics.synonym_lookup import SynonymLookup, current_app
+
+synonym_rows = [
+    {'synonyms_text': 'mountain, mount, mt, mtn', 'stems_text': 'mountain,mount,mt,mtn'},
+    {'synonyms_text': 'auto, automobile, car', 'stems_text': 'auto,automobil,car'},
+    {'synonyms_text': 'car, vehicle', 'stems_text': 'car,vehicl'},
+]
+
+
+@pytest.fixture
+def synonym_lists(monkeypatch):
+    calls = []
+
+    def mock_fetch(cls):
+        calls.append(1)
+        return synonym_rows, 'v1'
+
+    monkeypatch.setattr(current_app.config, 'get', lambda env_name, default=None: default)
+    monkeypatch.setattr(SynonymLookup, '_fetch_synonym_lists', classmethod(mock_fetch))
+    monkeypatch.setattr(SynonymLookup, '_tables', None)
+    monkeypatch.setattr(SynonymLookup, '_version', None)
+    SynonymLookup.invalidate()
+    return calls
+
+
+@pytest.mark.parametrize(
+    'token, col, expected',
+    [
+        ('MT', 'synonyms_text', True),
+        (' mountain ', 'stems_text', True),
+        ('automobile', 'synonyms_text', True),
+        ('automobile', 'stems_text', False),
+        ('bakery', 'synonyms_text', False),
+    ],
+)
+def test_synonyms_exist(synonym_lists, token, col, expected):
+    assert SynonymLookup.exists(token, col) is expected
+
+
+def test_get_lists_returns_every_list_containing_the_token(synonym_lists):
+    assert SynonymLookup.get_lists('car', 'stems_text') == ['auto,automobil,car', 'car,vehicl']
+
+
+def test_lists_are_loaded_once_until_invalidated(synonym_lists):
+    SynonymLookup.exists('car', 'synonyms_text')
+    SynonymLookup.exists('mt', 'stems_text')
+    assert len(synonym_lists) == 1
+
+    SynonymLookup.invalidate()
+    SynonymLookup.exists('car', 'synonyms_text')
+    assert len(synonym_lists) == 2
@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table
+from sqlalchemy.dialects import postgresql
+
+from namex.utils.pagination import CursorError, decode_cursor, encode_cursor, get_keyset_filter
+
+requests = Table(
+    'requests',
+    MetaData(),
+    Column('id', Integer, primary_key=True),
+    Column('submitted_date', DateTime(timezone=True)),
+    Column('state_cd', String(40)),
+)
+ORDER = 'submittedDate desc NULLS LAST, stateCd desc NULLS LAST'
+COLUMNS = [requests.c.submitted_date, requests.c.state_cd, requests.c.id]
+
+
+def test_cursor_round_trip():
+    values = [datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc), 'DRAFT', 42]
+
+    assert decode_cursor(encode_cursor(ORDER, values), ORDER, COLUMNS) == values
+
+
+@pytest.mark.parametrize(
+    'cursor, order',
+    [
+        ('not a cursor', ORDER),
+        (encode_cursor(ORDER, [None, 'DRAFT', 1]), 'submittedDate asc NULLS LAST, stateCd desc NULLS LAST'),
+        (encode_cursor(ORDER, [None, 1]), ORDER),
+        (encode_cursor(ORDER, ['yesterday', 'DRAFT', 1]), ORDER),
+    ],
+)
+def test_invalid_cursors(cursor, order):
+    with pytest.raises(CursorError):
+        decode_cursor(cursor, order, COLUMNS)
+
+
+def test_keyset_filter():
+    order_by = [(requests.c.submitted_date, 'desc'), (requests.c.state_cd, 'desc'), (requests.c.id, 'asc')]
+    keyset = get_keyset_filter(order_by, [datetime(2024, 5, 1), None, 42])
+
+    compiled = keyset.compile(dialect=postgresql.dialect())
+    assert str(compiled) == (
+        'requests.submitted_date < %(submitted_date_1)s OR requests.submitted_date IS NULL'
+        ' OR requests.submitted_date = %(submitted_date_2)s AND requests.state_cd IS NULL'
+        ' AND (requests.id > %(id_1)s OR requests.id IS NULL)'
+    )
+    assert compiled.params == {
+        'submitted_date_1': datetime(2024, 5, 1),
+        'submitted_date_2': datetime(2024, 5, 1),
+        'id_1': 42,
+    }
@@ -0,0 +1,72 @@
+import threading
+import time
+
+from namex.utils.token_cache import TokenCache
+
+
+class FakeIdentityServer:
+    def __init__(self, expires_in=300, delay=0):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.calls = 0
+
+    def fetch(self, auth_url, client_id, secret):
+        self.calls += 1
+        time.sleep(self.delay)
+        if secret != 'secret':
+            return False, {'error': 'unauthorized_client'}
+        return True, {'access_token': 'token-{}'.format(self.calls), 'expires_in': self.expires_in}
+
+
+def test_token_is_reused_per_client():
+    """Assert a token is fetched once per (auth url, client id) while it is valid."""
+    server = FakeIdentityServer()
+    cache = TokenCache(fetch=server.fetch)
+
+    assert cache.get_token('https://auth', 'pay', 'secret') == (True, 'token-1')
+    assert cache.get_token('https://auth', 'pay', 'secret') == (True, 'token-1')
+    assert cache.get_token('https://auth', 'report', 'secret') == (True, 'token-2')
+    assert server.calls == 2
+
+
+def test_token_is_refreshed_before_it_expires():
+    """Assert a token is fetched again once it is inside the refresh margin, and kept only if it has a lifetime."""
+    server = FakeIdentityServer(expires_in=1)
+    cache = TokenCache(fetch=server.fetch)
+
+    assert cache.get_token('https://auth', 'pay', 'secret') == (True, 'token-1')
+    assert cache.get_token('https://auth', 'pay', 'secret') == (True, 'token-1')
+
+    # Half way through a one second lifetime the token is refreshed
+    time.sleep(0.6)
+    server.expires_in = None
+    assert cache.get_token('https://auth', 'pay', 'secret') == (True, 'token-2')
+    assert cache.get_token('https://auth', 'pay', 'secret') == (True, 'token-3')
+
+
+def test_failures_are_not_cached():
+    """Assert a refused request is returned to the caller and retried next time."""
+    server = FakeIdentityServer()
+    cache = TokenCache(fetch=server.fetch)
+
+    assert cache.get_token('https://auth', 'pay', 'wrong') == (False, {'error': 'unauthorized_client'})
+    assert cache.get_token('https://auth', 'pay', 'secret') == (True, 'token-2')
+
+
+def test_concurrent_refreshes_are_collapsed():
+    """Assert threads asking for the same expired token share a single request."""
+    server = FakeIdentityServer(delay=0.05)
+    cache = TokenCache(fetch=server.fetch)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_token('https://auth', 'pay', 'secret')))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert server.calls == 1
+    assert results == [(True, 'token-1')] * 8
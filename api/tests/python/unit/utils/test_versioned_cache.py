@@ -0,0 +1,39 @@
+from namex.models import VirtualWordCondition, db
+from namex.services.virtual_word_condition.condition_matcher import VERSION_SQL
+from namex.utils.versioned_cache import VersionedCache
+
+
+class CountingCache(VersionedCache):
+    version_sql = VERSION_SQL
+
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return self.loads
+
+
+def test_reloads_when_the_table_changes(client, app):
+    cache = CountingCache()
+
+    assert cache.get() == 1
+    assert cache.get() == 1
+
+    VirtualWordCondition(rc_words='Bank', rc_allow_use=False, rc_consent_required=False).save_to_db()
+
+    assert cache.get() == 2
+
+
+def test_version_moves_on_commit(client, app):
+    version = db.session.execute(VERSION_SQL).scalar()
+
+    db.session.add(VirtualWordCondition(rc_words='Bank', rc_allow_use=False, rc_consent_required=False))
+    db.session.flush()
+    with db.engine.connect() as connection:
+        assert connection.execute(VERSION_SQL).scalar() == version
+
+    db.session.commit()
+    with db.engine.connect() as connection:
+        assert connection.execute(VERSION_SQL).scalar() == version + 1
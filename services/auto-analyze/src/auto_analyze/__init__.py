@@ -18,15 +18,16 @@
 import asyncio
 import os
 
+import click
 import config  # pylint: disable=wrong-import-order; # noqa: I001
 import quart.flask_patch
 from namex import models
 from namex.models import db, ma
-from namex.services.name_request.auto_analyse.protected_name_analysis import ProtectedNameAnalysisService
 from quart import Quart, jsonify, request
 
 
-from .analyzer import auto_analyze
+from .processed_names import backfill
+from .scoring_pool import get_pool_cache_stats, get_prep_data, score_names
 
 
 # Set config
@@ -77,14 +78,17 @@ app = loop.run_until_complete(create_app(RUN_MODE))
 db.app = app  # Just set it, see if it works...
 
 
+@app.cli.command('backfill-processed-names')
+@click.option('--batch-size', default=500, help='Names processed and stored at a time.')
+def backfill_processed_names(batch_size):
+    """Store the processing of every name that has none for the current word lists."""
+    count = backfill(get_prep_data(), batch_size)
+    click.echo('Processed {0} names.'.format(count))
+
+
 @app.route('/', methods=['POST'])
 async def private_service():
     """Return the outcome of this private service call."""
-    name_analysis_service = ProtectedNameAnalysisService()
-    service = name_analysis_service
-    np_svc_prep_data = service.name_processing_service
-    np_svc_prep_data.prepare_data()
-
     json_data = await request.get_json()
     list_dist = json_data.get('list_dist')
     list_desc = json_data.get('list_desc')
@@ -95,12 +99,16 @@ async def private_service():
 
     app.logger.debug('Number of matches: {0}'.format(len(matches)))
 
-    result = await asyncio.gather(
-        *[auto_analyze(name, list_name, list_dist, list_desc, dict_substitution, dict_synonyms, np_svc_prep_data) for
-          name in matches]
-    )
+    result = await score_names(matches, list_name, list_dist, list_desc, dict_substitution, dict_synonyms,
+                               app.config)
     return jsonify(result=result)
 
 
+@app.route('/cache-stats', methods=['GET'])
+async def cache_stats():
+    """Return the hit / miss counters of the analyzer caches, summed over the scoring workers."""
+    return jsonify(get_pool_cache_stats())
+
+
 if __name__ == '__main__':
     app.run(port=7000, host='localhost')
@@ -11,12 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Analyzes a single name."""
+"""Analyzes a single name.
+
+Scoring a candidate only reads the ScoringContext of the search and the word lists snapshot it points at, every
+intermediate list is local to the call. The classification of a candidate works in an analysis service that keeps
+per-name state, so each thread has its own (see ThreadServices), and candidates can be scored concurrently from any
+number of threads or processes.
+"""
+import copy
 import itertools
 import logging
 import math
 import re
+import threading
 from collections import Counter
+from dataclasses import dataclass
 
 from namex.services.name_processing.name_processing import NameProcessingService
 from namex.services.name_request.auto_analyse.name_analysis_utils import (
@@ -29,15 +38,11 @@ from namex.services.name_request.auto_analyse.name_analysis_utils import (
 from namex.services.name_request.auto_analyse.protected_name_analysis import ProtectedNameAnalysisService
 from namex.services.name_request.builders.name_analysis_builder import NameAnalysisBuilder
 from nltk.stem import PorterStemmer
-from swagger_client import SynonymsApi as SynonymService
 
+from .caches import get_caches
 
-porter = PorterStemmer()
 
-synonym_service = SynonymService()
-name_processing_service = NameProcessingService()
-name_analysis_service = ProtectedNameAnalysisService()
-builder = NameAnalysisBuilder(name_analysis_service)
+porter = PorterStemmer()
 
 STEM_W = 0.85
 SUBS_W = 0.65
@@ -52,67 +57,120 @@ MINIMUM_SIMILARITY = 0.66
 HIGH_CONFLICT_RECORDS = 20
 
 
-# ok deep function
-async def auto_analyze(name: str,  # pylint: disable=too-many-locals, too-many-arguments
+class ThreadServices(threading.local):
+    """The analysis service and builder a thread processes and classifies candidates with."""
+
+    def __init__(self):
+        """Create the services of the current thread."""
+        super().__init__()
+        self.name_analysis_service = ProtectedNameAnalysisService()
+        self.builder = NameAnalysisBuilder(self.name_analysis_service)
+
+
+thread_services = ThreadServices()
+
+
+@dataclass(frozen=True)
+class ScoringContext:
+    """What every candidate of a search is scored against, shared read-only by the calls scoring them.
+
+    np_svc_prep_data is a NameProcessingService pointed at a word lists snapshot, it must not be prepared again
+    while the context is in use (see scoring_pool.get_prep_data).
+    """
+
+    list_name: tuple
+    list_dist: tuple
+    list_desc: tuple
+    dict_substitution: dict
+    dict_synonyms: dict
+    np_svc_prep_data: NameProcessingService
+    stand_alone_words: tuple
+
+    @classmethod
+    def create(cls, list_name: list, list_dist: list,  # pylint: disable=too-many-arguments
+               list_desc: list, dict_substitution: dict, dict_synonyms: dict,
+               np_svc_prep_data: NameProcessingService) -> 'ScoringContext':
+        """Return the context of a search, with its own copy of the search lists."""
+        return cls(list_name=tuple(list_name or ()),
+                   list_dist=tuple(list_dist or ()),
+                   list_desc=tuple(list_desc or ()),
+                   dict_substitution=copy.deepcopy(dict_substitution or {}),
+                   dict_synonyms=copy.deepcopy(dict_synonyms or {}),
+                   np_svc_prep_data=np_svc_prep_data,
+                   stand_alone_words=tuple(np_svc_prep_data.get_stand_alone_words() or ()))
+
+
+async def auto_analyze(name: str,  # pylint: disable=too-many-arguments
                        list_name: list, list_dist: list,
                        list_desc: list, dict_substitution: dict,
                        dict_synonyms: dict,
-                       np_svc_prep_data: name_analysis_service) -> dict:
+                       np_svc_prep_data: NameProcessingService) -> dict:
     """Return a dictionary with name as key and similarity as value, 1.0 is an exact match."""
-    logging.getLogger(__name__).debug(
-        'name: %s ,  list_name %s,  list_dist: %s, list_desc: %s, dict_subst: %s,  dict_syns: %s',
-        name, list_name, list_dist, list_desc, dict_substitution, dict_synonyms)
-    syn_svc = synonym_service
-    service = name_analysis_service
+    return analyze(name, list_name, list_dist, list_desc, dict_substitution, dict_synonyms, np_svc_prep_data)
+
+
+def analyze(name: str,  # pylint: disable=too-many-arguments
+            list_name: list, list_dist: list,
+            list_desc: list, dict_substitution: dict,
+            dict_synonyms: dict,
+            np_svc_prep_data: NameProcessingService,
+            processed_name=None) -> dict:
+    """Score a single candidate name against the search lists, see score_candidate."""
+    context = ScoringContext.create(list_name, list_dist, list_desc, dict_substitution, dict_synonyms,
+                                    np_svc_prep_data)
+    return score_candidate(name, context, processed_name)
+
+
+# ok deep function
+def score_candidate(name: str, context: ScoringContext,  # pylint: disable=too-many-locals
+                    processed_name=None) -> dict:
+    """Score a single candidate name synchronously, this is the CPU bound part run by the scoring pool.
+
+    processed_name is the stored processing of the name (see processed_names.py), the name is processed again
+    without it.
+    """
+    logging.getLogger(__name__).debug('name: %s, context: %s', name, context)
+    service = thread_services.name_analysis_service
     np_svc = service.name_processing_service
-    wc_svc = service.word_classification_service
-    token_svc = service.token_classifier_service
 
-    dict_matches_counter = {}
+    if processed_name is not None:
+        np_svc.set_processed_name(processed_name)
+    else:
+        np_svc.set_name(name, context.np_svc_prep_data)
+    name_tokens = list(np_svc.name_tokens)
 
-    np_svc.set_name(name, np_svc_prep_data)
-    stand_alone_words = np_svc_prep_data.get_stand_alone_words()
+    list_name = list(context.list_name)
+    list_dist = list(context.list_dist)
+    dict_synonyms = copy.deepcopy(context.dict_synonyms)
+    candidate_dist, candidate_desc = [], []
 
-    if np_svc.name_tokens == list_name:
+    if name_tokens == list_name:
         similarity = EXACT_MATCH
     else:
-        match_list = np_svc.name_tokens
-        get_classification(service, stand_alone_words, syn_svc, match_list, wc_svc, token_svc, True)
+        candidate_dist, candidate_desc, dist_db_substitution_dict, desc_tmp_synonym_dict = classify_candidate(
+            name, context, name_tokens)
 
-        dist_db_substitution_dict = builder.get_substitutions_distinctive(service.get_list_dist())
-        service._list_dist_words, match_list, _ = remove_double_letters_list_dist_words(service.get_list_dist(),
-                                                                                        match_list)
+        candidate_dist, name_tokens, _ = remove_double_letters_list_dist_words(candidate_dist, name_tokens)
 
-        desc_tmp_synonym_dict = builder.get_substitutions_descriptive(service.get_list_desc())
         desc_tmp_synonym_dict = remove_extra_value(desc_tmp_synonym_dict, dict_synonyms)
 
         # Update key in desc_db_synonym_dict
-        service._dict_desc_words_search_conflicts = stem_key_dictionary(  # pylint: disable=protected-access
-            desc_tmp_synonym_dict
-        )
-        service._dict_desc_words_search_conflicts = add_key_values(  # pylint: disable=protected-access
-            service.get_dict_desc_search_conflicts()
-        )
+        dict_desc_search_conflicts = add_key_values(stem_key_dictionary(desc_tmp_synonym_dict))
         dict_synonyms = stem_key_dictionary(dict_synonyms)
         dict_synonyms = add_key_values(dict_synonyms)
 
         list_desc, dict_synonyms = remove_descriptive_same_category(dict_synonyms)
 
-        service._list_desc_words = list(  # pylint: disable=protected-access
-            service.get_dict_desc_search_conflicts().keys()
-        )
+        candidate_desc = list(dict_desc_search_conflicts.keys())
 
-        # Check if list_dist needs to be spplitted based on service.get_list_dist()
-        list_dist = get_split_compound(list_dist, service.get_list_dist())
-        service._list_dist_words = get_split_compound(  # pylint: disable=protected-access
-            service.get_list_dist(),
-            list_dist)
+        # Check if list_dist needs to be spplitted based on candidate_dist
+        list_dist = get_split_compound(list_dist, candidate_dist)
+        candidate_dist = get_split_compound(candidate_dist, list_dist)
 
-        list_dist_stem = [porter.stem(word) for word in list_dist]
+        list_dist_stem = [stem(word) for word in list_dist]
         vector1_dist = text_to_vector(list_dist_stem)
 
-        vector2_dist, entropy_dist = get_vector(service.get_list_dist(), list_dist,
-                                                dist_db_substitution_dict, True)
+        vector2_dist, entropy_dist = get_vector(candidate_dist, list_dist, dist_db_substitution_dict, True)
 
         if all(value == OTHER_W_DIST for value in vector2_dist.values()):
             vector2_dist, entropy_dist, _ = check_compound_dist(list_dist=list(vector2_dist.keys()),
@@ -121,22 +179,21 @@ async def auto_analyze(name: str,  # pylint: disable=too-many-locals, too-many-a
                                                                 class_subs_dict=dist_db_substitution_dict)
 
         if not vector2_dist:
-            match_list_desc = list(service.get_list_desc())
-            match_list_dist_desc = service.get_list_dist() + match_list_desc[0:-1]
-            vector2_dist, entropy_dist, service._list_desc_words = check_compound_dist(
+            match_list_dist_desc = candidate_dist + candidate_desc[0:-1]
+            vector2_dist, entropy_dist, candidate_desc = check_compound_dist(
                 list_dist=match_list_dist_desc,
-                list_desc=service.get_list_desc(),
+                list_desc=candidate_desc,
                 original_class_list=list_dist,
                 class_subs_dict=dict_synonyms)
 
         similarity_dist = round(get_similarity(vector1_dist, vector2_dist, entropy_dist), 2)
 
-        list_desc_stem = [porter.stem(word) for word in list_desc]
+        list_desc_stem = [stem(word) for word in list_desc]
         vector1_desc = text_to_vector(list_desc_stem)
 
         vector2_desc, entropy_desc = get_vector(
-            remove_spaces_list(service.get_list_desc()), list_desc,
-            service.get_dict_desc_search_conflicts())
+            remove_spaces_list(candidate_desc), list_desc,
+            dict_desc_search_conflicts)
         similarity_desc = round(
             get_similarity(vector1_desc, vector2_desc, entropy_desc), 2)
 
@@ -145,13 +202,45 @@ async def auto_analyze(name: str,  # pylint: disable=too-many-locals, too-many-a
 
     if similarity == EXACT_MATCH or (
             similarity >= MINIMUM_SIMILARITY and not is_not_real_conflict(list_name,
-                                                                          stand_alone_words,
+                                                                          context.stand_alone_words,
                                                                           list_dist,
                                                                           dict_synonyms,
-                                                                          service)):
-        dict_matches_counter.update({name: similarity})
-
-    return dict_matches_counter
+                                                                          candidate_dist,
+                                                                          candidate_desc)):
+        return {name: similarity}
+    return {}
+
+
+def classify_candidate(name: str, context: ScoringContext, name_tokens: list) -> tuple:
+    """Return the distinctive and descriptive words of the candidate and their substitutions.
+
+    The candidate must be set on this thread's analysis service. The result only depends on the candidate and the
+    word lists, so it is cached by name and rules_version (until ANALYZER_CACHE_TTL, as the substitutions and word
+    classifications can change without a new rules_version).
+    """
+    candidates = get_caches()['candidates']
+    key = (name, context.np_svc_prep_data.rules_version)
+    classified = candidates.get(key)
+    if classified is None:
+        service = thread_services.name_analysis_service
+        get_classification(service, list(context.stand_alone_words), service.synonym_service, name_tokens,
+                           service.word_classification_service, service.token_classifier_service, True)
+        classified = (list(service.get_list_dist()),
+                      list(service.get_list_desc()),
+                      thread_services.builder.get_substitutions_distinctive(service.get_list_dist()),
+                      thread_services.builder.get_substitutions_descriptive(service.get_list_desc()))
+        candidates.set(key, classified)
+    return classified
+
+
+def stem(word: str) -> str:
+    """Return the porter stem of the word, from the stems cache."""
+    stems = get_caches()['stems']
+    word_stem = stems.get(word)
+    if word_stem is None:
+        word_stem = porter.stem(word)
+        stems.set(word, word_stem)
+    return word_stem
 
 
 def get_vector(conflict_class_list, original_class_list, class_subs_dict, dist=False):
@@ -161,11 +250,11 @@ def get_vector(conflict_class_list, original_class_list, class_subs_dict, dist=F
     original_class_list = original_class_list if original_class_list else []
     class_subs_dict = class_subs_dict if class_subs_dict else {}
 
-    conflict_class_stem = [porter.stem(name.lower()) for name in conflict_class_list]
+    conflict_class_stem = [stem(name.lower()) for name in conflict_class_list]
 
     for idx, word in enumerate(original_class_list):  # pylint: disable=unused-variable
         k = word.lower()
-        word_stem = porter.stem(k)
+        word_stem = stem(k)
         counter = 1
         if word.lower() in conflict_class_list:
             entropy.append(1)
@@ -230,12 +319,12 @@ def get_similarity(vector1, vector2, entropy):
     return get_cosine(vector1, vector2) * entropy
 
 
-def is_not_real_conflict(list_name, stand_alone_words, list_dist, dict_desc, service):
+def is_not_real_conflict(list_name,  # pylint: disable=too-many-arguments
+                         stand_alone_words, list_dist, dict_desc, candidate_dist, candidate_desc):
     """Return True if the name is not a real conflict. Otherwise, false if the name is a conflict."""
     list_desc = list(dict_desc.keys())
     if is_standalone_name(list_name, stand_alone_words):
-        return stand_alone_additional_dist_desc(list_dist, service.get_list_dist(), list_desc,
-                                                service.get_list_desc())
+        return stand_alone_additional_dist_desc(list_dist, candidate_dist, list_desc, candidate_desc)
     return False
 
 
@@ -286,14 +375,14 @@ def update_dictionary_key(d1, d2):
 def remove_descriptive_same_category(dict_desc):
     """Remove descriptive with the same category."""
     dict_desc_unique_category = {key: val for i, (key, val) in enumerate(dict_desc.items())
-                                 if porter.stem(key) not in itertools.chain(*list(dict_desc.values())[:i])}
+                                 if stem(key) not in itertools.chain(*list(dict_desc.values())[:i])}
 
     return list(dict_desc_unique_category.keys()), dict_desc_unique_category
 
 
 def stem_key_dictionary(d1):
     """Stem the dictionary key."""
-    dict_stem = {porter.stem(k): v for (k, v) in d1.items()}
+    dict_stem = {stem(k): v for (k, v) in d1.items()}
 
     return dict_stem
 
@@ -0,0 +1,115 @@
+# Copyright © 2020 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bounded caches of the analyzer, one set per scoring process.
+
+The same historical names are scored search after search, so their stems, classification and substitutions, and
+their score against the same search, are kept in LRU caches with hit / miss counters.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+
+DEFAULT_CACHE_SIZE = 10000
+DEFAULT_CACHE_TTL = 300
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Least recently used cache of at most maxsize entries, each kept for up to ttl seconds (None for ever).
+
+    Values are copied in and out, as the analyzer updates the lists and dicts it works on.
+    """
+
+    def __init__(self, maxsize: int, ttl: float = None, copy_values: bool = True):
+        """Create an empty cache."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.copy_values = copy_values
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the value cached for the key, or default."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING and (entry[1] is None or entry[1] > time.monotonic()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[0]) if self.copy_values else entry[0]
+            if entry is not _MISSING:
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        """Cache the value for the key, dropping the least recently used entries over maxsize."""
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        value = copy.deepcopy(value) if self.copy_values else value
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """Return the value cached for the key, computing and caching it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        """Drop every entry, the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return the hit / miss counters and the number of entries."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+
+_caches = None  # pylint: disable=invalid-name
+_caches_lock = threading.Lock()
+
+
+def get_caches() -> dict:
+    """Return this process' caches by name, creating them from the app config on first use."""
+    global _caches  # pylint: disable=global-statement,invalid-name
+    if _caches is None:
+        with _caches_lock:
+            if _caches is None:
+                size = current_app.config.get('ANALYZER_CACHE_SIZE', DEFAULT_CACHE_SIZE)
+                ttl = current_app.config.get('ANALYZER_CACHE_TTL', DEFAULT_CACHE_TTL)
+                _caches = {
+                    # porter stems never change
+                    'stems': LRUCache(size, copy_values=False),
+                    # classification and substitutions of a candidate, by candidate and word lists version
+                    'candidates': LRUCache(size, ttl),
+                    # score of a candidate, by search and candidate
+                    'scores': LRUCache(size, ttl),
+                }
+    return _caches
+
+
+def get_cache_stats() -> dict:
+    """Return the counters of this process' caches by name."""
+    return {name: cache.stats() for name, cache in get_caches().items()}
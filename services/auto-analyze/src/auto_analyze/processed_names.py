@@ -0,0 +1,90 @@
+# Copyright © 2020 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Stored processing of the candidate names.
+
+The same historical names come back as candidates search after search, so their processing (the cleaned tokens) is
+stored in processed_names the first time it is computed, for the rules_version of the word lists it was computed
+with, and read back in bulk for every batch of candidates.
+"""
+import logging
+import threading
+
+from namex.models import ProcessedName, db
+from namex.services.name_processing.name_processing import NameProcessingService
+from sqlalchemy import exc
+
+
+_local = threading.local()  # pylint: disable=invalid-name
+
+
+def get_name_processor(np_svc_prep_data) -> NameProcessingService:
+    """Return this thread's service for processing the names missing from processed_names.
+
+    It is prepared with the word lists snapshot of np_svc_prep_data, so the names are processed with the lists whose
+    rules_version they are stored with.
+    """
+    name_processor = getattr(_local, 'name_processor', None)
+    if name_processor is None:
+        name_processor = _local.name_processor = NameProcessingService()
+    if name_processor.word_lists is not np_svc_prep_data.word_lists:
+        name_processor.prepare_data(np_svc_prep_data.word_lists)
+    return name_processor
+
+
+def process_names(names: list, np_svc_prep_data) -> list:
+    """Return the ProcessedName of each name, computed with the word lists of np_svc_prep_data."""
+    name_processor = get_name_processor(np_svc_prep_data)
+    processed_names = []
+    for name in names:
+        name_processor.set_name(name, np_svc_prep_data)
+        processed_names.append(ProcessedName.from_name_processing(name_processor, np_svc_prep_data.rules_version))
+    return processed_names
+
+
+def get_processed_names(names: list, np_svc_prep_data) -> dict:
+    """Return the ProcessedName of each name by name, storing the ones that were missing or outdated.
+
+    The names are still scored if processed_names can't be read or written, they are just processed again.
+    """
+    rules_version = np_svc_prep_data.rules_version
+    try:
+        processed_names = ProcessedName.find_current(names, rules_version)
+    except exc.SQLAlchemyError as err:
+        logging.getLogger(__name__).warning('Reading processed names failed: %s', repr(err))
+        db.session.rollback()
+        return {}
+
+    missing = [name for name in dict.fromkeys(names) if name and name not in processed_names]
+    if missing:
+        computed = process_names(missing, np_svc_prep_data)
+        processed_names.update({processed.name: processed for processed in computed})
+        try:
+            ProcessedName.save_all(computed)
+        except exc.SQLAlchemyError as err:
+            logging.getLogger(__name__).warning('Storing processed names failed: %s', repr(err))
+            db.session.rollback()
+    return processed_names
+
+
+def backfill(np_svc_prep_data, batch_size: int = 500) -> int:
+    """Store the processing of every name in the names table that is missing or outdated, returning how many."""
+    rules_version = np_svc_prep_data.rules_version
+    count = 0
+    after = ''
+    while names := ProcessedName.find_outdated_names(rules_version, after, batch_size):
+        ProcessedName.save_all(process_names(names, np_svc_prep_data))
+        count += len(names)
+        after = names[-1]
+        logging.getLogger(__name__).info('Processed %s names, up to %s', count, after)
+    return count
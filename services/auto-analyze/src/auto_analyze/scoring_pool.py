@@ -0,0 +1,151 @@
+# Copyright © 2020 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Scores batches of candidate names in a pool of worker processes.
+
+Scoring a candidate (stemming, vectors, classification) is synchronous CPU work, so the candidates are split
+into batches and handed to a process pool sized to the cores available. Each worker shares its process' word
+lists snapshot read-only across every batch it scores, the snapshot refreshes itself after WORD_LISTS_TTL.
+Every worker has its own analyzer caches (see caches.py) and reports their counters with each batch it scores.
+score_batch keeps no state of its own between calls, so batches could as well be scored from a thread pool.
+"""
+import asyncio
+import functools
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from namex.services.name_processing.name_processing import NameProcessingService
+from namex.services.name_processing.word_lists import get_word_lists
+
+from .analyzer import ScoringContext, score_candidate
+from .caches import get_cache_stats, get_caches
+from .processed_names import get_processed_names
+
+
+_executor = None  # pylint: disable=invalid-name
+_prep_data = None  # pylint: disable=invalid-name
+_worker_cache_stats = {}  # pylint: disable=invalid-name
+
+
+def get_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Return the process pool, creating it on first use.
+
+    Workers are spawned rather than forked so they don't inherit the parent's event loop or database connections.
+    """
+    global _executor  # pylint: disable=global-statement,invalid-name
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=max_workers,
+                                        mp_context=multiprocessing.get_context('spawn'),
+                                        initializer=init_worker)
+    return _executor
+
+
+def init_worker():
+    """Push the app context in the main thread of a worker, where every batch it gets is scored.
+
+    Importing auto_analyze builds the app in the worker, but the context create_app pushes only lives in the task
+    that ran it, so current_app would be unbound for the word lists, synonyms and caches otherwise.
+    """
+    from quart.globals import _app_ctx_stack  # pylint: disable=import-outside-toplevel
+
+    from auto_analyze import app  # pylint: disable=import-outside-toplevel; circular, the package imports this module
+
+    _app_ctx_stack.push(app.app_context())
+
+
+def get_prep_data() -> NameProcessingService:
+    """Return this process' name processing service, pointed at the current word lists snapshot.
+
+    A new service is prepared when the snapshot changes instead of preparing the one in use again, so the prep data
+    of a batch being scored never changes under it.
+    """
+    global _prep_data  # pylint: disable=global-statement,invalid-name
+    prep_data = _prep_data
+    if prep_data is None or prep_data.word_lists_version != get_word_lists().version:
+        prep_data = NameProcessingService()
+        prep_data.prepare_data()
+        _prep_data = prep_data
+    return prep_data
+
+
+def get_query_signature(context: ScoringContext) -> str:
+    """Return a digest of everything a candidate is scored against, besides the candidate itself."""
+    query = [context.list_name, context.list_dist, context.list_desc, context.dict_substitution,
+             context.dict_synonyms, context.np_svc_prep_data.rules_version]
+    return hashlib.sha1(json.dumps(query, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def score_batch(names: list,  # pylint: disable=too-many-arguments
+                list_name: list, list_dist: list, list_desc: list,
+                dict_substitution: dict, dict_synonyms: dict) -> tuple:
+    """Score a batch of candidate names in a worker process, returning the results with the worker's cache counters.
+
+    Every candidate is scored against the same read-only ScoringContext. Scores are cached by query signature and
+    candidate, the processing of the other names is read from processed_names in one query.
+    """
+    context = ScoringContext.create(list_name, list_dist, list_desc, dict_substitution, dict_synonyms,
+                                    get_prep_data())
+    signature = get_query_signature(context)
+    scores = get_caches()['scores']
+
+    results = {name: scores.get((signature, name)) for name in names}
+    missing = [name for name in names if results[name] is None]
+    processed_names = get_processed_names(missing, context.np_svc_prep_data) if missing else {}
+    for name in missing:
+        if results[name] is None:
+            results[name] = score_candidate(name, context, processed_names.get(name))
+            scores.set((signature, name), results[name])
+
+    return [results[name] for name in names], os.getpid(), get_cache_stats()
+
+
+def get_batches(names: list, workers: int, max_batch_size: int) -> list:
+    """Split names into consecutive batches, at least one per worker and none bigger than max_batch_size."""
+    if not names:
+        return []
+    batch_size = max(1, min(max_batch_size, -(-len(names) // max(1, workers))))
+    return [names[i:i + batch_size] for i in range(0, len(names), batch_size)]
+
+
+async def score_names(names: list,  # pylint: disable=too-many-arguments
+                      list_name: list, list_dist: list, list_desc: list,
+                      dict_substitution: dict, dict_synonyms: dict, config) -> list:
+    """Score every candidate name across the process pool, returning the results in the order of names."""
+    workers = config.get('ANALYZER_WORKERS')
+    executor = get_executor(workers)
+    loop = asyncio.get_running_loop()
+
+    futures = [
+        loop.run_in_executor(executor, functools.partial(score_batch, batch, list_name, list_dist, list_desc,
+                                                         dict_substitution, dict_synonyms))
+        for batch in get_batches(names, workers, config.get('ANALYZER_BATCH_SIZE'))
+    ]
+    results = []
+    for batch_results, pid, cache_stats in await asyncio.gather(*futures):
+        _worker_cache_stats[pid] = cache_stats
+        results.extend(batch_results)
+    return results
+
+
+def get_pool_cache_stats() -> dict:
+    """Return the analyzer cache counters summed over the workers, as of the last batch each of them scored."""
+    totals = {}
+    for cache_stats in _worker_cache_stats.values():
+        for name, stats in cache_stats.items():
+            total = totals.setdefault(name, dict.fromkeys(stats, 0))
+            for counter, value in stats.items():
+                total[counter] += value
+    return totals
@@ -65,6 +65,17 @@ class Config:  # pylint: disable=too-few-public-methods
 
     SOLR_SYNONYMS_API_URL = os.getenv('SOLR_SYNONYMS_API_URL', None)
 
+    # Candidate scoring pool, defaults to one worker per core available to this container
+    ANALYZER_WORKERS = int(os.getenv('ANALYZER_WORKERS', len(os.sched_getaffinity(0))))
+    ANALYZER_BATCH_SIZE = int(os.getenv('ANALYZER_BATCH_SIZE', '10'))
+    # Seconds before the word lists snapshot is refreshed in the background
+    WORD_LISTS_TTL = int(os.getenv('WORD_LISTS_TTL', '300'))
+    # Seconds a word classification is reused before it is looked up again
+    WORD_CLASSIFICATION_CACHE_TTL = int(os.getenv('WORD_CLASSIFICATION_CACHE_TTL', '60'))
+    # Entries kept in each analyzer cache of a scoring worker, and seconds a cached classification or score is reused
+    ANALYZER_CACHE_SIZE = int(os.getenv('ANALYZER_CACHE_SIZE', '10000'))
+    ANALYZER_CACHE_TTL = int(os.getenv('ANALYZER_CACHE_TTL', '300'))
+
     # JWT_OIDC Settings
     JWT_OIDC_WELL_KNOWN_CONFIG = os.getenv('JWT_OIDC_WELL_KNOWN_CONFIG')
     JWT_OIDC_ALGORITHMS = os.getenv('JWT_OIDC_ALGORITHMS')
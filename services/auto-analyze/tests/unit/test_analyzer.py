@@ -27,3 +27,56 @@ async def test_auto_analyzer(test_name, name, expected):
     r = await auto_analyze(name)
 
     assert r == expected
+
+
+def test_scoring_context_is_a_read_only_copy():
+    """Assert that the context keeps its own copy of the search lists and can't be changed."""
+    import dataclasses
+    from types import SimpleNamespace
+
+    from auto_analyze.analyzer import ScoringContext
+
+    list_dist = ['BLUE']
+    dict_synonyms = {'sky': ['sky', 'heaven']}
+    prep_data = SimpleNamespace(get_stand_alone_words=lambda: ['society'])
+    context = ScoringContext.create(['BLUE', 'SKY'], list_dist, ['SKY'], {}, dict_synonyms, prep_data)
+    list_dist.append('RED')
+    dict_synonyms['sky'].append('air')
+
+    assert context.list_dist == ('BLUE',)
+    assert context.dict_synonyms == {'sky': ['sky', 'heaven']}
+    assert context.stand_alone_words == ('society',)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        context.list_dist = ()
+
+
+def test_candidates_scored_from_threads_match_serial_scores(monkeypatch):
+    """Assert that scoring candidates concurrently gives the scores they get one at a time."""
+    from concurrent.futures import ThreadPoolExecutor
+    from types import SimpleNamespace
+
+    from auto_analyze import analyzer
+    from auto_analyze.caches import LRUCache
+
+    def classify_candidate(name, context, name_tokens):
+        return list(name_tokens[:-1]), list(name_tokens[-1:]), {}, {name_tokens[-1].lower(): [name_tokens[-1].lower()]}
+
+    monkeypatch.setattr(analyzer, 'classify_candidate', classify_candidate)
+    stems = {'stems': LRUCache(1000, copy_values=False)}
+    monkeypatch.setattr(analyzer, 'get_caches', lambda: stems)
+    prep_data = SimpleNamespace(get_stand_alone_words=lambda: [], rules_version='v1')
+    context = analyzer.ScoringContext.create(['blue', 'sky', 'holdings'], ['blue'], ['sky', 'holdings'], {},
+                                             {'sky': ['sky'], 'holdings': ['holdings']}, prep_data)
+    names = ['BLUE SKY HOLDINGS', 'BLUE SKY', 'RED SKY', 'BLUE HOLDINGS', 'BLUE OCEAN'] * 20
+    processed = {
+        name: SimpleNamespace(name=name, nameOriginalTokens=name.lower().split(), nameFirstPart=None,
+                              nameTokens=name.lower().split(), processedName=name.lower())
+        for name in names
+    }
+
+    serial = [analyzer.score_candidate(name, context, processed[name]) for name in names]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        concurrent = list(executor.map(lambda name: analyzer.score_candidate(name, context, processed[name]), names))
+
+    assert concurrent == serial
+    assert serial[0] == {'BLUE SKY HOLDINGS': 1.0}
@@ -0,0 +1,48 @@
+# Copyright © 2020 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test suite for the analyzer caches."""
+
+
+def test_lru_cache_evicts_least_recently_used_and_counts():
+    """Assert that the least recently used entry is dropped over maxsize and hits / misses are counted."""
+    from auto_analyze.caches import LRUCache
+
+    cache = LRUCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats() == {'hits': 3, 'misses': 1, 'size': 2}
+
+
+def test_lru_cache_copies_and_expires(monkeypatch):
+    """Assert that cached values can't be changed by the caller and expire after ttl."""
+    from auto_analyze import caches
+
+    now = [100.0]
+    monkeypatch.setattr(caches.time, 'monotonic', lambda: now[0])
+    cache = caches.LRUCache(10, ttl=60)
+    value = {'words': ['blue']}
+    cache.set('key', value)
+    value['words'].append('sky')
+    cache.get('key')['words'].append('holdings')
+
+    assert cache.get('key') == {'words': ['blue']}
+    now[0] += 61
+    assert cache.get('key') is None
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'size': 0}
@@ -0,0 +1,64 @@
+# Copyright © 2020 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test suite for the stored processing of candidate names."""
+from types import SimpleNamespace
+
+
+def test_only_missing_names_are_processed_and_stored(monkeypatch):
+    """Assert that stored names are reused and the others are processed once and stored."""
+    from auto_analyze import processed_names
+    from namex.models import ProcessedName
+
+    stored = {'BLUE SKY HOLDINGS': SimpleNamespace(name='BLUE SKY HOLDINGS')}
+    saved = []
+    monkeypatch.setattr(ProcessedName, 'find_current', lambda names, rules_version: dict(stored))
+    monkeypatch.setattr(ProcessedName, 'save_all', saved.extend)
+    monkeypatch.setattr(processed_names, 'process_names',
+                        lambda names, prep_data: [SimpleNamespace(name=name) for name in names])
+
+    result = processed_names.get_processed_names(
+        ['BLUE SKY HOLDINGS', 'RED SKY LTD', 'RED SKY LTD'], SimpleNamespace(rules_version='v1'))
+
+    assert set(result) == {'BLUE SKY HOLDINGS', 'RED SKY LTD'}
+    assert [processed.name for processed in saved] == ['RED SKY LTD']
+
+
+def test_names_are_processed_with_the_word_lists_of_the_prep_data(monkeypatch):
+    """Assert that the names are processed with the snapshot whose rules_version they are stored with."""
+    from auto_analyze import processed_names
+    from namex.models import ProcessedName
+
+    class FakeNameProcessor:
+        def __init__(self):
+            self.word_lists = None
+            self.prepared = []
+
+        def prepare_data(self, word_lists=None):
+            self.word_lists = word_lists
+            self.prepared.append(word_lists)
+
+        def set_name(self, name, np_svc_prep_data):
+            self.name = name
+
+    monkeypatch.setattr(processed_names, '_local', processed_names.threading.local())
+    monkeypatch.setattr(processed_names, 'NameProcessingService', FakeNameProcessor)
+    monkeypatch.setattr(ProcessedName, 'from_name_processing',
+                        lambda name_processor, rules_version: (name_processor.word_lists, rules_version))
+    prep_data = SimpleNamespace(word_lists=SimpleNamespace(version=2), rules_version='v2')
+
+    result = processed_names.process_names(['RED SKY LTD'], prep_data)
+    processed_names.process_names(['BLUE SKY LTD'], prep_data)
+
+    assert result == [(prep_data.word_lists, 'v2')]
+    assert processed_names.get_name_processor(prep_data).prepared == [prep_data.word_lists]
@@ -0,0 +1,59 @@
+# Copyright © 2020 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test suite for batching candidate names across the scoring pool."""
+import pytest
+
+
+@pytest.mark.parametrize('test_name, count, workers, max_batch_size, expected_sizes', [
+    ('no names', 0, 4, 10, []),
+    ('fewer names than workers', 3, 4, 10, [1, 1, 1]),
+    ('one batch per worker', 8, 4, 10, [2, 2, 2, 2]),
+    ('batches capped', 100, 4, 10, [10] * 10),
+    ('uneven tail', 10, 4, 10, [3, 3, 3, 1]),
+])
+def test_get_batches(test_name, count, workers, max_batch_size, expected_sizes):
+    """Assert that batches keep the original order and are sized for the workers."""
+    from auto_analyze.scoring_pool import get_batches
+
+    names = [f'name {i}' for i in range(count)]
+    batches = get_batches(names, workers, max_batch_size)
+
+    assert [len(batch) for batch in batches] == expected_sizes
+    assert [name for batch in batches for name in batch] == names
+
+
+def test_workers_have_the_app_context():
+    """Assert that a spawned worker can read the app config, as the word lists and caches do."""
+    from auto_analyze.caches import get_cache_stats
+    from auto_analyze.scoring_pool import get_executor
+
+    stats = get_executor(1).submit(get_cache_stats).result(timeout=120)
+
+    assert set(stats) == {'stems', 'candidates', 'scores'}
+
+
+@pytest.mark.asyncio
+async def test_score_names_in_spawned_workers(app):
+    """Assert that names are scored through the real spawn-context pool, one result per name in order."""
+    from auto_analyze.scoring_pool import get_executor, score_names
+
+    names = ['BLUE SKY HOLDINGS', 'RED SKY HOLDINGS', 'BLUE OCEAN']
+    config = {'ANALYZER_WORKERS': 2, 'ANALYZER_BATCH_SIZE': 1}
+
+    results = await score_names(names, ['blue', 'sky', 'holdings'], ['blue'], ['sky', 'holdings'], {},
+                                {'sky': ['sky'], 'holdings': ['holdings']}, config)
+
+    assert get_executor(2)._mp_context.get_start_method() == 'spawn'  # pylint: disable=protected-access
+    assert len(results) == len(names)
+    assert results[0] == {'BLUE SKY HOLDINGS': 1.0}
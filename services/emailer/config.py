@@ -79,6 +79,9 @@ class Config:  # pylint: disable=too-few-public-methods
     LEGISLATIVE_TIMEZONE = os.getenv("LEGISLATIVE_TIMEZONE", "America/Vancouver")
     TEMPLATE_PATH = os.getenv("TEMPLATE_PATH", None)
     REPORT_TEMPLATE_PATH = os.getenv('TEMPLATE_PATH', None)
+    # Reload the templates when a file changes, only meant for working on templates locally
+    TEMPLATE_AUTO_RELOAD = os.getenv("TEMPLATE_AUTO_RELOAD", "False").lower() == "true"
+    TEMPLATE_RELOAD_INTERVAL = int(os.getenv("TEMPLATE_RELOAD_INTERVAL", "2"))
 
     DASHBOARD_URL = os.getenv("DASHBOARD_URL", None)
     LOG_LEVEL = os.getenv("LOG_LEVEL", None)
@@ -43,7 +43,7 @@ from config import Config, Production
 from namex_emailer.utils import get_run_version
 
 from .resources import register_endpoints
-from .services import queue
+from .services import email_templates, queue
 
 from namex.services import flags
 
@@ -55,6 +55,7 @@ def create_app(environment: Config = Production, **kwargs) -> Flask:
 
     flags.init_app(app)
     queue.init_app(app)
+    email_templates.init_app(app)
     register_endpoints(app)
 
     return app
@@ -18,13 +18,14 @@ Processors hold the business logic for how an email is interpreted and sent.
 from __future__ import annotations
 
 from datetime import datetime
-from pathlib import Path
 from typing import Tuple
 
 import requests
-from flask import current_app, request
+from flask import request
 from gcp_queue.logging import structured_log
 
+from namex_emailer.services import email_templates
+
 
 def substitute_template_parts(template_code: str) -> str:
     """Substitute template parts in main template.
@@ -36,15 +37,9 @@ def substitute_template_parts(template_code: str) -> str:
     - template parts can only be one level deep, ie: this rudimentary framework does not handle nested template
     parts. There is no recursive search and replace.
     """
-    template_parts = [
-        "nr-footer"
-    ]
-
     # substitute template parts - marked up by [[filename]]
-    for template_part in template_parts:
-        # src/namex_emailer/email_templates/common/nr-footer.html
-        template_part_code = Path(f'{current_app.config.get("TEMPLATE_PATH")}/template-parts/name-request/{template_part}.html').read_text()
-        template_code = template_code.replace("[[{}.html]]".format(template_part), template_part_code)
+    # src/namex_emailer/email_templates/template-parts/name-request/nr-footer.html
+    template_code = email_templates.substitute_parts(template_code, "template-parts/name-request", ["nr-footer"])
 
     return template_code
 
@@ -65,32 +60,24 @@ def get_main_template(request_action, template_name, status=None):
     Returns:
         str: The content of the template if found, otherwise None.
     """
-    base_path = Path(current_app.config.get("TEMPLATE_PATH", ""))
-
-    # Check the request_action template first
-    template_path = base_path / request_action / template_name
-    if template_path.exists():
-        return template_path.read_text()
-
-    # Check the specific status-based template
+    # Check the request_action template first, then the specific status-based template
+    template_paths = [f"{request_action}/{template_name}"]
     if status:
-        template_path = base_path / request_action / status / template_name
-        if template_path.exists():
-            return template_path.read_text()
+        template_paths.append(f"{request_action}/{status}/{template_name}")
+    template_path = email_templates.resolve(*template_paths)
 
-    structured_log(request, "DEBUG", f"Not Found the template from {request_action}/{status}/{template_name}")
+    if not template_path:
+        structured_log(request, "DEBUG", f"Not Found the template from {request_action}/{status}/{template_name}")
 
-    # Check the common template fallback
-    common_template_path = base_path / "common" / template_name
-    if common_template_path.exists():
-        return common_template_path.read_text()
+        # Check the common template fallback, then the status-based common template
+        common_template_paths = [f"common/{template_name}"]
+        if status:
+            common_template_paths.append(f"common/{status}/{template_name}")
+        template_path = email_templates.resolve(*common_template_paths)
 
-    # Check the status-based common template
-    if status:
-        common_template_path = base_path / "common" / status / template_name
-        if common_template_path.exists():
-            return common_template_path.read_text()
+    if not template_path:
+        # Log error if template not found
+        structured_log(request, "ERROR", f"Failed to get {request_action}, {status}, {template_name} email template")
+        return None
 
-    # Log error if template not found
-    structured_log(request, "ERROR", f"Failed to get {request_action}, {status}, {template_name} email template")
-    return None
+    return email_templates.get(template_path)
@@ -23,7 +23,7 @@ from flask import current_app, request
 from gcp_queue.logging import structured_log
 from jinja2 import Template
 
-from namex_emailer.services.helpers import query_nr_number, get_bearer_token
+from namex_emailer.services.helpers import check_authorized, query_nr_number, get_bearer_token
 from namex_emailer.email_processors import get_main_template, substitute_template_parts
 
 
@@ -74,10 +74,10 @@ def _get_pdfs(nr_id: str, payment_token: str) -> list:
         return []
 
     # get nr payments
-    nr_payments = requests.get(
+    nr_payments = check_authorized(requests.get(
         f'{current_app.config.get("NAMEX_SVC_URL")}/payments/{nr_id}',
         headers={"Accept": "application/json", "Authorization": f"Bearer {token}"},
-    )
+    ))
     if nr_payments.status_code != HTTPStatus.OK:
         structured_log(request, "ERROR", f"Failed to get payment info for name request id: {nr_id}")
         return []
@@ -96,11 +96,11 @@ def _get_pdfs(nr_id: str, payment_token: str) -> list:
         return []
 
     # get receipt
-    receipt = requests.post(
+    receipt = check_authorized(requests.post(
         f'{current_app.config.get("NAMEX_SVC_URL")}/payments/{payment_id}/receipt',
         json={},
         headers={"Accept": "application/pdf", "Authorization": f"Bearer {token}"},
-    )
+    ))
     if receipt.status_code != HTTPStatus.OK:
         structured_log(request, "ERROR", f"Failed to get receipt pdf for name request id: {nr_id}")
         return []
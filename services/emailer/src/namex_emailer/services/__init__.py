@@ -15,5 +15,8 @@
 from cachetools import TTLCache
 from gcp_queue.pubsub import GcpQueue
 
+from .template_registry import TemplateRegistry
+
 queue = GcpQueue()
 ce_cache = TTLCache(maxsize=12000, ttl=1200)
+email_templates = TemplateRegistry("TEMPLATE_PATH")
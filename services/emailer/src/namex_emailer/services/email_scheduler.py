@@ -1,9 +1,9 @@
 import json
 from datetime import datetime, timezone, timedelta
-import uuid
 
 from flask import current_app, request
 from gcp_queue.logging import structured_log
+from google.api_core.exceptions import AlreadyExists, NotFound
 from google.cloud.tasks_v2 import CloudTasksClient, HttpMethod
 from google.protobuf import timestamp_pb2
 
@@ -11,12 +11,38 @@ from google.protobuf import timestamp_pb2
 # Singleton GCP Cloud Tasks Client
 cloud_tasks_client = CloudTasksClient()
 
+# Decision emails are sent this long after the decision, unless a newer decision for the NR replaces them
+EMAIL_DELAY = timedelta(minutes=5)
+
+# Task ids are '<nr number>-<slot>', the slot being the minute the task was scheduled in. A pending task can only
+# have been scheduled within the last EMAIL_DELAY, so the few ids it can have are known without listing the queue.
+TASK_SLOT_SECONDS = 60
+
+# Task ids can't be reused for a while after the task is deleted, so decisions for the same NR within the same
+# minute move on to the next slots
+MAX_SLOT_BUMPS = 3
+
+
+def get_task_id(nr_num: str, slot: int) -> str:
+    """Return the task id for the NR number and slot: 'NR_123456-29380211'."""
+    return f"{nr_num}-{slot}"
+
+
+def get_slot(moment: datetime) -> int:
+    return int(moment.timestamp()) // TASK_SLOT_SECONDS
+
+
+def get_pending_slots(now: datetime) -> range:
+    """Return every slot a task that is still pending at now can have been named after."""
+    return range(get_slot(now - EMAIL_DELAY), get_slot(now) + MAX_SLOT_BUMPS + 1)
+
 
 def schedule_or_reschedule_email(nr_num: str, option: str, cloud_event_payload: dict):
     """
     Cancel any in-flight email task for this nr number and schedule a new one 5 minutes out.
     This is only used for approved, conditional, and rejected emails that are not resends.
     """
+    now = datetime.now(timezone.utc)
 
     # Identify the queue
     remote_queue_path = cloud_tasks_client.queue_path(
@@ -26,29 +52,20 @@ def schedule_or_reschedule_email(nr_num: str, option: str, cloud_event_payload:
     )
     # Create a timestamp 5 minutes in the future
     timestamp = timestamp_pb2.Timestamp()
-    timestamp.FromDatetime(datetime.now(timezone.utc) + timedelta(minutes=5))
+    timestamp.FromDatetime(now + EMAIL_DELAY)
 
-    # 1) Remove any pending email tasks for this NR number
-    for task in cloud_tasks_client.list_tasks(parent=remote_queue_path):
-        existing_id = task.name.rsplit("/", 1)[-1]
-        if existing_id.startswith(nr_num):
-            structured_log(request, "INFO", f"Cancelled pending Cloud Tasks job '{existing_id}' for {nr_num}")
-            cloud_tasks_client.delete_task(name=task.name)
-
-    # 2) Generate a unique task ID for the NR number: 'NR_123456-APPROVED-43255d'
-    task_id = f"{nr_num}-{option}-{uuid.uuid4().hex[:6]}"
-
-    # 3) Build the full remote queue path including the task id
-    task_name = cloud_tasks_client.task_path(
-        project=current_app.config["GCP_PROJECT"],
-        location=current_app.config["GCP_REGION"],
-        queue=current_app.config["CLOUD_TASKS_QUEUE_ID"],
-        task=task_id
-    )
+    # 1) Remove any pending email tasks for this NR number, trying every id it can have rather than listing the queue
+    for slot in get_pending_slots(now):
+        existing_name = get_task_name(get_task_id(nr_num, slot))
+        try:
+            cloud_tasks_client.delete_task(name=existing_name)
+            structured_log(request, "INFO", f"Cancelled pending Cloud Tasks job '{existing_name}' for {nr_num}")
+        except NotFound:
+            # never scheduled, or already sent
+            pass
 
-    # 4) Assemble the Cloud Task
+    # 2) Assemble the Cloud Task
     task = {
-        "name":             task_name,
         "schedule_time":    timestamp,
         "http_request": {
             "http_method":  HttpMethod.POST,
@@ -61,5 +78,26 @@ def schedule_or_reschedule_email(nr_num: str, option: str, cloud_event_payload:
         }
     }
 
-    # 5) Enqueue the task to come back to the emailer at deliver_scheduled_email() endpoint in 5 minutes time
-    cloud_tasks_client.create_task(parent=remote_queue_path, task=task)
+    # 3) Enqueue the task to come back to the emailer at deliver_scheduled_email() endpoint in 5 minutes time,
+    #    named after the current slot, or the next free one when the NR already had a decision this minute
+    slot = get_slot(now)
+    for bump in range(MAX_SLOT_BUMPS + 1):
+        task["name"] = get_task_name(get_task_id(nr_num, slot + bump))
+        try:
+            cloud_tasks_client.create_task(parent=remote_queue_path, task=task)
+            structured_log(request, "INFO", f"Scheduled Cloud Tasks job '{task['name']}' for {nr_num} - '{option}'")
+            return
+        except AlreadyExists:
+            continue
+
+    raise RuntimeError(f"No free Cloud Tasks id to schedule the email for {nr_num}")
+
+
+def get_task_name(task_id: str) -> str:
+    """Return the full remote task path for a task id in the configured queue."""
+    return cloud_tasks_client.task_path(
+        project=current_app.config["GCP_PROJECT"],
+        location=current_app.config["GCP_REGION"],
+        queue=current_app.config["CLOUD_TASKS_QUEUE_ID"],
+        task=task_id
+    )
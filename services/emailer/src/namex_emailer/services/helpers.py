@@ -1,34 +1,39 @@
 from copy import deepcopy
 from datetime import datetime
 
+from http import HTTPStatus
+
 import pytz
 import requests
-from cachetools import cached, TTLCache
 from flask import current_app, request
 from gcp_queue.logging import structured_log
 from urllib.parse import urlencode
 
 from namex_emailer.constants.notification_options import DECISION_OPTIONS, Option
+from namex_emailer.services.token_cache import token_cache
 
 @staticmethod
-@cached(cache=TTLCache(maxsize=1, ttl=180))
 def get_bearer_token():
-    """Get a valid Bearer token for the service to use."""
+    """Get a valid Bearer token for the service to use, shared until shortly before it expires."""
     token_url = current_app.config.get('ACCOUNT_SVC_AUTH_URL')
     client_id = current_app.config.get('ACCOUNT_SVC_CLIENT_ID')
     client_secret = current_app.config.get('ACCOUNT_SVC_CLIENT_SECRET')
 
     # get service account token
-    res = requests.post(url=token_url,
-                        data='grant_type=client_credentials',
-                        headers={'content-type': 'application/x-www-form-urlencoded'},
-                        auth=(client_id, client_secret))
-
     try:
-        return res.json().get('access_token')
+        authenticated, token = token_cache.get_token(token_url, client_id, client_secret)
+        return token if authenticated else None
     except Exception:
         return None
 
+
+def check_authorized(response):
+    """Invalidate the Bearer token when the response is a 401, so a revoked token isn't used again."""
+    if response is not None and response.status_code == HTTPStatus.UNAUTHORIZED:
+        token_cache.invalidate(current_app.config.get('ACCOUNT_SVC_AUTH_URL'),
+                               current_app.config.get('ACCOUNT_SVC_CLIENT_ID'))
+    return response
+
 @staticmethod
 def as_legislation_timezone(date_time: datetime) -> datetime:
     """Return a datetime adjusted to the legislation timezone."""
@@ -104,7 +109,7 @@ def query_nr_number(identifier: str):
 
     nr_response = requests.get(namex_url + '/requests/' + identifier, headers=get_headers(token))
 
-    return nr_response
+    return check_authorized(nr_response)
 
 
 @staticmethod
@@ -116,21 +121,21 @@ def query_notification_event(event_id: str):
 
     nr_response = requests.get(f'{namex_url}/events/event/{event_id}', headers=get_headers(token))
 
-    return nr_response
+    return check_authorized(nr_response)
 
 
 @staticmethod
 def send_email(email: dict, token: str):
     """Send the email"""
     structured_log(request, "INFO", f"Send Email: {email}")
-    return requests.post(
+    return check_authorized(requests.post(
         f'{current_app.config.get("NOTIFY_API_URL", "")}',
         json=email,
         headers={
             "Content-Type": "application/json",
             "Authorization": f"Bearer {token}",
         },
-    )
+    ))
     
 @staticmethod
 def write_to_events(ce, email):
@@ -157,10 +162,10 @@ def update_resend_timestamp(event_id: str):
     token = get_bearer_token()
 
     try:
-        response = requests.patch(
+        response = check_authorized(requests.patch(
             f"{namex_url}/events/event/{event_id}",
             headers=get_headers(token)
-        )
+        ))
         response.raise_for_status()
         return True
     except requests.exceptions.RequestException as e:
@@ -222,11 +227,11 @@ def _record_event(nr_num, event_json):
     token = get_bearer_token()
 
     try:
-        nr_response = requests.post(
+        nr_response = check_authorized(requests.post(
             f"{namex_url}/events/{nr_num}",
             json=payload,
             headers=get_headers(token)
-        )
+        ))
         nr_response.raise_for_status()  # Raise an HTTPError for bad responses (4xx and 5xx)
         structured_log(request, "DEBUG", f'Successfully recorded notification event for NR {nr_num}')
         return True
@@ -0,0 +1,110 @@
+"""In-memory registry of the email templates.
+
+Every email used to read its template and template parts from disk, probing several fallback paths first. The
+registry reads the whole template directory once (at init_app, or on first use) and answers from memory after that.
+With TEMPLATE_AUTO_RELOAD set, a background thread reloads the directory when a file changes, which is only meant
+for working on templates locally.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from flask import Flask, current_app
+
+DEFAULT_RELOAD_INTERVAL = 2
+
+
+class TemplateRegistry:
+    """Every file under the directory named by the path_config_key setting, keyed by its relative path."""
+
+    def __init__(self, path_config_key: str, app: Flask = None):
+        """Initializer, supports setting the app context on instantiation."""
+        self.path_config_key = path_config_key
+        self._root = None
+        self._templates = None
+        self._resolved = {}
+        self._lock = threading.Lock()
+        self._watcher = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app: Flask):
+        """Load the templates, and watch them for changes if TEMPLATE_AUTO_RELOAD is set."""
+        root = app.config.get(self.path_config_key)
+        if not root or not Path(root).is_dir():
+            app.logger.warning(f"{self.path_config_key} is not a directory, templates will be loaded on first use")
+            return
+
+        self.load(root)
+        if app.config.get("TEMPLATE_AUTO_RELOAD", False) and self._watcher is None:
+            interval = app.config.get("TEMPLATE_RELOAD_INTERVAL", DEFAULT_RELOAD_INTERVAL)
+            self._watcher = threading.Thread(target=self._watch, args=(root, interval), daemon=True)
+            self._watcher.start()
+
+    def load(self, root):
+        """Read every file under root, replacing the templates loaded before."""
+        root_path = Path(root)
+        templates = {
+            path.relative_to(root_path).as_posix(): path.read_text()
+            for path in root_path.rglob("*")
+            if path.is_file()
+        }
+        with self._lock:
+            self._root = str(root)
+            self._templates = templates
+            self._resolved = {}
+
+    def get(self, path: str) -> Optional[str]:
+        """Return the template at a path relative to the template directory, None if there is none."""
+        return self._get_templates().get(path)
+
+    def resolve(self, *paths: str) -> Optional[str]:
+        """Return the first of the paths that has a template, remembering the answer for the same paths."""
+        resolved = self._resolved
+        if paths not in resolved:
+            templates = self._get_templates()
+            found = next((path for path in paths if path in templates), None)
+            if self._templates is None:
+                # nothing is loaded yet, the answer may change once it is
+                return found
+            resolved[paths] = found
+        return resolved[paths]
+
+    def substitute_parts(self, template_code: str, parts_dir: str, template_parts: list) -> str:
+        """Replace each [[part.html]] marker with the part under parts_dir."""
+        for template_part in template_parts:
+            part_path = f"{parts_dir}/{template_part}.html"
+            template_part_code = self.get(part_path)
+            if template_part_code is None:
+                raise FileNotFoundError(f"Template part {part_path} not found")
+            template_code = template_code.replace("[[{}.html]]".format(template_part), template_part_code)
+
+        return template_code
+
+    def _get_templates(self):
+        if self._templates is None:
+            root = current_app.config.get(self.path_config_key)
+            if not root:
+                # nothing to load until the path is set, and nothing to remember either
+                return {}
+            self.load(root)
+        return self._templates
+
+    def _watch(self, root, interval):
+        modified = self._get_modified_times(root)
+        while True:
+            time.sleep(interval)
+            try:
+                current = self._get_modified_times(root)
+                if current != modified:
+                    self.load(root)
+                    modified = current
+            except OSError:
+                # A file may be removed mid-scan while it is being edited, try again on the next pass.
+                pass
+
+    @staticmethod
+    def _get_modified_times(root):
+        return {str(path): path.stat().st_mtime for path in Path(root).rglob("*") if path.is_file()}
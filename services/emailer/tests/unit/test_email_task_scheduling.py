@@ -1,10 +1,13 @@
 import uuid
+from datetime import datetime, timedelta, timezone
 
 import pytest
+from google.api_core.exceptions import AlreadyExists, NotFound
 from http import HTTPStatus
 from simple_cloudevent import to_queue_message, SimpleCloudEvent
 
-from namex_emailer.services.email_scheduler import schedule_or_reschedule_email, cloud_tasks_client
+from namex_emailer.services import email_scheduler
+from namex_emailer.services.email_scheduler import schedule_or_reschedule_email
 from namex_emailer.services import ce_cache
 
 
@@ -22,120 +25,132 @@ def configure_app(app):
     ce_cache.clear()
 
 
-def make_fake_task(name: str):
+class FakeTasksClient:
     """
-    Stub out the bare minimum of a CloudTasks Task for our tests.
+    In-memory stand-in for the CloudTasksClient calls the scheduler makes.
 
-    In production, list_tasks() returns a protobuf `Task` with many fields,
-    but schedule_or_reschedule_email() only ever examines `task.name` to
-    detect and cancel existing jobs. This stub gives us an object with
-    exactly the `.name` attribute we need, without pulling in real GCP types.
+    Like Cloud Tasks, a task name can't be created twice, and stays taken
+    for a while after the task is deleted.
     """
-    class T: pass
-    t = T()
-    t.name = name
-    return t
 
+    def __init__(self):
+        self.tasks = {}
+        self.deleted = []
 
-def test_schedule_creates_one_task_when_none_pending(monkeypatch, app):
-    """
-    Verify that when there are no existing tasks for a given NR number,
-    schedule_or_reschedule_email schedules exactly one new Cloud Task
-    using the correct queue, handler URL, and service account.
-    """
+    @staticmethod
+    def queue_path(project, location, queue):
+        return f"projects/{project}/locations/{location}/queues/{queue}"
 
-    # Capture any tasks created
-    created = []
+    def task_path(self, project, location, queue, task):
+        return f"{self.queue_path(project, location, queue)}/tasks/{task}"
 
-    # 1) Simulate an empty queue: list_tasks() returns no tasks
-    monkeypatch.setattr(cloud_tasks_client, "list_tasks", lambda parent: [])
+    def create_task(self, parent, task):
+        if task["name"] in self.tasks or task["name"] in self.deleted:
+            raise AlreadyExists(task["name"])
+        assert task["name"].startswith(f"{parent}/tasks/")
+        self.tasks[task["name"]] = task
+        return task
 
-    # 2) Ensure delete_task() is never called in this scenario
-    monkeypatch.setattr(
-        cloud_tasks_client,
-        "delete_task",
-        lambda name: (_ for _ in ()).throw(AssertionError("should not delete"))
-    )
+    def delete_task(self, name):
+        if name not in self.tasks:
+            raise NotFound(name)
+        del self.tasks[name]
+        self.deleted.append(name)
 
-    # 3) Stub out create_task() to record its inputs instead of calling GCP
-    def fake_create(parent, task):
-        created.append((parent, task))
-    monkeypatch.setattr(cloud_tasks_client, "create_task", fake_create)
+    def list_tasks(self, parent):
+        raise AssertionError("the scheduler should not list the queue")
 
-    # 4) Invoke the scheduler within a Flask app context
+
+@pytest.fixture
+def tasks_client(monkeypatch):
+    fake = FakeTasksClient()
+    monkeypatch.setattr(email_scheduler, "cloud_tasks_client", fake)
+    return fake
+
+
+def test_schedule_creates_one_task_when_none_pending(app, tasks_client):
+    """
+    Verify that when there are no existing tasks for a given NR number,
+    schedule_or_reschedule_email schedules exactly one new Cloud Task
+    using the correct queue, handler URL, and service account.
+    """
     with app.app_context():
         schedule_or_reschedule_email("NR123", "APPROVED", {"foo": "bar"})
 
-    # 5) Assert that exactly one task was created
-    assert len(created) == 1
-    parent, task = created[0]
+    # Nothing was pending, so nothing was cancelled
+    assert tasks_client.deleted == []
+    assert len(tasks_client.tasks) == 1
+    name, task = next(iter(tasks_client.tasks.items()))
 
-    # 6) The queue path must use the configured project & region
+    # The task lives in the configured queue and is named after the NR number
     prefix = (
         f"projects/{app.config['GCP_PROJECT']}"
         f"/locations/{app.config['GCP_REGION']}/queues/"
     )
-    assert parent.startswith(prefix), f"Queue path {parent} does not start with {prefix}"
+    assert name.startswith(prefix), f"Task name {name} does not start with {prefix}"
+    assert "/tasks/NR123-" in name
 
-    # 7) Inside the task payload, verify the HTTP request:
     req = task["http_request"]
-    # The URL must match the configured handler endpoint
     assert req["url"] == app.config["CLOUD_TASKS_HANDLER_URL"]
-    # The OIDC token must specify the configured service account
     assert (
         req["oidc_token"]["service_account_email"]
         == app.config["CLOUD_TASKS_INVOKER_SERVICE_ACCOUNT"]
     )
 
 
-def test_schedule_deletes_existing_then_creates(monkeypatch, app):
+def test_schedule_deletes_existing_then_creates(app, tasks_client):
     """
     Verify that when an in-flight task already exists for a given NR number,
-    schedule_or_reschedule_email cancels it before creating a fresh one
-    with the correct name and scheduling parameters.
+    schedule_or_reschedule_email cancels it before creating a fresh one,
+    and leaves the tasks of other NRs alone.
     """
-    # Prepare lists to capture calls
-    deleted = []
-    created = []
-
-    # 1) Simulate an existing pending task in the queue for NR123
-    fake_name = (
-        "projects/test-project/locations/test-region/"
-        "queues/test-queue/tasks/NR123-old-abc"
-    )
-    monkeypatch.setattr(
-        cloud_tasks_client,
-        "list_tasks",
-        lambda parent: [make_fake_task(fake_name)]
-    )
+    with app.app_context():
+        schedule_or_reschedule_email("NR123", "APPROVED", {"foo": "bar"})
+        schedule_or_reschedule_email("NR456", "APPROVED", {"foo": "bar"})
+        first_name = next(name for name in tasks_client.tasks if "/tasks/NR123-" in name)
 
-    # 2) Stub delete_task() to record which task name gets deleted
-    monkeypatch.setattr(
-        cloud_tasks_client,
-        "delete_task",
-        lambda name: deleted.append(name)
-    )
+        schedule_or_reschedule_email("NR123", "REJECTED", {"baz": "qux"})
 
-    # 3) Stub create_task() to record the payload of the new task
-    monkeypatch.setattr(
-        cloud_tasks_client,
-        "create_task",
-        lambda parent, task: created.append(task)
-    )
+    # The first decision's task was cancelled exactly once
+    assert tasks_client.deleted == [first_name]
+
+    # One pending task per NR, the NR123 one carrying the newer decision
+    pending = [task for name, task in tasks_client.tasks.items() if "/tasks/NR123-" in name]
+    assert len(pending) == 1
+    assert pending[0]["http_request"]["body"] == b'{"baz": "qux"}'
+    assert len(tasks_client.tasks) == 2
+
+
+def test_reschedule_within_the_same_minute_moves_to_the_next_slot(app, tasks_client, monkeypatch):
+    """
+    Verify that a task name taken by a task cancelled in the same minute
+    is skipped, and that a task from an earlier minute still pending is
+    found and cancelled.
+    """
+    now = datetime(2025, 5, 14, 12, 0, 30, tzinfo=timezone.utc)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    monkeypatch.setattr(email_scheduler, "datetime", FrozenDatetime)
+    slot = email_scheduler.get_slot(now)
+    path = tasks_client.task_path("test-project", "test-region", "test-queue", "NR123-{}")
 
-    # 4) Run the scheduler in the Flask app context
     with app.app_context():
-        schedule_or_reschedule_email("NR123", "REJECTED", {"baz": "qux"})
+        for option in ("APPROVED", "REJECTED", "CONDITIONAL"):
+            schedule_or_reschedule_email("NR123", option, {"option": option})
 
-    # 5) Assert the existing task was deleted exactly once
-    assert deleted == [fake_name]
+        assert tasks_client.deleted == [path.format(slot), path.format(slot + 1)]
+        assert list(tasks_client.tasks) == [path.format(slot + 2)]
 
-    # 6) Assert exactly one new task was created
-    assert len(created) == 1
+        # Four minutes later the task is still pending, and is cancelled
+        now += timedelta(minutes=4)
+        schedule_or_reschedule_email("NR123", "APPROVED", {"option": "APPROVED"})
 
-    # 7) Verify the new task’s name starts with "NR123-REJECTED-"
-    new_task_name = created[0]["name"]
-    assert "/tasks/NR123-REJECTED-" in new_task_name
+    assert tasks_client.deleted[-1] == path.format(slot + 2)
+    assert list(tasks_client.tasks) == [path.format(slot + 4)]
 
 
 @pytest.fixture
@@ -0,0 +1,41 @@
+"""Test suite for the emailer's service account token cache."""
+from http import HTTPStatus
+from types import SimpleNamespace
+
+from namex_emailer.services.token_cache import TokenCache
+
+
+class FakeIdentityServer:
+    def __init__(self):
+        self.calls = 0
+
+    def fetch(self, auth_url, client_id, secret):
+        self.calls += 1
+        return True, {"access_token": f"token-{self.calls}", "expires_in": 300}
+
+
+def test_token_is_reused_until_invalidated():
+    """Assert a token is fetched once while it is valid, and again once it is invalidated."""
+    server = FakeIdentityServer()
+    cache = TokenCache(fetch=server.fetch)
+
+    assert cache.get_token("https://auth", "emailer", "secret") == (True, "token-1")
+    assert cache.get_token("https://auth", "emailer", "secret") == (True, "token-1")
+    cache.invalidate("https://auth", "emailer")
+    assert cache.get_token("https://auth", "emailer", "secret") == (True, "token-2")
+
+
+def test_unauthorized_response_invalidates_the_token(app, monkeypatch):
+    """Assert a 401 from a downstream API drops the cached token."""
+    from namex_emailer.services import helpers
+
+    server = FakeIdentityServer()
+    cache = TokenCache(fetch=server.fetch)
+    monkeypatch.setattr(helpers, "token_cache", cache)
+
+    with app.app_context():
+        assert helpers.get_bearer_token() == "token-1"
+        helpers.check_authorized(SimpleNamespace(status_code=HTTPStatus.OK))
+        assert helpers.get_bearer_token() == "token-1"
+        helpers.check_authorized(SimpleNamespace(status_code=HTTPStatus.UNAUTHORIZED))
+        assert helpers.get_bearer_token() == "token-2"
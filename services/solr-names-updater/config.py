@@ -84,6 +84,12 @@ class Config():  # pylint: disable=too-few-public-methods
     SUB_SERVICE_ACCOUNT = os.getenv('BUSINESS_SERVICE_ACCOUNT', '')
 
     SOLR_FEEDER_API_URL = os.getenv('SOLR_FEEDER_API_URL', None)
+    # Seconds to collect concurrent nr events for into one solr update per core, 0 sends each event on its own.
+    # Needs GUNICORN_THREADS > 1 for the events to arrive concurrently.
+    SOLR_BATCH_WINDOW = float(os.getenv('SOLR_BATCH_WINDOW', '0'))
+    SOLR_BATCH_MAX_DOCS = int(os.getenv('SOLR_BATCH_MAX_DOCS', '100'))
+    # Milliseconds within which solr commits the batched updates, instead of a hard commit per update
+    SOLR_COMMIT_WITHIN = int(os.getenv('SOLR_COMMIT_WITHIN', '1000'))
 
     ALEMBIC_INI = 'migrations/alembic.ini'
 
@@ -25,13 +25,13 @@ from namex.models import db, Name  # noqa: 1001
 
 
 def convert_to_solr_conformant_json(request_str):
-    """Replace the 'add' keys append with a number with the key 'add'.
+    """Replace the 'add' and 'delete' keys appended with a number with the keys 'add' and 'delete'.
 
     This is needed as dict do not allow duplicates keys.  The solr api expects a json
     format that requires duplicate add keys so as a workaround this limitation, this is
     done after the payload_dict is converted to a json string.
     """
-    request_str = re.sub(r"\"add\d+\":", "\"add\":", request_str)  # noqa:Q000
+    request_str = re.sub(r"\"(add|delete)\d+\":", r'"\1":', request_str)  # noqa:Q000
     return request_str
 
 
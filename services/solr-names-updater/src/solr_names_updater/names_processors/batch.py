@@ -0,0 +1,178 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Micro-batching of the solr updates made for concurrent nr events.
+
+Every nr state change used to post its own update to the solr feeder, each one with a hard commit. When batching is
+on (SOLR_BATCH_WINDOW > 0) the updates of the events that arrive within the window, or until SOLR_BATCH_MAX_DOCS
+documents are waiting, are merged and sent as one update per core, committed with commitWithin instead.
+
+The first event of a batch waits out the window and writes the batch, the others wait for it. An event only returns,
+and so only gets its message acked, once the batch holding its updates was written. When the update of a core fails
+its nrs are sent again one by one, and the events of the nrs that still fail raise, so their messages are redelivered.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+
+import requests
+from flask import current_app
+from gcp_queue.logging import structured_log
+
+from solr_names_updater.names_processors import convert_to_solr_conformant_json  # noqa: I001
+from solr_names_updater.names_processors import post_to_solr_feeder  # noqa: I001
+
+
+@dataclass
+class SolrUpdate:
+    """The documents to add to and delete from a core for a nr.
+
+    A later update for the same core and key is merged into the earlier one in a batch (see merge).
+    """
+
+    core: str
+    key: str
+    adds: list = field(default_factory=list)
+    deletes: list = field(default_factory=list)
+
+    def merge(self, later: SolrUpdate) -> SolrUpdate:
+        """Return this update followed by a later one of the same nr, as a single update.
+
+        The later adds win, and every delete is kept unless the later adds put the document back, so the documents
+        of names a reset or cancel removed are still deleted when the nr is approved again in the same batch.
+        """
+        added_ids = {doc['id'] for doc in later.adds}
+        deletes = [doc_id for doc_id in dict.fromkeys(self.deletes + later.deletes) if doc_id not in added_ids]
+        return SolrUpdate(self.core, self.key, adds=later.adds, deletes=deletes)
+
+
+class _Batch:  # pylint: disable=too-few-public-methods
+    """The updates collected during one window."""
+
+    def __init__(self):
+        self.updates = {}
+        self.full = threading.Event()
+        self.written = threading.Event()
+        self.error = None
+        self.failed = {}
+
+    def put(self, update: SolrUpdate):
+        key = (update.core, update.key)
+        self.updates[key] = self.updates[key].merge(update) if key in self.updates else update
+
+    @property
+    def doc_count(self):
+        return sum(len(update.adds) + len(update.deletes) for update in self.updates.values())
+
+
+def log_failure(payload_dict: dict, resp, target: str):
+    """Log the solr feeder response of an update that failed."""
+    structured_log(
+        payload_dict,
+        severity='ERROR',
+        message=f'failed to update {target}, status code: {resp.status_code}, error reason: {resp.reason}, '
+                f'error details: {resp.text}'
+    )
+
+
+def get_feeder_error(resp, target: str) -> requests.HTTPError:
+    """Return the error raised to the events of an update that failed, a RequestException so they are redelivered."""
+    return requests.HTTPError(f'failed to update {target}, status code: {resp.status_code}', response=resp)
+
+
+def construct_batch_payload_dict(core: str, updates: list, commit_within: int):
+    """Construct the json payload used to invoke the solr feeder endpoint for all the updates of a core."""
+    payload_request = {}
+    for update in updates:
+        for doc_id in update.deletes:
+            payload_request[f'delete{len(payload_request)}'] = {'id': doc_id, 'commitWithin': commit_within}
+        for doc in update.adds:
+            payload_request[f'add{len(payload_request)}'] = {'doc': doc, 'commitWithin': commit_within}
+
+    request_str = json.dumps(payload_request)
+    request_str = convert_to_solr_conformant_json(request_str)
+    return {'solr_core': core, 'request': request_str}
+
+
+class SolrBatcher:
+    """Collects the solr updates of concurrent events and writes them together."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._batch = None
+
+    @property
+    def enabled(self):
+        return current_app.config.get('SOLR_BATCH_WINDOW', 0) > 0
+
+    def submit(self, updates: list):
+        """Add the updates to the current batch, and return once the batch was written.
+
+        Raises the error that stopped the batch from being written, so the message goes back on the queue.
+        """
+        with self._lock:
+            batch = self._batch
+            is_writer = batch is None
+            if is_writer:
+                batch = self._batch = _Batch()
+            for update in updates:
+                batch.put(update)
+            if batch.doc_count >= current_app.config.get('SOLR_BATCH_MAX_DOCS', 100):
+                batch.full.set()
+
+        if is_writer:
+            batch.full.wait(current_app.config.get('SOLR_BATCH_WINDOW'))
+            with self._lock:
+                self._batch = None
+            try:
+                self._write(batch)
+            except Exception as err:  # pylint: disable=broad-except # noqa B902
+                batch.error = err
+            finally:
+                batch.written.set()
+        else:
+            batch.written.wait()
+
+        if batch.error:
+            raise batch.error
+        for update in updates:
+            if error := batch.failed.get((update.core, update.key)):
+                raise error
+
+    def _write(self, batch: _Batch):
+        commit_within = current_app.config.get('SOLR_COMMIT_WITHIN', 1000)
+        updates_by_core = {}
+        for update in batch.updates.values():
+            updates_by_core.setdefault(update.core, []).append(update)
+
+        for core, updates in updates_by_core.items():
+            payload_dict = construct_batch_payload_dict(core, updates, commit_within)
+            resp = post_to_solr_feeder(payload_dict)
+            if resp.status_code == 200:
+                continue
+            log_failure(payload_dict, resp, f'{core} in solr for {len(updates)} nrs')
+            if len(updates) == 1:
+                batch.failed[(core, updates[0].key)] = get_feeder_error(resp, f'{core} in solr for {updates[0].key}')
+                continue
+            # one bad document fails the whole update, send the nrs one by one so the others still get in
+            for update in updates:
+                payload_dict = construct_batch_payload_dict(core, [update], commit_within)
+                resp = post_to_solr_feeder(payload_dict)
+                if resp.status_code != 200:
+                    log_failure(payload_dict, resp, f'{core} in solr for {update.key}')
+                    batch.failed[(core, update.key)] = get_feeder_error(resp, f'{core} in solr for {update.key}')
+
+
+solr_batcher = SolrBatcher()
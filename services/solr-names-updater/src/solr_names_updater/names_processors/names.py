@@ -22,6 +22,7 @@ from solr_names_updater.names_processors import convert_to_solr_conformant_datet
 from solr_names_updater.names_processors import convert_to_solr_conformant_json  # noqa: I001
 from solr_names_updater.names_processors import find_name_by_name_states  # noqa: I001
 from solr_names_updater.names_processors import post_to_solr_feeder  # noqa: I001; noqa: I001
+from solr_names_updater.names_processors.batch import SolrUpdate  # noqa: I001
 
 # noqa: I003, I005
 
@@ -42,6 +43,23 @@ def process_delete_from_solr(state_change_msg: dict):  # pylint: disable=too-man
     send_to_solr_delete(nr)
 
 
+def get_solr_add_update(state_change_msg: dict) -> SolrUpdate:
+    """Return the names to add to solr for the NR, for the solr batcher."""
+    nr_num = state_change_msg.get('nrNum', None)
+    nr = RequestDAO.find_by_nr(nr_num)
+    name_states = [NameState.APPROVED.value, NameState.CONDITION.value]  # pylint: disable=no-member
+    names = find_name_by_name_states(nr.id, name_states)
+    jur = nr.xproJurisdiction if nr.xproJurisdiction else 'BC'
+    return SolrUpdate('names', nr.nrNum, adds=construct_solr_docs(nr, names, jur))
+
+
+def get_solr_delete_update(state_change_msg: dict) -> SolrUpdate:
+    """Return the names to delete from solr for the NR, for the solr batcher."""
+    nr_num = state_change_msg.get('nrNum', None)
+    nr = RequestDAO.find_by_nr(nr_num)
+    return SolrUpdate('names', nr.nrNum, deletes=get_nr_ids_to_delete_from_solr(nr))
+
+
 def send_to_solr_add(nr: RequestDAO):
     """Send json payload to add names to solr for NR."""
     # pylint: disable=no-member
@@ -80,26 +98,31 @@ def get_nr_ids_to_delete_from_solr(nr: RequestDAO):
     return keys
 
 
+def construct_solr_docs(nr: RequestDAO, names, jur):
+    """Construct the solr documents for the given names of a NR."""
+    start_date = convert_to_solr_conformant_datetime_str(nr.submittedDate)
+    return [
+        {
+            'id': f'{nr.nrNum}-{name.choice}',
+            'name': name.name,
+            'nr_num': nr.nrNum,
+            'submit_count': nr.submitCount,
+            'name_state_type_cd': name.state,
+            'start_date': start_date,
+            'jurisdiction': jur
+        }
+        for name in names
+    ]
+
+
 def construct_payload_dict(nr: RequestDAO, names, jur):
     """Construct json payload used to invoke solr feeder endpoint for adding names for a given NR."""
     payload_dict = {'solr_core': 'names'}
     payload_request = {}
 
-    for index, name in enumerate(names):
+    for index, doc in enumerate(construct_solr_docs(nr, names, jur)):
         key = f'add{index + 1}'
-        doc_id = f'{nr.nrNum}-{name.choice}'
-        start_date = convert_to_solr_conformant_datetime_str(nr.submittedDate)
-        payload_request[key] = {
-            'doc': {
-                'id': doc_id,
-                'name': name.name,
-                'nr_num': nr.nrNum,
-                'submit_count': nr.submitCount,
-                'name_state_type_cd': name.state,
-                'start_date': start_date,
-                'jurisdiction': jur
-            }
-        }
+        payload_request[key] = {'doc': doc}
 
     payload_request['commit'] = {}
     request_str = json.dumps(payload_request)
@@ -25,6 +25,7 @@ from solr_names_updater.names_processors import (  # noqa: I001
     find_name_by_name_states,  # noqa: I001
     post_to_solr_feeder  # noqa: I001
 )  # noqa: I001
+from solr_names_updater.names_processors.batch import SolrUpdate  # noqa: I001
 # noqa: I003, I005
 
 
@@ -44,6 +45,23 @@ def process_delete_from_solr(state_change_msg: dict):  # pylint: disable=too-man
     send_to_solr_delete(nr)
 
 
+def get_solr_add_update(state_change_msg: dict) -> SolrUpdate:
+    """Return the possible conflict to add to solr for the NR, for the solr batcher."""
+    nr_num = state_change_msg.get('nrNum')
+    nr = RequestDAO.find_by_nr(nr_num)
+    name_states = [NameState.APPROVED.value, NameState.CONDITION.value]  # pylint: disable=no-member
+    names = find_name_by_name_states(nr.id, name_states)
+    jur = nr.xproJurisdiction if nr.xproJurisdiction else 'BC'
+    return SolrUpdate('possible.conflicts', nr.nrNum, adds=[construct_solr_doc(nr, names[0], jur)])
+
+
+def get_solr_delete_update(state_change_msg: dict) -> SolrUpdate:
+    """Return the possible conflict to delete from solr for the NR, for the solr batcher."""
+    nr_num = state_change_msg.get('nrNum')
+    nr = RequestDAO.find_by_nr(nr_num)
+    return SolrUpdate('possible.conflicts', nr.nrNum, deletes=[nr.nrNum])
+
+
 def send_to_solr_add(nr: RequestDAO):
     """Send json payload to add possible conflict to solr for NR."""
     name_states = [NameState.APPROVED.value, NameState.CONDITION.value]  # pylint: disable=no-member
@@ -74,20 +92,24 @@ def send_to_solr_delete(nr: RequestDAO):
         structured_log(payload_dict, severity='ERROR', message=f'failed to delete possible conflict from solr for {nr.nrNum}, status code: {resp.status_code}, error reason: {resp.reason}, error details: {resp.text}')
 
 
+def construct_solr_doc(nr: RequestDAO, name, jur):
+    """Construct the possible conflict solr document for the given name of a NR."""
+    return {
+        'id': nr.nrNum,
+        'name': name.name,
+        'state_type_cd': name.state,
+        'source': nr.source,
+        'start_date': convert_to_solr_conformant_datetime_str(nr.submittedDate),
+        'jurisdiction': jur
+    }
+
+
 def construct_payload_dict(nr: RequestDAO, name, jur):
     """Construct json payload used to invoke solr feeder endpoint for adding possible conflicts for a given NR."""
     payload_dict = {'solr_core': 'possible.conflicts'}
     payload_request = {}
-    start_date = convert_to_solr_conformant_datetime_str(nr.submittedDate)
     payload_request['add'] = {
-        'doc': {
-            'id': nr.nrNum,
-            'name': name.name,
-            'state_type_cd': name.state,
-            'source': nr.source,
-            'start_date': start_date,
-            'jurisdiction': jur
-        }
+        'doc': construct_solr_doc(nr, name, jur)
     }
 
     payload_request['commit'] = {}
@@ -35,6 +35,9 @@ from solr_names_updater.names_processors.possible_conflicts import (  # noqa: I0
 from solr_names_updater.names_processors.possible_conflicts import (  # noqa: I001, I005
     process_delete_from_solr as process_possible_conflicts_delete,
 )
+from solr_names_updater.names_processors import names as names_processor  # noqa: I001
+from solr_names_updater.names_processors import possible_conflicts as possible_conflicts_processor  # noqa: I001
+from solr_names_updater.names_processors.batch import solr_batcher  # noqa: I001
 
 bp = Blueprint("worker", __name__)
 
@@ -129,9 +132,19 @@ def process_names_event_message(msg: dict, flask_app: Flask):
 
     if request_state_change:
         new_state = request_state_change.get('newState')
-        if new_state in ('APPROVED', 'CONDITIONAL'):
+        if new_state in ('APPROVED', 'CONDITIONAL') and solr_batcher.enabled:
+            solr_batcher.submit([
+                names_processor.get_solr_add_update(request_state_change),
+                possible_conflicts_processor.get_solr_add_update(request_state_change)
+            ])
+        elif new_state in ('APPROVED', 'CONDITIONAL'):
             process_names_add(request_state_change)
             process_possible_conflicts_add(request_state_change)
+        elif new_state in ('CANCELLED', 'RESET', 'CONSUMED', 'EXPIRED') and solr_batcher.enabled:
+            solr_batcher.submit([
+                names_processor.get_solr_delete_update(request_state_change),
+                possible_conflicts_processor.get_solr_delete_update(request_state_change)
+            ])
         elif new_state in ('CANCELLED', 'RESET', 'CONSUMED', 'EXPIRED'):
             process_names_delete(request_state_change)
             process_possible_conflicts_delete(request_state_change)
@@ -153,8 +166,12 @@ def process_names_event_message_firm(msg: dict, flask_app: Flask):
 
     if request_state_change:
         new_state = request_state_change.get('newState')
-        if new_state in ('APPROVED', 'CONDITIONAL'):
+        if new_state in ('APPROVED', 'CONDITIONAL') and solr_batcher.enabled:
+            solr_batcher.submit([names_processor.get_solr_add_update(request_state_change)])
+        elif new_state in ('APPROVED', 'CONDITIONAL'):
             process_names_add(request_state_change)
+        elif new_state in ('CANCELLED', 'RESET', 'CONSUMED', 'EXPIRED') and solr_batcher.enabled:
+            solr_batcher.submit([names_processor.get_solr_delete_update(request_state_change)])
         elif new_state in ('CANCELLED', 'RESET', 'CONSUMED', 'EXPIRED'):
             process_names_delete(request_state_change)
         else:
@@ -67,6 +67,8 @@ class MockResponse:
         """Mock Response __init__."""
         self.json_data = json_data
         self.status_code = status_code
+        self.reason = ''
+        self.text = ''
 
     def json(self):
         """Mock Response json."""
@@ -0,0 +1,164 @@
+# Copyright © 2026 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to ensure the solr updates of concurrent events are batched."""
+import json
+import threading
+import time
+from unittest import mock
+from unittest.mock import patch
+
+import pytest
+import requests
+from namex.utils import queue_util
+
+from solr_names_updater.names_processors.batch import SolrBatcher, SolrUpdate  # noqa: I001
+
+from . import MockResponse, create_nr, helper_create_cloud_event  # noqa: I003
+
+
+@pytest.fixture
+def batch_config(app):
+    """Turn batching on for the test."""
+    app.config.update({'SOLR_BATCH_WINDOW': 0.2, 'SOLR_BATCH_MAX_DOCS': 100, 'SOLR_COMMIT_WITHIN': 1000})
+    yield app.config
+    app.config['SOLR_BATCH_WINDOW'] = 0
+
+
+def submit_concurrently(app, batcher, *updates):
+    """Submit each update from its own thread, like concurrent pushes of the subscription do."""
+    errors = []
+
+    def submit(update):
+        with app.app_context():
+            try:
+                batcher.submit([update])
+            except Exception as err:  # pylint: disable=broad-except
+                errors.append(err)
+
+    threads = [threading.Thread(target=submit, args=(update,)) for update in updates]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def get_posted(mock_solr_feeder_api_post):
+    """Return the request posted to the solr feeder for each core."""
+    calls = mock_solr_feeder_api_post.call_args_list
+    return {call[1]['json']['solr_core']: call[1]['json']['request'] for call in calls}
+
+
+def test_concurrent_updates_are_merged(app, batch_config):
+    """Assert that the updates are sent as one request per core, the latest update of a nr winning."""
+    batcher = SolrBatcher()
+
+    with patch.object(requests, 'post', return_value=MockResponse({}, 200)) as mock_solr_feeder_api_post:
+        errors = submit_concurrently(
+            app,
+            batcher,
+            SolrUpdate('names', 'NR 1', adds=[{'id': 'NR 1-1', 'name': 'FIRST NAME'}]),
+            SolrUpdate('possible.conflicts', 'NR 1', adds=[{'id': 'NR 1', 'name': 'FIRST NAME'}]),
+            SolrUpdate('names', 'NR 2', deletes=['NR 2-1', 'NR 2-2', 'NR 2-3']),
+            SolrUpdate('names', 'NR 1', deletes=['NR 1-1', 'NR 1-2', 'NR 1-3']),
+        )
+
+    assert errors == []
+    assert mock_solr_feeder_api_post.call_count == 2
+    posted = get_posted(mock_solr_feeder_api_post)
+
+    names_request = posted['names']
+    assert 'FIRST NAME' not in names_request
+    assert names_request.count('"delete":') == 6
+    assert '"commit"' not in names_request
+    assert '"commitWithin": 1000' in names_request
+
+    conflicts_request = json.loads(posted['possible.conflicts'])
+    assert conflicts_request == {'add': {'doc': {'id': 'NR 1', 'name': 'FIRST NAME'}, 'commitWithin': 1000}}
+
+
+def test_delete_then_add_of_a_nr_keeps_the_deletes(app, batch_config):
+    """Assert that a reset then approval of a nr in one window still deletes the names that are not re-added."""
+    batcher = SolrBatcher()
+
+    with patch.object(requests, 'post', return_value=MockResponse({}, 200)) as mock_solr_feeder_api_post:
+        errors = submit_concurrently(
+            app,
+            batcher,
+            SolrUpdate('names', 'NR 1', deletes=['NR 1-1', 'NR 1-2', 'NR 1-3']),
+            SolrUpdate('names', 'NR 1', adds=[{'id': 'NR 1-2', 'name': 'SECOND NAME'}]),
+        )
+
+    assert errors == []
+    names_request = get_posted(mock_solr_feeder_api_post)['names']
+    assert names_request.count('"delete":') == 2
+    assert '"id": "NR 1-1"' in names_request
+    assert '"id": "NR 1-3"' in names_request
+    assert '"doc": {"id": "NR 1-2", "name": "SECOND NAME"}' in names_request
+
+
+def test_failed_batch_is_raised_to_every_event(app, batch_config):
+    """Assert that no event returns as written when its batch could not be sent."""
+    batcher = SolrBatcher()
+
+    with patch.object(requests, 'post', side_effect=requests.ConnectionError('solr feeder down')):
+        errors = submit_concurrently(
+            app,
+            batcher,
+            SolrUpdate('names', 'NR 1', deletes=['NR 1-1']),
+            SolrUpdate('names', 'NR 2', deletes=['NR 2-1']),
+        )
+
+    assert len(errors) == 2
+    assert all(isinstance(err, requests.ConnectionError) for err in errors)
+
+
+def test_nrs_failing_again_alone_are_raised(app, batch_config):
+    """Assert that after a failed update only the events of the nrs that fail on their own raise."""
+    batcher = SolrBatcher()
+
+    def post(url, json, **kwargs):
+        if 'NR 1-1' in json['request'] and 'NR 2-1' in json['request']:
+            return MockResponse({}, 500)
+        return MockResponse({}, 400 if 'NR 2-1' in json['request'] else 200)
+
+    with patch.object(requests, 'post', side_effect=post) as mock_solr_feeder_api_post:
+        errors = submit_concurrently(
+            app,
+            batcher,
+            SolrUpdate('names', 'NR 1', deletes=['NR 1-1']),
+            SolrUpdate('names', 'NR 2', deletes=['NR 2-1']),
+        )
+
+    assert mock_solr_feeder_api_post.call_count == 3
+    assert len(errors) == 1
+    assert isinstance(errors[0], requests.HTTPError)
+    assert 'NR 2' in str(errors[0])
+
+
+def test_worker_sends_batched_updates(client, app, db, session, batch_config):
+    """Assert that an approved nr is sent to both cores with commitWithin when batching is on."""
+    queue_util.send_name_request_state_msg = mock.Mock(return_value='True')
+    create_nr('NR 6724165', 'APPROVED', ['TEST NAME 1', 'TEST NAME 2'], ['APPROVED', 'REJECTED'])
+
+    with patch.object(requests, 'post', return_value=MockResponse({}, 200)) as mock_solr_feeder_api_post:
+        rv = client.post('/', json=helper_create_cloud_event('APPROVED', 'DRAFT'))
+
+    assert rv.status_code == 200
+    posted = get_posted(mock_solr_feeder_api_post)
+    assert set(posted) == {'names', 'possible.conflicts'}
+    assert 'TEST NAME 1' in posted['names']
+    assert 'TEST NAME 2' not in posted['names']
+    assert '"commitWithin": 1000' in posted['possible.conflicts']
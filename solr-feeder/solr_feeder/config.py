@@ -65,6 +65,30 @@ class Config():  # pylint: disable=too-few-public-methods;
     except:  # pylint: disable=bare-except; # noqa: B901, E722
         NAMEX_SOLR_TIMEOUT = 20
 
+    # Bulk feeds
+    try:
+        NAMEX_SOLR_COMMIT_WITHIN = int(os.getenv('NAMEX_SOLR_COMMIT_WITHIN', '5000'))
+    except:  # pylint: disable=bare-except; # noqa: B901, E722
+        NAMEX_SOLR_COMMIT_WITHIN = 5000
+    try:
+        NAMEX_SOLR_BULK_CHUNK_SIZE = int(os.getenv('NAMEX_SOLR_BULK_CHUNK_SIZE', '1000'))
+    except:  # pylint: disable=bare-except; # noqa: B901, E722
+        NAMEX_SOLR_BULK_CHUNK_SIZE = 1000
+    try:
+        BULK_FEED_WORKERS = int(os.getenv('BULK_FEED_WORKERS', '10'))
+    except:  # pylint: disable=bare-except; # noqa: B901, E722
+        BULK_FEED_WORKERS = 10
+    try:
+        # businesses per bulk search feed request, so a request finishes well within the gunicorn timeout
+        BULK_FEED_MAX_BUSINESSES = int(os.getenv('BULK_FEED_MAX_BUSINESSES', '500'))
+    except:  # pylint: disable=bare-except; # noqa: B901, E722
+        BULK_FEED_MAX_BUSINESSES = 500
+    try:
+        # connections kept open per host, at least BULK_FEED_WORKERS
+        HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '20'))
+    except:  # pylint: disable=bare-except; # noqa: B901, E722
+        HTTP_POOL_SIZE = 20
+
     KEYCLOAK_AUTH_TOKEN_URL = os.getenv('KEYCLOAK_AUTH_TOKEN_URL')
     KEYCLOAK_SERVICE_ACCOUNT_ID = os.getenv('NDS_SERVICE_ACCOUNT_CLIENT_ID')
     KEYCLOAK_SERVICE_ACCOUNT_SECRET = os.getenv('NDS_SERVICE_ACCOUNT_SECRET')
@@ -18,9 +18,9 @@ import flask
 from flask import Blueprint, current_app
 
 from solr_feeder import solr
-from solr_feeder.services import update_search_cores
+from solr_feeder.services import update_search_cores, update_search_cores_bulk
 
-from .utils import feeds_validate
+from .utils import bulk_feeds_validate, feeds_validate
 
 
 bp = Blueprint('FEEDER', __name__, url_prefix='/feeds')  # pylint: disable=invalid-name
@@ -68,3 +68,49 @@ def feed_solr():
         current_app.logger.debug('Namex core updated.')
 
     return {'message': 'Solr core updated'}, HTTPStatus.OK
+
+
+# Feed the specified core with many documents / businesses at once.
+@bp.post('/bulk')
+def feed_solr_bulk():
+    """Update the solr cores for namex and search in bulk.
+
+    Expected payload for updating a namex core:
+        {
+            solr_core: str,
+            docs: [<solr document>, ...],
+            deletes: [<solr document id>, ...]
+        }
+
+    Expected payload for updating registries search core:
+        {
+            solr_core: str,
+            businesses: [{identifier: str, legalType: str}, ...]
+        }
+    """
+    json_data = flask.request.get_json()
+    if error := bulk_feeds_validate(json_data):
+        current_app.logger.error(error)
+        return {'message': error}, HTTPStatus.BAD_REQUEST
+
+    solr_core = json_data['solr_core']
+
+    if solr_core == 'search':
+        # update registries search AND bor search
+        errors, error_response = update_search_cores_bulk(json_data['businesses'])
+        if error_response:
+            return {'message': error_response['message']}, error_response['status_code']
+        if errors:
+            return {'message': 'Some businesses failed to update', 'errors': errors}, HTTPStatus.INTERNAL_SERVER_ERROR
+
+        return {'message': 'Solr cores updated', 'count': len(json_data['businesses'])}, HTTPStatus.OK
+
+    current_app.logger.debug('Bulk updating namex core records...')
+    docs, deletes = json_data.get('docs', []), json_data.get('deletes', [])
+    error_response = solr.update_core_bulk(solr_core, docs, deletes)
+    if error_response:
+        current_app.logger.error(f'Error bulk updating namex core: {error_response}')
+        return {'message': error_response['message']}, error_response['status_code']
+
+    current_app.logger.debug('Namex core updated.')
+    return {'message': 'Solr core updated', 'count': len(docs) + len(deletes)}, HTTPStatus.OK
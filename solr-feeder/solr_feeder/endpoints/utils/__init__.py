@@ -13,4 +13,4 @@
 # limitations under the License.
 """Manages util methods / classes for endpoints."""
 from .endpoint import Endpoint
-from .validators import feeds_validate
+from .validators import bulk_feeds_validate, feeds_validate
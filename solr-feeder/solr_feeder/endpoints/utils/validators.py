@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Manages validators for endpoints."""
+from flask import current_app
 
 
 def feeds_validate(payload: dict) -> str:
@@ -33,3 +34,34 @@ def feeds_validate(payload: dict) -> str:
             return 'Required parameter "request" not defined'
 
     return None
+
+
+def bulk_feeds_validate(payload: dict) -> str:
+    """Validate the bulk feeder endpoint payload."""
+    solr_core = payload.get('solr_core')
+    if not solr_core:
+        return 'Required parameter "solr_core" not defined'
+
+    if solr_core not in ('names', 'possible.conflicts', 'search'):
+        return 'Parameter "solr_core" only has valid values of "names", "possible.conflicts" or "search"'
+
+    if solr_core == 'search':
+        businesses = payload.get('businesses')
+        if not businesses or not isinstance(businesses, list):
+            return 'Required parameter "businesses" not defined'
+        if len(businesses) > (max_businesses := current_app.config['BULK_FEED_MAX_BUSINESSES']):
+            return f'Parameter "businesses" has more than {max_businesses} businesses'
+        for business in businesses:
+            if not isinstance(business, dict) or not business.get('identifier') or not business.get('legalType'):
+                return 'Every business in "businesses" requires an "identifier" and a "legalType"'
+    else:
+        docs = payload.get('docs', [])
+        deletes = payload.get('deletes', [])
+        if not isinstance(docs, list) or not isinstance(deletes, list):
+            return 'Parameters "docs" and "deletes" must be lists'
+        if not docs and not deletes:
+            return 'Required parameter "docs" or "deletes" not defined'
+        if not all(isinstance(doc, dict) and doc.get('id') for doc in docs):
+            return 'Every document in "docs" requires an "id"'
+
+    return None
@@ -14,4 +14,4 @@
 """This module wraps the calls to external services used by the Solr Feeder."""
 from .auth import get_bearer_token
 from .colin import get_business_info, get_owners, get_parties
-from .search import update_search_cores
+from .search import update_search_cores, update_search_cores_bulk
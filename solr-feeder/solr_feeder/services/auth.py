@@ -11,19 +11,54 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""This manages all of the authentication and authorization service."""
-import logging
+"""This manages all of the authentication and authorization service.
+
+The service account token is kept per (token URL, client id) until shortly before it expires, and concurrent
+callers needing a new one wait for a single request to the identity server.
+"""
+import threading
+import time
 from http import HTTPStatus
 
 import requests
 from requests import exceptions
 from flask import current_app
 
+# Refresh this many seconds before the token expires (or half way through its lifetime if that is sooner).
+TOKEN_REFRESH_MARGIN = 30
+
+_tokens = {}
+_token_lock = threading.Lock()
+
 
 def get_bearer_token() -> tuple[str, dict]:
     """Get a valid Bearer token for the service to use."""
     token_url = current_app.config.get('KEYCLOAK_AUTH_TOKEN_URL')
     client_id = current_app.config.get('KEYCLOAK_SERVICE_ACCOUNT_ID')
+
+    if token := _get_cached_token(token_url, client_id):
+        return token, None
+
+    with _token_lock:
+        # Another thread may have refreshed the token while this one waited.
+        if token := _get_cached_token(token_url, client_id):
+            return token, None
+        return _request_token(token_url, client_id)
+
+
+def clear_token_cache():
+    """Forget the cached tokens."""
+    _tokens.clear()
+
+
+def _get_cached_token(token_url, client_id):
+    cached = _tokens.get((token_url, client_id))
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    return None
+
+
+def _request_token(token_url, client_id) -> tuple[str, dict]:
     client_secret = current_app.config.get('KEYCLOAK_SERVICE_ACCOUNT_SECRET')
     auth_api_timeout = current_app.config.get('AUTH_API_TIMEOUT')
 
@@ -39,7 +74,12 @@ def get_bearer_token() -> tuple[str, dict]:
         if res.status_code != HTTPStatus.OK:
             return None, {'message': res.json(), 'status_code': res.status_code}
 
-        return res.json().get('access_token'), None
+        token = res.json().get('access_token')
+        if token and (expires_in := res.json().get('expires_in')):
+            expires_in = int(expires_in)
+            refresh_at = time.monotonic() + expires_in - min(TOKEN_REFRESH_MARGIN, expires_in / 2)
+            _tokens[(token_url, client_id)] = (token, refresh_at)
+        return token, None
     except (exceptions.ConnectionError, exceptions.Timeout) as err:
         current_app.logger.error('AUTH api connection failure: %s', err)
         return None, {'message': 'AUTH connection failure', 'status_code': HTTPStatus.GATEWAY_TIMEOUT}
@@ -14,10 +14,11 @@
 """Manages colin-api interactions."""
 from http import HTTPStatus
 
-import requests
 from requests import exceptions
 from flask import current_app
 
+from .http import get_session
+
 
 FIRM_LEGAL_TYPES = ['SP', 'GP', 'LP', 'XP', 'LL', 'XL', 'MF']
 
@@ -55,9 +56,9 @@ def _get_colin_api_resp(path: str, token: str, accepted_codes: list[HTTPStatus])
     try:
         headers = {'Authorization': 'Bearer ' + token}
 
-        resp = requests.get(f'{current_app.config["COLIN_API_URL"]}/{path}',
-                            headers=headers,
-                            timeout=current_app.config['COLIN_API_TIMEOUT'])
+        resp = get_session().get(f'{current_app.config["COLIN_API_URL"]}/{path}',
+                                 headers=headers,
+                                 timeout=current_app.config['COLIN_API_TIMEOUT'])
 
         if resp.status_code not in accepted_codes:
             current_app.logger.debug('COLIN service unexpected response code %s %s %s', resp.status_code, path, resp.json())
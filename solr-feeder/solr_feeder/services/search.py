@@ -13,21 +13,23 @@
 # limitations under the License.
 """Manages search-api interactions."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 
-import requests
 from requests import exceptions
 from flask import current_app
 
 from solr_feeder.services import get_bearer_token, get_business_info, get_owners, get_parties
 
+from .http import get_session
+
 
 def _update_solr(url: str, payload: dict[str, str], timeout: int, token: str):
     """Update solr core."""
     try:
         headers = {'Authorization': 'Bearer ' + token}
 
-        res = requests.put(url=url, headers=headers, json=payload, timeout=timeout)
+        res = get_session().put(url=url, headers=headers, json=payload, timeout=timeout)
         if res.status_code not in [HTTPStatus.OK, HTTPStatus.ACCEPTED]:
             return {'message': res.json(), 'status_code': res.status_code}
 
@@ -49,6 +51,44 @@ def update_search_cores(identifier: str, legal_type: str):
     if error:
         return error
 
+    return _update_search_cores(identifier, legal_type, token)
+
+
+def update_search_cores_bulk(businesses: list[dict]) -> tuple[list[dict], dict]:
+    """Update registries search AND bor search for many businesses.
+
+    The businesses are fetched from COLIN and sent to the search apis concurrently, BULK_FEED_WORKERS at a time.
+    Returns the errors of the businesses that failed to update, or the error that stopped the whole feed.
+    """
+    current_app.logger.debug('Updating registries search and bor core records for %s businesses...', len(businesses))
+    # get token (the cached token is shared by the workers, and refreshed if it expires during the feed)
+    _, error = get_bearer_token()
+    if error:
+        return None, error
+
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+
+    def update(business: dict):
+        with app.app_context():
+            token, error = get_bearer_token()
+            if not error:
+                error = _update_search_cores(business['identifier'], business['legalType'], token)
+            return business['identifier'], error
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=current_app.config['BULK_FEED_WORKERS']) as executor:
+        for identifier, error in executor.map(update, businesses):
+            if error:
+                # errors are either an error dict or a (response body, status) tuple
+                message = error[0]['message'] if isinstance(error, tuple) else error['message']
+                errors.append({'identifier': identifier, 'message': message})
+
+    current_app.logger.debug('Registries search and bor cores updated, %s errors.', len(errors))
+    return errors, None
+
+
+def _update_search_cores(identifier: str, legal_type: str, token: str):
+    """Update registries search AND bor search with the given token."""
     # get business data
     business, error = get_business_info(legal_type, identifier, token)
     if error:
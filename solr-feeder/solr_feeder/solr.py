@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Manages Namex solr update."""
+import json
 import os
 
-import requests
 from flask import current_app
 
+from solr_feeder.services.http import get_session
 
-__all__ = ['update_core']
+
+__all__ = ['update_core', 'update_core_bulk']
 
 
 _SOLR_INSTANCE = os.getenv('SOLR_FEEDER_SOLR_INSTANCE', 'http://localhost:8393/solr')
@@ -29,10 +31,52 @@ def update_core(core_name: str, json_string: str):
     """Update the core with the given data."""
     current_app.logger.debug('json Solr command: %s', json_string)
 
-    response = requests.post(_SOLR_URL.format(core_name),
-                             data=json_string,
-                             timeout=current_app.config['NAMEX_SOLR_TIMEOUT'])
+    response = get_session().post(_SOLR_URL.format(core_name),
+                                  data=json_string,
+                                  timeout=current_app.config['NAMEX_SOLR_TIMEOUT'])
+
+    return _get_error_response(core_name, response)
+
+
+def update_core_bulk(core_name: str, docs: list[dict], delete_ids: list[str]):
+    """Add the documents to and delete the ids from the core.
+
+    The documents are sent in chunks of NAMEX_SOLR_BULK_CHUNK_SIZE, each one streamed to solr as it is serialized,
+    and solr commits them within NAMEX_SOLR_COMMIT_WITHIN milliseconds rather than on every request.
+    """
+    chunk_size = current_app.config['NAMEX_SOLR_BULK_CHUNK_SIZE']
+    params = {'commitWithin': current_app.config['NAMEX_SOLR_COMMIT_WITHIN']}
+    current_app.logger.debug('Bulk updating %s core: %s adds, %s deletes', core_name, len(docs), len(delete_ids))
+
+    for start in range(0, len(delete_ids), chunk_size):
+        response = get_session().post(_SOLR_URL.format(core_name),
+                                      params=params,
+                                      json={'delete': delete_ids[start:start + chunk_size]},
+                                      timeout=current_app.config['NAMEX_SOLR_TIMEOUT'])
+        if error_response := _get_error_response(core_name, response):
+            return error_response
+
+    for start in range(0, len(docs), chunk_size):
+        # a json array of documents is an add of each of them
+        response = get_session().post(_SOLR_URL.format(core_name),
+                                      params=params,
+                                      data=_stream_docs(docs[start:start + chunk_size]),
+                                      headers={'Content-Type': 'application/json'},
+                                      timeout=current_app.config['NAMEX_SOLR_TIMEOUT'])
+        if error_response := _get_error_response(core_name, response):
+            return error_response
+
+    return None
+
+
+def _stream_docs(docs: list[dict]):
+    yield b'['
+    for index, doc in enumerate(docs):
+        yield (',' if index else '').encode('utf-8') + json.dumps(doc).encode('utf-8')
+    yield b']'
+
 
+def _get_error_response(core_name: str, response):
     # By the way, if your request is mangled, Solr will sometimes happily return a 200 with a responseHeader['status']
     # value of 0 (meaning all is good).
     if response.status_code != 200:
@@ -40,6 +40,9 @@ class Config(object):
     else:
         SQLALCHEMY_DATABASE_URI = f'postgresql://{DATABASE_USER}:{DATABASE_PASSWORD}@{DATABASE_HOST}:{int(DATABASE_PORT)}/{DATABASE_NAME}'
 
+    # Seconds before the in-memory synonym index checks the synonym table for changes
+    SYNONYMS_INDEX_REFRESH_INTERVAL = int(os.getenv('SYNONYMS_INDEX_REFRESH_INTERVAL', '300'))
+
     DEBUG = False
     TESTING = False
 
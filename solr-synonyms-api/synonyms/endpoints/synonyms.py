@@ -1,3 +1,4 @@
+import hashlib
 import json
 import jsonpickle
 
@@ -10,6 +11,7 @@ from flask_jwt_oidc import AuthError
 from urllib.parse import unquote_plus
 
 from synonyms.services.synonyms.synonym import SynonymService
+from synonyms.services.synonyms.index import synonym_index
 from synonyms.models import synonym
 
 from synonyms.services.synonyms import DesignationPositionCodes
@@ -51,6 +53,31 @@ response_string = api.model('String', {
     'data': fields.String
 })
 
+synonym_list = api.model('SynonymLists', {
+    'synonyms_text': fields.String,
+    'stems_text': fields.String
+})
+
+word_lookup = api.model('WordLookup', {
+    'key': fields.String,
+    'synonyms': fields.List(fields.String)
+})
+
+# Define our response object
+response_word_lookups = api.model('WordLookupList', {
+    'data': fields.List(fields.Nested(word_lookup))
+})
+
+words_request = api.model('WordsRequest', {
+    'words': fields.List(fields.String)
+})
+
+# Define our response object
+response_synonym_lists = api.model('SynonymListsVersioned', {
+    'data': fields.List(fields.Nested(synonym_list)),
+    'version': fields.String
+})
+
 
 @api.route('/synonyms', strict_slashes=False, methods=['GET'])
 class _WordSynonyms(Resource):
@@ -140,6 +167,37 @@ class _AllSubstitutionsSynonyms(Resource):
         }
 
 
+@api.route('/batch', strict_slashes=False, methods=['POST'])
+class _WordsBatch(Resource):
+    @staticmethod
+    @cors.crossdomain(origin='*')
+    # @jwt.requires_auth
+    @api.expect(words_request)
+    @api.response(200, 'SynonymsApi', response_word_lookups)
+    @marshal_with(response_word_lookups)
+    def post():
+        """Return the /synonyms results of every word, in one round trip."""
+        json_data = request.get_json(silent=True) or {}
+        words = [word for word in json_data.get('words', []) if word]
+
+        if not validate_request(json_data):
+            return
+
+        service = SynonymService()
+        results = service.get_words_lookups(words)
+
+        output = []
+        for key in results:
+            output.append({
+                'key': key,
+                **results[key]
+            })
+
+        return {
+            'data': output
+        }
+
+
 @api.route('/all-categories-synonyms', strict_slashes=False, methods=['GET'])
 class _AllCategoriesSynonyms(Resource):
     @staticmethod
@@ -760,6 +818,30 @@ class _RegexPrefixes(Resource):
             'data': result
         }
 
+@api.route('/synonym-lists', strict_slashes=False, methods=['GET'])
+class _SynonymLists(Resource):
+    @staticmethod
+    @cors.crossdomain(origin='*')
+    # @jwt.requires_auth
+    # @api.expect()
+    @api.response(200, 'SynonymsApi', response_synonym_lists)
+    @marshal_with(response_synonym_lists)
+    def get():
+        """Return every synonyms_text / stems_text pair so callers can answer /<col>/<term> lookups locally.
+
+        The version is a digest of the lists, callers only need to rebuild their lookup tables when it changes.
+        """
+        results = synonym.Synonym.find_all_lists()
+
+        data = [{'synonyms_text': row.synonyms_text, 'stems_text': row.stems_text} for row in results]
+        version = hashlib.sha1(json.dumps(data).encode('utf-8')).hexdigest()
+
+        return {
+            'data': data,
+            'version': version
+        }
+
+
 @api.route('/<col>/<term>', strict_slashes=False, methods=['GET'])
 class _Synonyms(Resource):
     @staticmethod
@@ -767,7 +849,7 @@ class _Synonyms(Resource):
         term = term.strip().lower()
         current_app.logger.debug('Doing {} search for "{}"'.format(col, term))
 
-        results = synonym.Synonym.find(term, col)
+        results = synonym_index.get().find_by_term(col, term)
 
         if not results:
             return {'message': 'Term \'{}\' not found in any synonyms list'.format(term)}, 404
@@ -57,6 +57,21 @@ class Synonym(db.Model):
 
         return synonyms_list
 
+    '''
+    Find the synonyms_text and stems_text of every synonym row, in id order.
+    '''
+    @classmethod
+    def find_all_lists(cls):
+        return cls.query.with_entities(cls.synonyms_text, cls.stems_text).order_by(cls.id).all()
+
+    '''
+    Find the id, category, synonyms_text and stems_text of every synonym row, in id order.
+    '''
+    @classmethod
+    def find_all_rows(cls):
+        return cls.query.with_entities(cls.id, cls.category, cls.synonyms_text, cls.stems_text) \
+            .order_by(cls.id).all()
+
     '''
     Query the model collection using an array of filters
     @:param filters An array of query filters eg. 
@@ -0,0 +1,118 @@
+"""In-memory inverted index over the synonym table.
+
+Looking up a word used to run one or two queries with `lower(col) ~ '\\yword\\y'` regexes over synonyms_text and
+stems_text, which no index can serve. The rows are now loaded once and indexed by the words in each column, so
+SynonymService.get_synonyms / get_substitutions and the /<col>/<term> lookup are dict lookups.
+
+The rows are reloaded every SYNONYMS_INDEX_REFRESH_INTERVAL seconds; a new index is only built when their content
+changed, and it replaces the old one in a single assignment so readers always see a complete index.
+"""
+import hashlib
+import re
+import threading
+import time
+from collections import namedtuple
+
+from flask import current_app
+
+from synonyms.models.synonym import Synonym
+
+DEFAULT_REFRESH_INTERVAL = 300
+
+SYNONYM_COLUMNS = ('synonyms_text', 'stems_text')
+
+WORD_RX = re.compile(r'\w+')
+SUB_CATEGORY_RX = re.compile(r'\bsub\b')
+STOP_CATEGORY_RX = re.compile(r'\bstop\b')
+
+IndexedSynonym = namedtuple('IndexedSynonym', ['id', 'category', 'synonyms_text', 'stems_text', 'is_sub', 'is_stop'])
+
+
+class SynonymIndex:
+    """Lookup tables built from one snapshot of the synonym rows, never modified once built."""
+
+    def __init__(self, rows, version=None):
+        self.rows = tuple(self._index_row(row) for row in rows)
+        self.version = version or self.get_version(rows)
+        # word in a column -> rows with that word, the same rows `lower(col) ~ '\yword\y'` finds
+        self._words = {col: {} for col in SYNONYM_COLUMNS}
+        # comma separated entry of a column -> rows with that entry, see Synonym.find
+        self._terms = {col: {} for col in SYNONYM_COLUMNS}
+
+        for row in self.rows:
+            for col in SYNONYM_COLUMNS:
+                text = getattr(row, col).lower()
+                for word in dict.fromkeys(WORD_RX.findall(text)):
+                    self._words[col].setdefault(word, []).append(row)
+                for term in dict.fromkeys(term.strip() for term in text.split(',')):
+                    self._terms[col].setdefault(term, []).append(row)
+
+    @staticmethod
+    def get_version(rows):
+        digest = hashlib.sha1()
+        for row in rows:
+            digest.update(repr(tuple(row)).encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _index_row(row):
+        category = row.category.lower() if row.category is not None else None
+        return IndexedSynonym(
+            id=row.id,
+            category=row.category,
+            synonyms_text=row.synonyms_text,
+            stems_text=row.stems_text,
+            is_sub=bool(category and SUB_CATEGORY_RX.search(category)),
+            is_stop=bool(category and STOP_CATEGORY_RX.search(category)),
+        )
+
+    def find_by_word(self, col, word):
+        """Rows whose column has the word in it, matching it like `lower(col) ~ '\\yword\\y'` does."""
+        if WORD_RX.fullmatch(word):
+            return self._words[col].get(word, [])
+
+        # Words with punctuation in them are still used as a regex, like the query did
+        try:
+            word_rx = re.compile(r'\b{}\b'.format(word))
+        except re.error:
+            return []
+        return [row for row in self.rows if word_rx.search(getattr(row, col).lower())]
+
+    def find_by_term(self, col, term):
+        """Rows that have the term as one of the comma separated entries of the column."""
+        col = col if col == 'synonyms_text' else 'stems_text'
+        return self._terms[col].get(term.lower(), [])
+
+
+class SynonymIndexCache:
+    """Holds the current SynonymIndex, reloading the rows once the refresh interval has passed."""
+
+    def __init__(self, load_rows):
+        self._load_rows = load_rows
+        self._index = None
+        self._expires_at = 0
+        self._lock = threading.Lock()
+
+    def get(self):
+        if self._index is None or time.monotonic() >= self._expires_at:
+            with self._lock:
+                if self._index is None or time.monotonic() >= self._expires_at:
+                    self._refresh()
+        return self._index
+
+    def invalidate(self):
+        """Reload the rows on the next lookup, e.g. after the synonym table was changed."""
+        self._expires_at = 0
+
+    def _refresh(self):
+        rows = self._load_rows()
+        version = SynonymIndex.get_version(rows)
+        if self._index is None or self._index.version != version:
+            self._index = SynonymIndex(rows, version)
+            current_app.logger.debug('Built synonym index {} from {} rows'.format(version, len(rows)))
+
+        interval = current_app.config.get('SYNONYMS_INDEX_REFRESH_INTERVAL', DEFAULT_REFRESH_INTERVAL)
+        self._expires_at = time.monotonic() + interval
+
+
+synonym_index = SynonymIndexCache(Synonym.find_all_rows)
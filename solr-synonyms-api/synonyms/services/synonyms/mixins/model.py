@@ -37,3 +37,14 @@ class SynonymModelMixin(SynonymServiceMixin):
         # Return {'shop': ['beauty', 'store', 'sales', 'reatail'],
         #         'coffee': ['non-alcoholic-beverages','restaurant']} based on list_d
         return dict_subs
+
+    def get_words_lookups(self, words):
+        dict_lookups = {}
+
+        for word in words:
+            dict_lookups[word] = {
+                'synonyms': self.get_synonyms(word)
+            }
+
+        # Return {'mountain': {'synonyms': [...]}} based on words, answering /synonyms for all of them at once
+        return dict_lookups
@@ -1,5 +1,4 @@
 import re
-import string
 from sqlalchemy import func
 
 from synonyms.models.synonym import Synonym
@@ -10,6 +9,10 @@ from pyinflect import getInflection
 
 from .mixins.designation import SynonymDesignationMixin
 from .mixins.model import SynonymModelMixin
+from .index import synonym_index
+from .transform import EXTRA_SPACES_RX, NUMBERS_LOT_RX, PUNCTUATION_RX, REPEATED_STRINGS_RX, \
+    TOGETHER_ONE_LETTER_RX, get_prefixes_regex, get_remove_designations_regex, get_separated_ordinals_regex, \
+    get_transform_pipeline
 
 from synonyms.utils.service_utils import get_entity_type_code, get_designation_position_code
 
@@ -68,10 +71,32 @@ class SynonymService(SynonymDesignationMixin, SynonymModelMixin):
 
         return model.find_by_criteria(criteria)
 
+    def find_indexed_word_synonyms(self, word, include, fields, stem=False):
+        """Same as find_word_synonyms for a word, answered from the synonym index.
+
+        include is the category filter for an indexed row, fields the columns to return for each row found.
+        """
+        index = synonym_index.get()
+        word = word.lower()
+        if stem:
+            rows = index.find_by_word('stems_text', porter.stem(word).replace(" ", ""))
+        else:
+            rows = index.find_by_word('synonyms_text', word.replace(" ", ""))
+
+        return [tuple(getattr(row, field) for field in fields) for row in rows if include(row)]
+
     def get_model(self):
         return self._model
 
     def get_synonyms(self, word=None, category=False):
+        if word:
+            # The category argument only picks the columns, see find_word_synonyms
+            fields = ['synonyms_text'] if category else ['stems_text', 'synonyms_text']
+            results = self.find_indexed_word_synonyms(word, self._is_synonym, fields)
+            if not results:
+                results = self.find_indexed_word_synonyms(word, self._is_synonym, fields, stem=True)
+            return list(map(str.strip, (list(filter(None, self.flatten_synonyms_text(results))))))
+
         model = self.get_model()
 
         filters = [
@@ -89,13 +114,16 @@ class SynonymService(SynonymDesignationMixin, SynonymModelMixin):
         return flattened
 
     def get_substitutions(self, word=None):
-        model = self.get_model()
+        if word:
+            results = self.find_indexed_word_synonyms(word, self._is_substitution, ['stems_text', 'synonyms_text'])
+        else:
+            model = self.get_model()
 
-        filters = [
-            func.lower(model.category).op('~')(r'\y{}\y'.format('sub'))
-        ]
+            filters = [
+                func.lower(model.category).op('~')(r'\y{}\y'.format('sub'))
+            ]
 
-        results = self.find_word_synonyms(word, filters)
+            results = self.find_word_synonyms(word, filters)
         flattened = list(map(str.strip, (list(filter(None, self.flatten_synonyms_text(results))))))
         if not flattened:
             # Add ing to the word if applicable
@@ -103,6 +131,15 @@ class SynonymService(SynonymDesignationMixin, SynonymModelMixin):
 
         return flattened
 
+    @staticmethod
+    def _is_synonym(row):
+        # Rows without a category never matched the category filters of get_synonyms
+        return row.category is not None and not row.is_sub and not row.is_stop
+
+    @staticmethod
+    def _is_substitution(row):
+        return row.is_sub
+
     def get_stop_words(self, word=None):
         model = self.get_model()
 
@@ -211,47 +248,18 @@ class SynonymService(SynonymDesignationMixin, SynonymModelMixin):
     '''
 
     def regex_transform(self, text, designation_all, prefix_list, number_list, exceptions_ws):
-        stand_alone_list = self.get_standalone()
-        stand_alone_list.sort(key=len, reverse=True)
-
-        designation_all_regex = '|'.join(designation_all)
-        # stand_alone_regex = '$|'.join(stand_alone_list) + '$'
-        # prefixes = '|'.join(prefix_list)
-
-        ordinal_suffixes = 'ST|[RN]D|TH'
-        internet_domains = '.COM|.ORG|.NET|.EDU'
-        # stand_alone_words = 'HOLDINGS$|BC$|VENTURES$|SOLUTION$|ENTERPRISE$|ENTERPRISES$|INDUSTRIES$'
-
-        text = self.regex_remove_designations(text, internet_domains, designation_all_regex)
-        # regex_prefixes is called in namex api before remove french
-        # text = self.regex_prefixes(text, prefixes)
-        text = self.regex_numbers_lot(text)
-        text = self.regex_repeated_strings(text)
-        text = self.regex_separated_ordinals(text, ordinal_suffixes)
-        # text = self.regex_keep_together_abv(text, exceptions_ws)
-        text = self.regex_punctuation(text)
-        text = self.regex_together_one_letter(text)
-        # text = self.regex_numbers_standalone(text, ordinal_suffixes, numbers, stand_alone_regex)
-        text = self.regex_remove_extra_spaces(text)
-
-        return text
+        # The stand-alone words (and the steps using prefixes, numbers and exceptions_ws) are not part of the
+        # transform anymore, see the commented out steps in the rules above.
+        return get_transform_pipeline(tuple(designation_all)).transform(text)
 
     @classmethod
     def regex_remove_designations(cls, text, internet_domains, designation_all_regex):
-        text = re.sub(r'\b({0})\b|(?<=\d),(?=\d)|(?<!\w)({1})(?![A-Za-z0-9_.])(?=.*$)'.format(
-            internet_domains,
-            designation_all_regex),
-            '',
-            text,
-            0,
-            re.IGNORECASE)
+        text = get_remove_designations_regex(internet_domains, designation_all_regex).sub('', text)
         return " ".join(text.split())
 
     @classmethod
-    def regex_prefixes(cls, text, prefixes, exception_designation):
-        exception_designation_rx = '|'.join(map(re.escape, exception_designation))
-        ws_generic_rx = r'(?<![a-zA-Z0-9_.])({0})\s*([ &/.-])\s*([A-Za-z]+)'.format(prefixes)
-        designation_rx = re.compile(r'({0})|{1}'.format(exception_designation_rx, ws_generic_rx), re.I)
+    def regex_prefixes(cls, text, prefixes, exception_designation=None):
+        designation_rx = get_prefixes_regex(prefixes, tuple(exception_designation or []))
 
         text = designation_rx.sub(lambda x: x.group(1) or (x.group(2) + x.group(4)), text)
 
@@ -259,29 +267,17 @@ class SynonymService(SynonymDesignationMixin, SynonymModelMixin):
 
     @classmethod
     def regex_numbers_lot(cls, text):
-        text = re.sub(r'(?<=[a-zA-Z\.])\'[Ss]|\(.*\d+.*\)|\(?No.?\s*\d+\)?|\(?lot.?\s*\d+[-]?\d*\)?',
-                      '',
-                      text,
-                      0,
-                      re.IGNORECASE)
+        text = NUMBERS_LOT_RX.sub('', text)
         return " ".join(text.split())
 
     @classmethod
     def regex_repeated_strings(cls, text):
-        text = re.sub(r'\b(\w{2,})(\b\W+\b\1\b)*',
-                      r'\1',
-                      text,
-                      0,
-                      re.IGNORECASE)
+        text = REPEATED_STRINGS_RX.sub(r'\1', text)
         return " ".join(text.split())
 
     @classmethod
     def regex_separated_ordinals(cls, text, ordinal_suffixes):
-        text = re.sub(r'\b(\d+({}))(\w+)\b'.format(ordinal_suffixes),
-                      r'\1 \3',
-                      text,
-                      0,
-                      re.IGNORECASE)
+        text = get_separated_ordinals_regex(ordinal_suffixes).sub(r'\1 \3', text)
         return " ".join(text.split())
 
     @classmethod
@@ -296,17 +292,13 @@ class SynonymService(SynonymDesignationMixin, SynonymModelMixin):
 
     @classmethod
     def regex_punctuation(cls, text):
-        text = re.sub(rf"[{string.punctuation}]", " ", text)
+        text = PUNCTUATION_RX.sub(" ", text)
 
         return " ".join(text.split())
 
     @classmethod
     def regex_together_one_letter(cls, text):
-        text = re.sub(r'(\b[A-Za-z]{1,2}\b)\s+(?=[a-zA-Z]{1,2}\b)|\s+$',
-                      r'\1',
-                      text,
-                      0,
-                      re.IGNORECASE)
+        text = TOGETHER_ONE_LETTER_RX.sub(r'\1', text)
         return " ".join(text.split())
 
     @classmethod
@@ -331,11 +323,7 @@ class SynonymService(SynonymDesignationMixin, SynonymModelMixin):
 
     @classmethod
     def regex_remove_extra_spaces(cls, text):
-        text = re.sub(r'\s+',
-                      ' ',
-                      text,
-                      0,
-                      re.IGNORECASE)
+        text = EXTRA_SPACES_RX.sub(' ', text)
         return " ".join(text.split())
 
     def exception_regex(self, text):
@@ -0,0 +1,68 @@
+"""Compiled regex pipeline behind SynonymService.regex_transform and regex_prefixes.
+
+The fixed patterns are compiled at import. The patterns built from word lists (designations, prefixes) are compiled
+once per distinct list and cached, so transforming a name only runs the compiled regexes.
+"""
+import re
+import string
+from functools import lru_cache
+
+ORDINAL_SUFFIXES = 'ST|[RN]D|TH'
+INTERNET_DOMAINS = '.COM|.ORG|.NET|.EDU'
+
+NUMBERS_LOT_RX = re.compile(r'(?<=[a-zA-Z\.])\'[Ss]|\(.*\d+.*\)|\(?No.?\s*\d+\)?|\(?lot.?\s*\d+[-]?\d*\)?',
+                            re.IGNORECASE)
+REPEATED_STRINGS_RX = re.compile(r'\b(\w{2,})(\b\W+\b\1\b)*', re.IGNORECASE)
+PUNCTUATION_RX = re.compile(rf"[{string.punctuation}]")
+TOGETHER_ONE_LETTER_RX = re.compile(r'(\b[A-Za-z]{1,2}\b)\s+(?=[a-zA-Z]{1,2}\b)|\s+$', re.IGNORECASE)
+EXTRA_SPACES_RX = re.compile(r'\s+', re.IGNORECASE)
+
+
+def normalize_spaces(text):
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=32)
+def get_remove_designations_regex(internet_domains, designation_all_regex):
+    return re.compile(r'\b({0})\b|(?<=\d),(?=\d)|(?<!\w)({1})(?![A-Za-z0-9_.])(?=.*$)'.format(
+        internet_domains,
+        designation_all_regex),
+        re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def get_prefixes_regex(prefixes, exception_designation):
+    exception_designation_rx = '|'.join(map(re.escape, exception_designation))
+    ws_generic_rx = r'(?<![a-zA-Z0-9_.])({0})\s*([ &/.-])\s*([A-Za-z]+)'.format(prefixes)
+    return re.compile(r'({0})|{1}'.format(exception_designation_rx, ws_generic_rx), re.I)
+
+
+@lru_cache(maxsize=32)
+def get_separated_ordinals_regex(ordinal_suffixes):
+    return re.compile(r'\b(\d+({}))(\w+)\b'.format(ordinal_suffixes), re.IGNORECASE)
+
+
+@lru_cache(maxsize=16)
+def get_transform_pipeline(designation_all):
+    """Return the pipeline for a designation list, given as a tuple so it can key the cache."""
+    return TransformPipeline(designation_all)
+
+
+class TransformPipeline:
+    """The regex_transform stages, with the designation pattern compiled for one designation list."""
+
+    def __init__(self, designation_all):
+        self.remove_designations_rx = get_remove_designations_regex(INTERNET_DOMAINS, '|'.join(designation_all))
+        self.separated_ordinals_rx = get_separated_ordinals_regex(ORDINAL_SUFFIXES)
+
+    def transform(self, text):
+        text = normalize_spaces(self.remove_designations_rx.sub('', text))
+        # regex_prefixes is called in namex api before remove french
+        text = normalize_spaces(NUMBERS_LOT_RX.sub('', text))
+        text = normalize_spaces(REPEATED_STRINGS_RX.sub(r'\1', text))
+        text = normalize_spaces(self.separated_ordinals_rx.sub(r'\1 \3', text))
+        text = normalize_spaces(PUNCTUATION_RX.sub(' ', text))
+        text = normalize_spaces(TOGETHER_ONE_LETTER_RX.sub(r'\1', text))
+        text = normalize_spaces(EXTRA_SPACES_RX.sub(' ', text))
+
+        return text
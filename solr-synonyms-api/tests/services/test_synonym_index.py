@@ -0,0 +1,53 @@
+from collections import namedtuple
+
+import pytest
+
+from synonyms.services.synonyms.index import SynonymIndex
+
+Row = namedtuple('Row', ['id', 'category', 'synonyms_text', 'stems_text'])
+
+rows = [
+    Row(1, 'sub', 'mount, mountain, mt, mtn', 'mount, mountain, mt, mtn'),
+    Row(2, 'retail', 'shop, store, boutique', 'shop, store, boutiqu'),
+    Row(3, 'stop words', 'the, of, and', 'the, of, and'),
+    Row(4, 'beverages', 'non-alcoholic, soft drink, shop', 'non-alcohol, soft drink, shop'),
+    Row(5, None, 'orphan, shop', 'orphan, shop'),
+]
+
+index = SynonymIndex(rows)
+
+
+@pytest.mark.parametrize("col, word, expected_ids",
+                         [
+                             ('synonyms_text', 'shop', [2, 4, 5]),
+                             ('synonyms_text', 'mtn', [1]),
+                             ('synonyms_text', 'drink', [4]),
+                             ('synonyms_text', 'alcoholic', [4]),
+                             ('synonyms_text', 'non-alcoholic', [4]),
+                             ('synonyms_text', 'moun', []),
+                             ('stems_text', 'boutiqu', [2]),
+                             ('stems_text', 'boutique', []),
+                         ])
+def test_find_by_word(col, word, expected_ids):
+    assert [row.id for row in index.find_by_word(col, word)] == expected_ids
+
+
+@pytest.mark.parametrize("col, term, expected_ids",
+                         [
+                             ('synonyms_text', 'soft drink', [4]),
+                             ('synonyms_text', 'drink', []),
+                             ('synonyms_text', 'Store', [2]),
+                             ('stems_text', 'non-alcohol', [4]),
+                         ])
+def test_find_by_term(col, term, expected_ids):
+    assert [row.id for row in index.find_by_term(col, term)] == expected_ids
+
+
+def test_categories():
+    assert [row.id for row in index.rows if row.is_sub] == [1]
+    assert [row.id for row in index.rows if row.is_stop] == [3]
+
+
+def test_version_changes_with_rows():
+    assert SynonymIndex(list(rows)).version == index.version
+    assert SynonymIndex(rows[:-1]).version != index.version